@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""Benchmark chunked, compressed files against JSON and CSV.
+
+Reports the file size, the save time, the time to load every shape and
+the time to look up one shape by id.
+
+Usage: ./benchmarks/bench_chunked.py [number_of_shapes]
+"""
+import os
+from common import arg, make_rectangles, timed, workdir
+from models.rectangle import Rectangle
+
+
+def by_id(shapes, shape_id):
+    """Return the first shape with a given id from an iterable."""
+    return next(s for s in shapes if s.id == shape_id)
+
+
+def main(n):
+    """Print the size and timings of each format for n Rectangles."""
+    rects = make_rectangles(n)
+    target = n * 3 // 4
+    print("n={}".format(n))
+    print("{:<12}{:>12}{:>9}{:>9}{:>9}".format("format", "bytes", "save",
+                                              "load", "find"))
+    formats = [("json", "Rectangle.json", Rectangle.save_to_file, {},
+                Rectangle.load_from_file),
+               ("csv", "Rectangle.csv", Rectangle.save_to_file_csv, {},
+                Rectangle.load_from_file_csv)]
+    for codec in ("zlib", "gzip", "lzma"):
+        formats.append(("chunks/" + codec, "Rectangle.chunks",
+                        Rectangle.save_to_file_chunked, {"codec": codec},
+                        Rectangle.load_from_file_chunked))
+    for label, filename, save, options, load in formats:
+        _, save_time = timed(save, rects, **options)
+        size = os.path.getsize(filename)
+        loaded, load_time = timed(lambda: list(load()))
+        if label.startswith("chunks"):
+            with load() as chunks:
+                _, find_time = timed(chunks.find, target)
+        else:
+            _, find_time = timed(lambda: by_id(load(), target))
+        print("{:<12}{:>12}{:>8.2f}s{:>8.2f}s{:>8.3f}s".format(
+            label, size, save_time, load_time, find_time))
+        os.remove(filename)
+
+
+if __name__ == "__main__":
+    with workdir():
+        main(arg(1, 1000000))
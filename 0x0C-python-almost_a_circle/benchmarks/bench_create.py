@@ -0,0 +1,29 @@
+#!/usr/bin/python3
+"""Benchmark Base.create_many against the create-then-update round trip.
+
+Usage: ./benchmarks/bench_create.py [number_of_records]
+"""
+from common import arg, timed
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+def create_by_update(cls, dictionaries):
+    """Build classes the way `create` did: placeholder, then `update`."""
+    new = []
+    for d in dictionaries:
+        obj = cls(1, 1) if cls is Rectangle else cls(1)
+        obj.update(**d)
+        new.append(obj)
+    return new
+
+
+if __name__ == "__main__":
+    n = arg(1, 1000000)
+    for cls in (Rectangle, Square):
+        dicts = [cls(i % 97 + 1, *[i % 89 + 1] * (cls is Rectangle),
+                     i % 13, i % 7, i).to_dictionary() for i in range(n)]
+        _, old = timed(create_by_update, cls, dicts)
+        _, new = timed(cls.create_many, dicts)
+        print("{:<9} n={}: create+update {:.2f}s, create_many {:.2f}s, "
+              "{:.2f}x".format(cls.__name__, n, old, new, old / new))
@@ -0,0 +1,29 @@
+#!/usr/bin/python3
+"""Benchmark load_from_file_csv_parallel across numbers of workers.
+
+Usage: ./benchmarks/bench_csv_parallel.py [number_of_rows] [max_workers]
+"""
+import os
+from common import arg, make_rectangles, timed, workdir
+from models.parallel_csv import load_from_file_csv_parallel
+from models.rectangle import Rectangle
+
+
+def main(n, max_workers):
+    """Print the load times of an n-row CSV file per number of workers."""
+    Rectangle.save_to_file_csv(make_rectangles(n))
+    print("rows={} cpus={}".format(n, os.cpu_count()))
+    _, serial = timed(Rectangle.load_from_file_csv)
+    print("load_from_file_csv          {:.2f}s".format(serial))
+    workers = 1
+    while workers <= max_workers:
+        _, batch = timed(load_from_file_csv_parallel, Rectangle,
+                         workers=workers, as_batch=True)
+        print("parallel, {} worker(s), batch {:.2f}s ({:.1f}x)"
+              .format(workers, batch, serial / batch))
+        workers *= 2
+
+
+if __name__ == "__main__":
+    with workdir():
+        main(arg(1, 1000000), arg(2, os.cpu_count()))
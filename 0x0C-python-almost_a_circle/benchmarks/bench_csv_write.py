@@ -0,0 +1,36 @@
+#!/usr/bin/python3
+"""Benchmark save_to_file_csv against a per-row DictWriter.
+
+Usage: ./benchmarks/bench_csv_write.py [number_of_shapes]
+"""
+import csv
+import os
+from common import arg, make_rectangles, timed, workdir
+from models.rectangle import Rectangle
+
+
+def save_with_dictwriter(list_objs):
+    """Write Rectangle.csv the way save_to_file_csv used to."""
+    with open("Rectangle.csv", "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=["id", "width", "height",
+                                                     "x", "y"])
+        for obj in list_objs:
+            writer.writerow(obj.to_dictionary())
+
+
+def main(n):
+    """Print the CSV write times of n Rectangles."""
+    rects = make_rectangles(n)
+    _, old = timed(save_with_dictwriter, rects)
+    _, new = timed(Rectangle.save_to_file_csv, rects)
+    size = os.path.getsize("Rectangle.csv")
+    _, gz = timed(Rectangle.save_to_file_csv, rects, compress=True)
+    gz_size = os.path.getsize("Rectangle.csv.gz")
+    print("n={}: DictWriter {:.2f}s, save_to_file_csv {:.2f}s ({:.1f}x), "
+          "gzip {:.2f}s ({} -> {} bytes)".format(n, old, new, old / new, gz,
+                                                 size, gz_size))
+
+
+if __name__ == "__main__":
+    with workdir():
+        main(arg(1, 1000000))
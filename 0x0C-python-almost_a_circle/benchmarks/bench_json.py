@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+"""Benchmark the shape JSON encoder against json.dumps.
+
+Usage: ./benchmarks/bench_json.py [number_of_shapes]
+"""
+import json
+from common import arg, best, make_rectangles, workdir
+from models.base import Base
+from models.rectangle import Rectangle
+
+
+def save_with_json_dumps(list_objs):
+    """Write Rectangle.json the way save_to_file used to."""
+    with open("Rectangle.json", "w") as jsonfile:
+        jsonfile.write("[")
+        sep = ""
+        for obj in list_objs:
+            jsonfile.write(sep)
+            jsonfile.write(json.dumps(obj.to_dictionary()))
+            sep = ", "
+        jsonfile.write("]")
+
+
+def main(n):
+    """Print the JSON encoding times of n Rectangles."""
+    rects = make_rectangles(n)
+    dicts = [r.to_dictionary() for r in rects]
+    expected, old = best(json.dumps, dicts)
+    output, new = best(Base.to_json_string, dicts)
+    assert output == expected
+    print("n={}: to_json_string json.dumps {:.3f}s, schema encoder {:.3f}s "
+          "({:.1f}x)".format(n, old, new, old / new))
+    _, old = best(save_with_json_dumps, rects)
+    with open("Rectangle.json", "r") as f:
+        expected = f.read()
+    _, new = best(Rectangle.save_to_file, rects)
+    with open("Rectangle.json", "r") as f:
+        assert f.read() == expected
+    print("n={}: save_to_file json.dumps {:.3f}s, schema encoder {:.3f}s "
+          "({:.1f}x)".format(n, old, new, old / new))
+
+
+if __name__ == "__main__":
+    with workdir():
+        main(arg(1, 1000000))
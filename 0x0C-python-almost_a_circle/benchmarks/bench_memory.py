@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+"""Measure bytes per instance of the regular and compact shape classes.
+
+Usage: ./benchmarks/bench_memory.py [number_of_shapes]
+"""
+import tracemalloc
+from common import arg
+from models.compact import CompactRectangle, CompactSquare
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+def bytes_per_instance(cls, n):
+    """Return the memory traced per instance for n instances of cls."""
+    sizes = [i % 1000 + 1000 for i in range(n)]
+    holder = [None] * n
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    for i in range(n):
+        holder[i] = cls(sizes[i], sizes[i])
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return used / n
+
+
+if __name__ == "__main__":
+    n = arg(1, 1000000)
+    for regular, compact in ((Rectangle, CompactRectangle),
+                             (Square, CompactSquare)):
+        before = bytes_per_instance(regular, n)
+        after = bytes_per_instance(compact, n)
+        print("{:<9} n={}: {:.0f} B/instance, compact {:.0f} B/instance "
+              "({:.0%} less)".format(regular.__name__, n, before, after,
+                                     1 - after / before))
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""Benchmark recycling Rectangles through a ShapePool.
+
+Creates and discards short-lived Rectangles, keeping `live` of them at a
+time, with and without a pool. Reports the time and the number of
+garbage collector passes per generation.
+
+Usage: ./benchmarks/bench_pool.py [number_of_shapes] [live]
+"""
+import gc
+from common import arg, timed
+from models.pool import ShapePool
+from models.rectangle import Rectangle
+
+
+def churn_new(n, live):
+    """Build n Rectangles, dropping them `live` at a time."""
+    keep = []
+    for i in range(n):
+        keep.append(Rectangle(i % 97 + 1, i % 89 + 1, i % 13, i % 7))
+        if len(keep) >= live:
+            keep.clear()
+
+
+def churn_pool(n, live, pool):
+    """Acquire n Rectangles, releasing them `live` at a time."""
+    keep = []
+    for i in range(n):
+        keep.append(pool.acquire(i % 97 + 1, i % 89 + 1, i % 13, i % 7))
+        if len(keep) >= live:
+            pool.release(*keep)
+            keep.clear()
+
+
+def measure(func, *args):
+    """Return the seconds taken by func and the gc passes it caused."""
+    gc.collect()
+    before = [s["collections"] for s in gc.get_stats()]
+    _, seconds = timed(func, *args)
+    after = [s["collections"] for s in gc.get_stats()]
+    return seconds, [b - a for a, b in zip(before, after)]
+
+
+if __name__ == "__main__":
+    n = arg(1, 1000000)
+    live = arg(2, 10000)
+    pool = ShapePool(Rectangle, maxsize=live)
+    new_time, new_gc = measure(churn_new, n, live)
+    pool_time, pool_gc = measure(churn_pool, n, live, pool)
+    print("n={} live={}: new {:.2f}s gc passes {}, pool {:.2f}s gc passes "
+          "{} ({:.2f}x)".format(n, live, new_time, new_gc, pool_time,
+                                pool_gc, new_time / pool_time))
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""Benchmark Rectangle.update and bulk_update against the if/elif update.
+
+Usage: ./benchmarks/bench_update.py [number_of_shapes]
+"""
+from common import arg, make_rectangles, timed
+from models.rectangle import Rectangle
+
+
+def ladder_update(self, *args, **kwargs):
+    """Update a Rectangle the way Rectangle.update used to."""
+    if args and len(args) != 0:
+        a = 0
+        for arg in args:
+            if a == 0:
+                if arg is None:
+                    self.__init__(self.width, self.height, self.x, self.y)
+                else:
+                    self.id = arg
+            elif a == 1:
+                self.width = arg
+            elif a == 2:
+                self.height = arg
+            elif a == 3:
+                self.x = arg
+            elif a == 4:
+                self.y = arg
+            a += 1
+
+    elif kwargs and len(kwargs) != 0:
+        for k, v in kwargs.items():
+            if k == "id":
+                if v is None:
+                    self.__init__(self.width, self.height, self.x, self.y)
+                else:
+                    self.id = v
+            elif k == "width":
+                self.width = v
+            elif k == "height":
+                self.height = v
+            elif k == "x":
+                self.x = v
+            elif k == "y":
+                self.y = v
+
+
+if __name__ == "__main__":
+    rects = make_rectangles(arg(1, 1000000))
+    cases = [
+        ("positional", lambda: [ladder_update(r, 1, 2, 3, 4, 5)
+                                for r in rects],
+         lambda: [r.update(1, 2, 3, 4, 5) for r in rects]),
+        ("keyword y, x", lambda: [ladder_update(r, y=5, x=4)
+                                  for r in rects],
+         lambda: [r.update(y=5, x=4) for r in rects]),
+        ("keyword id", lambda: [ladder_update(r, id=None) for r in rects],
+         lambda: [r.update(id=None) for r in rects]),
+        ("bulk width", lambda: [ladder_update(r, width=7) for r in rects],
+         lambda: Rectangle.bulk_update(rects, width=7)),
+    ]
+    for name, old, new in cases:
+        _, before = timed(old)
+        _, after = timed(new)
+        print("{:<13} n={}: if/elif {:.2f}s, table {:.2f}s ({:.1f}x)"
+              .format(name, len(rects), before, after, before / after))
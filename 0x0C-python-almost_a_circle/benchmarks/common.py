@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""Defines helpers shared by the benchmark scripts.
+
+Importing this module puts the project directory on `sys.path`, so the
+scripts can import `models` whatever the current directory is.
+"""
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def parse_size(text):
+    """Return the int of a size such as 1000, 10k or 2M."""
+    scale = {"k": 1000, "m": 1000000}.get(text[-1:].lower(), 1)
+    if scale != 1:
+        text = text[:-1]
+    return int(float(text) * scale)
+
+
+def arg(position, default):
+    """Return a size given on the command line, or a default.
+
+    Args:
+        position (int): The position of the argument in `sys.argv`.
+        default (int): The value used when the argument is missing.
+    """
+    if len(sys.argv) > position:
+        return parse_size(sys.argv[position])
+    return default
+
+
+def make_rectangles(n, cls=None):
+    """Return n Rectangles with varied attributes.
+
+    Args:
+        n (int): The number of Rectangles.
+        cls (type): A class taking Rectangle's arguments. Defaults to
+            Rectangle.
+    """
+    if cls is None:
+        from models.rectangle import Rectangle as cls
+    return [cls(i % 97 + 1, i % 89 + 1, i % 13, i % 7, i)
+            for i in range(1, n + 1)]
+
+
+def timed(func, *args, **kwargs):
+    """Return the result of a call to func and the seconds it took."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def best(func, *args, repeat=5, **kwargs):
+    """Return the result and the best time of several calls to func."""
+    seconds = float("inf")
+    for _ in range(repeat):
+        result, elapsed = timed(func, *args, **kwargs)
+        seconds = min(seconds, elapsed)
+    return result, seconds
+
+
+@contextlib.contextmanager
+def workdir():
+    """Run a with block in a new temporary directory, then delete it."""
+    path = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(path)
@@ -0,0 +1,300 @@
+#!/usr/bin/python3
+"""Run the 0x0C model benchmarks and compare results between commits.
+
+Each case is timed on a fresh working directory for every size. The
+best of `--repeat` runs gives the throughput in shapes per second, and
+one more run under tracemalloc gives the peak memory allocated by the
+case (setup excluded). Results can be saved as JSON, tagged with the
+git revision, and two saved results can be compared.
+
+Usage:
+    ./benchmarks/run.py [--sizes 1k,10k,100k] [--repeat 5]
+                        [--cases construct,update] [--output FILE]
+                        [--root DIR]
+    ./benchmarks/run.py --compare OLD.json NEW.json [--threshold 0.1]
+
+To check a change for regressions, benchmark the old commit from a
+separate checkout with this harness (`--root` points it at that
+checkout's models), benchmark the current tree, and compare the two;
+the exit status is 1 if any case slowed down by more than the
+threshold. This works for commits older than the harness itself:
+
+    git worktree add /tmp/old OLD
+    ./benchmarks/run.py --root /tmp/old/0x0C-python-almost_a_circle \\
+                        --output old.json
+    ./benchmarks/run.py --output new.json
+    ./benchmarks/run.py --compare old.json new.json
+    git worktree remove /tmp/old
+
+Cases that need a method the old checkout does not have are skipped.
+The bench_*.py scripts compare the current code with the implementation
+it replaced, using the helpers in common.py.
+
+Sizes accept k and M suffixes, so `--sizes 1k,1M,10M` runs up to ten
+million shapes; the larger sizes need several GB of memory.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tracemalloc
+from common import ROOT, make_rectangles, parse_size, timed, workdir
+
+
+def case_construct(n):
+    """Build n Rectangles."""
+    from models.rectangle import Rectangle
+    return lambda: make_rectangles(n, Rectangle)
+
+
+def case_construct_compact(n):
+    """Build n CompactRectangles, as in bench_memory.py."""
+    from models.compact import CompactRectangle
+    return lambda: make_rectangles(n, CompactRectangle)
+
+
+def case_update(n):
+    """Update every attribute of n Rectangles positionally."""
+    rects = make_rectangles(n)
+
+    def run():
+        for r in rects:
+            r.update(r.id, 5, 6, 1, 2)
+    return run
+
+
+def case_bulk_update(n):
+    """Set the width of n Rectangles at once, as in bench_update.py."""
+    from models.rectangle import Rectangle
+    rects = make_rectangles(n)
+    return lambda: Rectangle.bulk_update(rects, width=7)
+
+
+def case_create_many(n):
+    """Build n Rectangles from dictionaries, as in bench_create.py."""
+    from models.rectangle import Rectangle
+    dicts = [r.to_dictionary() for r in make_rectangles(n)]
+    return lambda: Rectangle.create_many(dicts)
+
+
+def case_to_dictionary(n):
+    """Call to_dictionary on n Rectangles."""
+    rects = make_rectangles(n)
+    return lambda: [r.to_dictionary() for r in rects]
+
+
+def case_to_json_string(n):
+    """Serialize the dictionaries of n Rectangles to one JSON string."""
+    from models.base import Base
+    dicts = [r.to_dictionary() for r in make_rectangles(n)]
+    return lambda: Base.to_json_string(dicts)
+
+
+def case_save_to_file(n):
+    """Write n Rectangles to Rectangle.json."""
+    from models.rectangle import Rectangle
+    rects = make_rectangles(n)
+    return lambda: Rectangle.save_to_file(rects)
+
+
+def case_load_from_file(n):
+    """Read n Rectangles back from Rectangle.json."""
+    from models.rectangle import Rectangle
+    Rectangle.save_to_file(make_rectangles(n))
+    return Rectangle.load_from_file
+
+
+def case_csv_round_trip(n):
+    """Write n Rectangles to Rectangle.csv and read them back."""
+    from models.rectangle import Rectangle
+    rects = make_rectangles(n)
+
+    def run():
+        Rectangle.save_to_file_csv(rects)
+        return Rectangle.load_from_file_csv()
+    return run
+
+
+def case_save_to_file_csv_gzip(n):
+    """Write n Rectangles to Rectangle.csv.gz, as in bench_csv_write.py."""
+    from models.rectangle import Rectangle
+    rects = make_rectangles(n)
+    return lambda: Rectangle.save_to_file_csv(rects, compress=True)
+
+
+def case_load_from_file_csv_parallel(n):
+    """Read Rectangle.csv in worker processes, as in bench_csv_parallel.py."""
+    from models.parallel_csv import load_from_file_csv_parallel
+    from models.rectangle import Rectangle
+    Rectangle.save_to_file_csv(make_rectangles(n))
+    return lambda: load_from_file_csv_parallel(Rectangle, as_batch=True)
+
+
+def case_chunked_round_trip(n):
+    """Write n Rectangles to Rectangle.chunks and read them back.
+
+    As in bench_chunked.py, with the default zlib codec.
+    """
+    from models.rectangle import Rectangle
+    rects = make_rectangles(n)
+
+    def run():
+        Rectangle.save_to_file_chunked(rects)
+        with Rectangle.load_from_file_chunked() as chunks:
+            return list(chunks)
+    return run
+
+
+def case_pool_churn(n):
+    """Acquire n Rectangles from a ShapePool, as in bench_pool.py.
+
+    They are released 1000 at a time.
+    """
+    from models.pool import ShapePool
+    from models.rectangle import Rectangle
+    pool = ShapePool(Rectangle, maxsize=1000)
+
+    def run():
+        keep = []
+        for i in range(n):
+            keep.append(pool.acquire(i % 97 + 1, i % 89 + 1, i % 13, i % 7))
+            if len(keep) >= 1000:
+                pool.release(*keep)
+                keep.clear()
+    return run
+
+
+CASES = {name[len("case_"):]: func for name, func in globals().items()
+         if name.startswith("case_")}
+
+
+def git_revision(root):
+    """Return the git revision of a checkout, or "unknown" outside one."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def measure(case, n, repeat):
+    """Return the best time and peak traced memory of a case at size n."""
+    best = float("inf")
+    for _ in range(repeat):
+        run = case(n)
+        gc.collect()
+        _, seconds = timed(run)
+        best = min(best, seconds)
+        del run
+    run = case(n)
+    gc.collect()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(names, sizes, repeat, root=ROOT):
+    """Run the named cases at each size and return the results.
+
+    A case is skipped if the models under root lack what it needs.
+    """
+    results = []
+    for name in names:
+        for n in sizes:
+            try:
+                with workdir():
+                    seconds, peak = measure(CASES[name], n, repeat)
+            except (ImportError, AttributeError) as e:
+                print("{:<28}{:>10}  skipped: {}".format(name, n, e),
+                      flush=True)
+                break
+            result = {"case": name, "size": n, "seconds": seconds,
+                      "shapes_per_second": n / seconds,
+                      "peak_bytes": peak}
+            print("{:<28}{:>10}{:>14.0f}/s{:>12.1f} MiB".format(
+                name, n, result["shapes_per_second"], peak / 2 ** 20),
+                flush=True)
+            results.append(result)
+    return {"revision": git_revision(root),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "results": results}
+
+
+def compare(old, new, threshold):
+    """Print the speed and memory ratios of two runs.
+
+    Args:
+        old (dict): The results of the baseline run.
+        new (dict): The results of the run being checked.
+        threshold (float): The slowdown (0.1 = 10%) counted as a
+            regression.
+    Returns:
+        The number of regressions.
+    """
+    baseline = {(r["case"], r["size"]): r for r in old["results"]}
+    regressions = 0
+    print("{} -> {}".format(old["revision"], new["revision"]))
+    for r in new["results"]:
+        before = baseline.get((r["case"], r["size"]))
+        if before is None:
+            continue
+        speed = r["shapes_per_second"] / before["shapes_per_second"]
+        memory = r["peak_bytes"] / max(before["peak_bytes"], 1)
+        flag = ""
+        if speed < 1 - threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print("{:<28}{:>10}{:>9.2f}x speed{:>9.2f}x memory{}".format(
+            r["case"], r["size"], speed, memory, flag))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the 0x0C models.")
+    parser.add_argument("--sizes", default="1k,10k,100k",
+                        help="comma-separated shape counts (k/M suffixes)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timed runs per case; the best is kept")
+    parser.add_argument("--cases", default=",".join(CASES),
+                        help="comma-separated cases: " + ", ".join(CASES))
+    parser.add_argument("--output", help="write the results to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="compare two result files and exit")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="slowdown counted as a regression")
+    parser.add_argument("--root", default=ROOT,
+                        help="project directory whose models are benchmarked"
+                        " (default: this checkout)")
+    args = parser.parse_args()
+    if args.compare:
+        runs = []
+        for filename in args.compare:
+            with open(filename, "r") as f:
+                runs.append(json.load(f))
+        sys.exit(1 if compare(*runs, args.threshold) else 0)
+    names = args.cases.split(",")
+    unknown = set(names) - CASES.keys()
+    if unknown:
+        parser.error("unknown cases: " + ", ".join(sorted(unknown)))
+    root = os.path.abspath(args.root)
+    if not os.path.isdir(os.path.join(root, "models")):
+        parser.error("no models package in " + root)
+    # models is a namespace package, so drop this checkout from the path
+    # or its modules would fill in for those missing under root.
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p) != ROOT]
+    sys.path.insert(0, root)
+    report = run_benchmarks(names, [parse_size(s) for s in
+                                    args.sizes.split(",")], args.repeat,
+                            root)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
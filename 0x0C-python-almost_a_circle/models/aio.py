@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+"""Defines asyncio helpers that keep file I/O off the event loop."""
+import asyncio
+import itertools
+import os
+import secrets
+from models.fastjson import encode_records
+
+
+async def run_in_thread(func, *args):
+    """Run func(*args) in the default executor and return its result.
+
+    If the awaiting task is cancelled, the call is still waited for
+    before CancelledError propagates, so the caller never cleans up a
+    file that a worker thread is still writing.
+    """
+    future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait([future])
+        raise
+
+
+def _write_batch(jsonfile, sep, batch):
+    """Encode a batch of dictionaries and append it to a JSON list."""
+    jsonfile.write(sep)
+    jsonfile.write(encode_records(batch))
+
+
+def _finish(jsonfile):
+    """Close a JSON list and flush it to disk."""
+    jsonfile.write("]")
+    jsonfile.flush()
+    os.fsync(jsonfile.fileno())
+
+
+async def save_json(filename, list_objs, batch_size):
+    """Write the JSON list of objects' dictionaries atomically.
+
+    The dictionaries are taken on the event loop, a batch at a time, so
+    the objects are never read from another thread. Encoding and writing
+    happen in a worker thread, into a temporary file in the same
+    directory that then replaces `filename`. If the save fails or is
+    cancelled, the temporary file is removed and `filename` is left as
+    it was.
+
+    Args:
+        filename (str): The path of the file to write.
+        list_objs (iterable): The objects to write.
+        batch_size (int): The number of objects per batch.
+    """
+    tmpname = "{}.{}.tmp".format(filename, secrets.token_hex(4))
+    jsonfile = open(tmpname, "x")
+    try:
+        with jsonfile:
+            jsonfile.write("[")
+            objs = iter(list_objs)
+            sep = ""
+            while True:
+                batch = [obj.to_dictionary()
+                         for obj in itertools.islice(objs, batch_size)]
+                if not batch:
+                    break
+                await run_in_thread(_write_batch, jsonfile, sep, batch)
+                sep = ", "
+            await run_in_thread(_finish, jsonfile)
+        os.replace(tmpname, filename)
+    except BaseException:
+        try:
+            os.remove(tmpname)
+        except OSError:
+            pass
+        raise
+
+
+async def load_json(cls, records, batch_size):
+    """Return the classes instantiated from an iterator of dictionaries.
+
+    Each batch is decoded and instantiated in a worker thread, and the
+    event loop runs between batches.
+
+    Args:
+        cls (type): The class to instantiate.
+        records (iterator): The dictionaries, e.g. from `_iter_json_list`.
+        batch_size (int): The number of records per batch.
+    """
+    def step():
+        return cls.create_many(list(itertools.islice(records, batch_size)))
+
+    shapes = []
+    while True:
+        batch = await run_in_thread(step)
+        if not batch:
+            return shapes
+        shapes.extend(batch)
@@ -3,19 +3,51 @@
 """Defines a base model class."""
 import json
 import csv
+import gzip
+import inspect
+import itertools
+import operator
+import threading
 import turtle
+from models import aio
+from models.binary import ShapeFile
+from models.chunked import ChunkFile
+from models.fastjson import encode_list, encode_records
+from models.lazy import LazyShapeList
+from models.raster import Raster
 
 
 class Base:
     """Base model.
 
     This Represents the "base" for all other classes in project 0x0C*.
+    `id` is kept in a slot so subclasses can opt into a layout without a
+    per-instance `__dict__` (see models/compact.py). This changes the
+    layout of every instance: Base instances hold no attributes other
+    than `id`, and subclasses without `__slots__`, such as Rectangle and
+    Square, keep a `__dict__` that does not hold `id`, so `vars()` of an
+    instance lists every attribute but `id`.
+
+    Subclasses list the keys of `to_dictionary`, in order, in
+    `_update_order`, and are registered so files tagging records with a
+    class name can be read back (see models/store.py).
 
     Private Class Attributes:
-        __nb_object (int): Number of instantiated Bases.
+        __nb_object (int): Highest id handed out so far.
+        __registry (dict): Every subclass, by `module.qualname`.
+        __init_params (dict): Constructor arguments cached per class.
+        __id_lock (Lock): Guards `__nb_objects`.
+        __id_block (local): The run of ids reserved by the current thread.
+        __id_block_size (int): Number of ids a thread reserves at a time.
     """
 
+    __slots__ = ("id",)
     __nb_objects = 0
+    __registry = {}
+    __init_params = {}
+    __id_lock = threading.Lock()
+    __id_block = threading.local()
+    __id_block_size = 256
 
     def __init__(self, id=None):
         """Initialize a new Base.
@@ -26,8 +58,82 @@ class Base:
         if id is not None:
             self.id = id
         else:
-            Base.__nb_objects += 1
-            self.id = Base.__nb_objects
+            self.id = Base._reserve_ids(1)[0]
+
+    def __init_subclass__(cls, **kwargs):
+        """Register a new subclass under its module and qualified name.
+
+        A class defined again under the same name in the same module, e.g.
+        by reloading the module, replaces the earlier one. Every subclass
+        also gets its own `_tracker` of None, so tracking changes of a
+        class never tracks its subclasses.
+        """
+        super().__init_subclass__(**kwargs)
+        Base.__registry[cls.__module__ + "." + cls.__qualname__] = cls
+        if "_tracker" not in cls.__dict__:
+            cls._tracker = None
+
+    @staticmethod
+    def subclass(name):
+        """Return the subclass of Base with a given name.
+
+        Args:
+            name (str): The class name, or `module.qualname` to pick one
+                of several subclasses with the same class name.
+        Raises:
+            ValueError: If no subclass of Base has that name, or several
+                do.
+        """
+        if name in Base.__registry:
+            return Base.__registry[name]
+        found = [cls for cls in Base.__registry.values()
+                 if cls.__name__ == name]
+        if not found:
+            raise ValueError("unknown shape type {}".format(name))
+        if len(found) > 1:
+            raise ValueError("ambiguous shape type {}: {}".format(
+                name, ", ".join(sorted(cls.__module__ + "." + cls.__qualname__
+                                       for cls in found))))
+        return found[0]
+
+    @classmethod
+    def _reserve_ids(cls, count):
+        """Reserve a run of consecutive ids in a single step.
+
+        Each thread takes ids from a block it reserved under a lock, so
+        ids are unique across threads and the lock is only taken once per
+        block. A run that does not fit in the rest of the block starts a
+        new one, which keeps ids increasing within a thread.
+
+        Args:
+            count (int): The number of ids to reserve.
+        Returns:
+            A range over the reserved ids.
+        """
+        block = Base.__id_block
+        first = getattr(block, "next", 0)
+        end = getattr(block, "end", 0)
+        if first + count > end:
+            with Base.__id_lock:
+                first = Base.__nb_objects + 1
+                Base.__nb_objects += max(count, Base.__id_block_size)
+                end = Base.__nb_objects + 1
+            block.end = end
+        block.next = first + count
+        return range(first, first + count)
+
+    @classmethod
+    def _field_names(cls):
+        """Return the attribute names written by `to_dictionary`, in order.
+
+        Raises:
+            ValueError: If the class does not define `_update_order`.
+        """
+        try:
+            return list(cls._update_order)
+        except AttributeError:
+            raise ValueError("{} does not list its fields in _update_order"
+                             .format(cls.__name__)) from None
 
     @staticmethod
     def to_json_string(list_dictionaries):
@@ -38,22 +144,36 @@ class Base:
         """
         if list_dictionaries is None or list_dictionaries == []:
             return "[]"
-        return json.dumps(list_dictionaries)
+        return encode_list(list_dictionaries)
 
     @classmethod
     def save_to_file(cls, list_objs):
         """Write the JSON serialization of a list of objects to a file.
 
+        Objects are serialized in batches of 4096 as they are written, so
+        `list_objs` may be any iterable (including a generator) and memory
+        use does not grow with the number of objects.
+
         Args:
-            list_objs (list): A list of inherited Base instances.
+            list_objs (iterable): An iterable of inherited Base instances.
         """
         filename = cls.__name__ + ".json"
         with open(filename, "w") as jsonfile:
             if list_objs is None:
                 jsonfile.write("[]")
-            else:
-                list_dicts = [o.to_dictionary() for o in list_objs]
-                jsonfile.write(Base.to_json_string(list_dicts))
+                return
+            jsonfile.write("[")
+            objs = iter(list_objs)
+            sep = ""
+            while True:
+                batch = [obj.to_dictionary()
+                         for obj in itertools.islice(objs, 4096)]
+                if not batch:
+                    break
+                jsonfile.write(sep)
+                jsonfile.write(encode_records(batch))
+                sep = ", "
+            jsonfile.write("]")
 
     @staticmethod
     def from_json_string(json_string):
@@ -77,13 +197,66 @@ class Base:
             **dictionary (dict): Key/value pairs of attributes to initialize.
         """
         if dictionary and dictionary != {}:
-            if cls.__name__ == "Rectangle":
-                new = cls(1, 1)
-            else:
-                new = cls(1)
+            if cls._init_params() is not None:
+                return cls.create_many([dictionary])[0]
+            params = list(
+                inspect.signature(cls.__init__).parameters.values())
+            new = cls(**{p.name: 1 for p in params[1:]
+                         if p.default is p.empty})
             new.update(**dictionary)
             return new
 
+    @classmethod
+    def create_many(cls, dictionaries):
+        """Return a list of classes instantiated from dictionaries.
+
+        Each class is built by passing its attributes straight to the
+        constructor, so every attribute is validated once instead of going
+        through a placeholder instance and `update`.
+
+        Args:
+            dictionaries (iterable): Dictionaries of attributes.
+        Returns:
+            A list holding a class per dictionary (None for an empty one).
+        """
+        params = cls._init_params()
+        if params is None:
+            return [cls.create(**d) for d in dictionaries]
+        names, required = params
+        new = []
+        for d in dictionaries:
+            if not d:
+                new.append(None)
+                continue
+            if not d.keys() <= names:
+                d = {k: v for k, v in d.items() if k in names}
+            if not required.keys() <= d.keys():
+                d = dict(required, **d)
+            new.append(cls(**d))
+        return new
+
+    @classmethod
+    def _init_params(cls):
+        """Return the constructor arguments accepted for `cls`.
+
+        Returns:
+            None if the class has no `_update_order` or its keys are not
+            all constructor arguments. Otherwise - the argument names and
+            the placeholder value used by `create` for each required
+            argument.
+        """
+        if cls not in Base.__init_params:
+            params = list(inspect.signature(cls.__init__).parameters.values())
+            names = frozenset(p.name for p in params[1:])
+            required = {p.name: 1 for p in params[1:]
+                        if p.default is p.empty}
+            fields = getattr(cls, "_update_order", None)
+            if fields is not None and names.issuperset(fields):
+                Base.__init_params[cls] = (names, required)
+            else:
+                Base.__init_params[cls] = None
+        return Base.__init_params[cls]
+
     @classmethod
     def load_from_file(cls):
         """Return a list of classes instantiated from a file of JSON strings.
@@ -97,52 +270,343 @@ class Base:
         filename = str(cls.__name__) + ".json"
         try:
             with open(filename, "r") as jsonfile:
-                list_dicts = Base.from_json_string(jsonfile.read())
-                return [cls.create(**d) for d in list_dicts]
+                return cls.create_many(Base._iter_json_list(jsonfile))
+        except IOError:
+            return []
+
+    @classmethod
+    def load_from_file_iter(cls):
+        """Yield classes instantiated from a file of JSON strings one by one.
+
+        Reads from `<cls.__name__>.json` incrementally, so only the record
+        being decoded is held in memory at any time.
+
+        Yields:
+            Instantiated classes, in file order. Nothing if the file does
+            not exist.
+        """
+        filename = cls.__name__ + ".json"
+        try:
+            jsonfile = open(filename, "r")
+        except IOError:
+            return
+        with jsonfile:
+            for d in Base._iter_json_list(jsonfile):
+                yield cls.create(**d)
+
+    @classmethod
+    def load_from_file_lazy(cls):
+        """Return the shapes of a file of JSON strings, instantiated lazily.
+
+        Maps `<cls.__name__>.json` without decoding it. Each shape is
+        created the first time it is accessed and then cached.
+
+        Returns:
+            If the file does not exist - an empty list.
+            Otherwise - a LazyShapeList; call its `close` when done.
+        """
+        try:
+            return LazyShapeList(cls, cls.__name__ + ".json")
         except IOError:
             return []
 
     @classmethod
-    def save_to_file_csv(cls, list_objs):
+    async def save_to_file_async(cls, list_objs, *, batch_size=4096):
+        """Write the JSON serialization of objects without blocking the loop.
+
+        Writes the same `<cls.__name__>.json` as `save_to_file`. Objects
+        are read on the event loop a batch at a time, while encoding and
+        file I/O run in a worker thread. The output goes to a temporary
+        file that replaces `<cls.__name__>.json` once it is complete, so
+        a failed, cancelled or interrupted save leaves the previous file
+        intact.
+
+        Args:
+            list_objs (iterable): An iterable of inherited Base instances.
+            batch_size (int): The number of objects per batch.
+        """
+        await aio.save_json(cls.__name__ + ".json", list_objs or [],
+                            batch_size)
+
+    @classmethod
+    async def load_from_file_async(cls, *, batch_size=4096):
+        """Return the classes of a file of JSON strings without blocking.
+
+        Reads `<cls.__name__>.json` like `load_from_file`, decoding and
+        instantiating a batch at a time in a worker thread. Cancelling
+        the load stops it after the current batch.
+
+        Args:
+            batch_size (int): The number of records per batch.
+        Returns:
+            If the file does not exist - an empty list.
+            Otherwise - a list of instantiated classes.
+        """
+        try:
+            jsonfile = open(cls.__name__ + ".json", "r")
+        except IOError:
+            return []
+        with jsonfile:
+            return await aio.load_json(cls, Base._iter_json_list(jsonfile),
+                                       batch_size)
+
+    @staticmethod
+    def _iter_json_list(fileobj, chunk_size=65536):
+        """Yield the items of a JSON list read incrementally from a file.
+
+        Only the item being decoded is buffered: more of the file is read
+        when an item runs past the end of the buffer, and an item that is
+        malformed before that point raises at once. Items must be
+        separated by single commas, and only whitespace may follow the
+        closing bracket.
+
+        Args:
+            fileobj (file): A text file holding a single JSON list.
+            chunk_size (int): Number of characters to read at a time.
+        Raises:
+            ValueError: If the file does not hold exactly one JSON list.
+        """
+        decoder = json.JSONDecoder()
+        buf = ""
+        while not buf:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                return
+            buf = chunk.lstrip()
+        if buf[0] != "[":
+            raise ValueError("expected a JSON list")
+        pos = 1
+        eof = False
+
+        def peek():
+            """Skip whitespace and return the next character, "" at EOF."""
+            nonlocal buf, pos, eof
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n":
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                if eof:
+                    return ""
+                buf = fileobj.read(chunk_size)
+                eof = buf == ""
+                pos = 0
+
+        first, separated = True, False
+        while True:
+            char = peek()
+            if char == "]" and not separated:
+                pos += 1
+                if peek():
+                    raise ValueError("unexpected data after JSON list")
+                return
+            if not char:
+                raise ValueError("truncated JSON list")
+            if not (first or separated):
+                if char != ",":
+                    raise ValueError("expected ',' or ']' in JSON list")
+                pos += 1
+                separated = True
+                continue
+            if char in ",]":
+                raise ValueError("expected an item in JSON list")
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as e:
+                if not (eof or Base._json_cut_short(e)):
+                    raise ValueError("malformed JSON list: {}".format(
+                        e)) from None
+                item, end = None, -1
+            if end < 0 or (end == len(buf) and not eof):
+                if eof:
+                    raise ValueError("truncated JSON list")
+                chunk = fileobj.read(chunk_size)
+                eof = chunk == ""
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            yield item
+            pos = end
+            first = separated = False
+
+    @staticmethod
+    def _json_cut_short(error):
+        """Return True if a decode error may be the end of the buffer.
+
+        An item cut off by the end of the buffer fails either inside an
+        unterminated string or within a partial token (such as `tru` or
+        `1.`) at the very end; any other failure is malformed JSON.
+        """
+        return (error.msg.startswith("Unterminated string") or
+                len(error.doc) - error.pos <= 16)
+
+    @classmethod
+    def save_to_file_csv(cls, list_objs, *, compress=False):
         """Write the CSV serialization of a list of objects to a file.
 
+        Rows are written positionally from each object's attributes
+        through a large write buffer, so `list_objs` may be any iterable
+        (including a generator) and no dictionary is built per object.
+        The columns are the fields of cls, or of the first object's class
+        when called on Base itself.
+
         Args:
-            list_objs (list): A list of inherited Base instances.
+            list_objs (iterable): An iterable of inherited Base instances.
+            compress (bool): Write gzip output to `<cls.__name__>.csv.gz`.
+        Raises:
+            ValueError: If an object does not have the fields of the
+                columns, e.g. a Square saved to Rectangle.csv, or if its
+                class does not define `_update_order`.
         """
         filename = cls.__name__ + ".csv"
-        with open(filename, "w", newline="") as csvfile:
-            if list_objs is None or list_objs == []:
+        if compress:
+            csvfile = gzip.open(filename + ".gz", "wt", newline="",
+                                compresslevel=1)
+        else:
+            csvfile = open(filename, "w", newline="", buffering=1 << 20)
+        with csvfile:
+            objs = iter(list_objs or [])
+            first = next(objs, None)
+            if first is None:
                 csvfile.write("[]")
             else:
-                if cls.__name__ == "Rectangle":
-                    fieldnames = ["id", "width", "height", "x", "y"]
+                if cls is Base:
+                    fields = type(first)._field_names()
                 else:
-                    fieldnames = ["id", "size", "x", "y"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                for obj in list_objs:
-                    writer.writerow(obj.to_dictionary())
+                    fields = cls._field_names()
+                writer = csv.writer(csvfile)
+                writer.writerows(Base._csv_rows(
+                    fields, itertools.chain([first], objs)))
+
+    @staticmethod
+    def _csv_rows(fields, list_objs):
+        """Yield the values of fields of each object, in order.
+
+        Raises:
+            ValueError: If the `_field_names` of an object's class are not
+                `fields`.
+        """
+        row = operator.attrgetter(*fields)
+        checked = set()
+        for obj in list_objs:
+            kind = type(obj)
+            if kind not in checked:
+                if kind._field_names() != fields:
+                    raise ValueError("cannot write {} as {} fields".format(
+                        kind.__name__, ",".join(fields)))
+                checked.add(kind)
+            yield row(obj)
 
     @classmethod
-    def load_from_file_csv(cls):
+    def load_from_file_csv(cls, *, compress=False):
         """Return a list of classes instantiated from a CSV file.
 
-        Reads from `<cls.__name__>.csv`.
+        Reads from `<cls.__name__>.csv`. Blank lines are skipped.
 
+        Args:
+            compress (bool): Read gzip input from `<cls.__name__>.csv.gz`.
         Returns:
             If the file does not exist - an empty list.
             Otherwise - a list of instantiated classes.
+        Raises:
+            ValueError: If a row does not hold one int per field.
         """
         filename = cls.__name__ + ".csv"
         try:
-            with open(filename, "r", newline="") as csvfile:
-                if cls.__name__ == "Rectangle":
-                    fieldnames = ["id", "width", "height", "x", "y"]
-                else:
-                    fieldnames = ["id", "size", "x", "y"]
-                list_dicts = csv.DictReader(csvfile, fieldnames=fieldnames)
-                list_dicts = [dict([k, int(v)] for k, v in d.items())
-                              for d in list_dicts]
-                return [cls.create(**d) for d in list_dicts]
+            if compress:
+                csvfile = gzip.open(filename + ".gz", "rt", newline="")
+            else:
+                csvfile = open(filename, "r", newline="")
+            with csvfile:
+                fieldnames = cls._field_names()
+                rows = csv.reader(csvfile)
+                return cls.create_many(Base._csv_records(fieldnames, rows))
+        except IOError:
+            return []
+
+    @staticmethod
+    def _csv_records(fieldnames, rows):
+        """Yield the dictionary of each non-empty CSV row.
+
+        Raises:
+            ValueError: If a row does not hold one int per field.
+        """
+        width = len(fieldnames)
+        for row in rows:
+            if len(row) != width:
+                if not row:
+                    continue
+                raise ValueError("expected {} values per row, got {}".format(
+                    width, len(row)))
+            yield dict(zip(fieldnames, map(int, row)))
+
+    @classmethod
+    def save_to_file_bin(cls, list_objs):
+        """Write a list of objects to a file of fixed-width binary records.
+
+        Writes to `<cls.__name__>.bin`: a header naming the class and its
+        fields, then one record of 64-bit ints per object.
+
+        Args:
+            list_objs (iterable): An iterable of inherited Base instances.
+        Raises:
+            ValueError: If the class does not define `_update_order`.
+        """
+        filename = cls.__name__ + ".bin"
+        ShapeFile.write(filename, cls.__name__, cls._field_names(),
+                        list_objs or [])
+
+    @classmethod
+    def load_from_file_bin(cls):
+        """Return a memory-mapped view of a file of binary records.
+
+        Reads from `<cls.__name__>.bin`. Records are only decoded, and
+        classes only instantiated, when they are accessed.
+
+        Returns:
+            If the file does not exist - an empty list.
+            Otherwise - a ShapeFile giving random access to the classes.
+        """
+        filename = cls.__name__ + ".bin"
+        try:
+            return ShapeFile(cls, filename)
+        except IOError:
+            return []
+
+    @classmethod
+    def save_to_file_chunked(cls, list_objs, *, codec="zlib",
+                             chunk_size=65536):
+        """Write a list of objects to a compressed, chunked file.
+
+        Writes to `<cls.__name__>.chunks`: the records are stored column
+        by column in chunks of `chunk_size`, each compressed on its own,
+        followed by an index of the chunks.
+
+        Args:
+            list_objs (iterable): An iterable of inherited Base instances.
+            codec (str): "gzip", "zlib" or "lzma".
+            chunk_size (int): The number of records per chunk.
+        Raises:
+            ValueError: If the class does not define `_update_order`.
+        """
+        filename = cls.__name__ + ".chunks"
+        ChunkFile.write(filename, cls.__name__, cls._field_names(),
+                        list_objs or [], codec, chunk_size)
+
+    @classmethod
+    def load_from_file_chunked(cls):
+        """Return a view of a compressed, chunked file.
+
+        Reads from `<cls.__name__>.chunks`. A chunk is only decompressed,
+        and its classes only instantiated, when it is accessed.
+
+        Returns:
+            If the file does not exist - an empty list.
+            Otherwise - a ChunkFile giving access to the classes.
+        """
+        filename = cls.__name__ + ".chunks"
+        try:
+            return ChunkFile(cls, filename)
         except IOError:
             return []
 
@@ -186,3 +650,34 @@ class Base:
             turt.hideturtle()
 
         turtle.exitonclick()
+
+    @staticmethod
+    def draw_to_file(list_rectangles, list_squares, filename,
+                     width=None, height=None):
+        """Draw Rectangles and Squares into an image file, without a display.
+
+        Shapes are filled in the colors `draw` uses, with y growing
+        downwards as in `display`.
+
+        Args:
+            list_rectangles (iterable): Rectangle objects to draw.
+            list_squares (iterable): Square objects to draw.
+            filename (str): The image to write, PNG if it ends in `.png`
+                and PPM otherwise.
+            width (int): The image width. Defaults to fit every shape.
+            height (int): The image height. Defaults to fit every shape.
+        Returns:
+            The Raster that was written.
+        """
+        list_rectangles = list(list_rectangles)
+        list_squares = list(list_squares)
+        shapes = list_rectangles + list_squares
+        if width is None:
+            width = max([s.x + s.width for s in shapes], default=1)
+        if height is None:
+            height = max([s.y + s.height for s in shapes], default=1)
+        raster = Raster(width, height, "#b7312c")
+        raster.fill_all(list_rectangles, "#ffffff")
+        raster.fill_all(list_squares, "#b5e3d8")
+        raster.save(filename)
+        return raster
@@ -0,0 +1,226 @@
+#!/usr/bin/python3
+"""Defines columnar batch containers for Rectangles and Squares."""
+from array import array
+from operator import add, mul
+from models.base import Base
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class RectangleBatch:
+    """Represent many Rectangles stored column by column.
+
+    Every attribute lives in its own contiguous array of 64-bit ints, so a
+    shape costs a few dozen bytes instead of a full Python object. Columns
+    are validated as a whole and Rectangle instances are only built when
+    an item is accessed.
+
+    Class Attributes:
+        shape (type): The class materialized by item access.
+        fields (tuple): Column names, in `to_dictionary` order.
+    """
+
+    shape = Rectangle
+    fields = ("id", "width", "height", "x", "y")
+    _aliases = {}
+    _area_fields = ("width", "height")
+
+    def __init__(self, width=(), height=(), x=None, y=None, id=None):
+        """Initialize a new RectangleBatch.
+
+        Args:
+            width (iterable): The widths of the Rectangles.
+            height (iterable): The heights of the Rectangles.
+            x (iterable): The x coordinates. Defaults to all 0.
+            y (iterable): The y coordinates. Defaults to all 0.
+            id (iterable): The identities. Defaults to fresh Base ids.
+        Raises:
+            TypeError: If a value is not an int.
+            ValueError: If a value is out of range, or if the columns
+                have different lengths.
+        """
+        self._set_columns(id=id, width=width, height=height, x=x, y=y)
+
+    def _set_columns(self, **columns):
+        """Validate and store columns, filling in x, y and id defaults."""
+        self._columns = {}
+        for name in self.fields:
+            values = columns[name]
+            if values is not None:
+                self._columns[name] = self._as_column(name, values)
+        lengths = {len(c) for c in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("columns must have the same length")
+        size = lengths.pop() if lengths else 0
+        for name in self.fields:
+            if name not in self._columns:
+                if name == "id":
+                    ids = Base._reserve_ids(size)
+                    self._columns[name] = array("q", ids)
+                else:
+                    self._columns[name] = array("q", bytes(8 * size))
+
+    def _as_column(self, name, values):
+        """Return `values` as a validated array of 64-bit ints.
+
+        Args:
+            name (str): The name of the column being validated.
+            values (iterable): The values of the column.
+        Raises:
+            TypeError: If a value is not an int.
+            ValueError: If a value breaks the shape's rule for the column.
+        """
+        if values is None:
+            return None
+        rule = self.shape._fields.get(name)
+        if rule is not None:
+            message = rule.type_message
+        else:
+            message = "{} must be an integer".format(name)
+        if isinstance(values, array):
+            if values.typecode not in "bBhHiIlLqQ":
+                raise TypeError(message)
+        else:
+            values = values if isinstance(values, list) else list(values)
+            if set(map(type, values)) - {int}:
+                raise TypeError(message)
+        column = array("q", values)
+        if rule is not None and column and min(column) < rule.minimum:
+            raise ValueError(rule.value_message)
+        return column
+
+    @classmethod
+    def from_shapes(cls, shapes):
+        """Return a batch holding the attributes of existing shapes.
+
+        Args:
+            shapes (iterable): Instances of the batch's shape class.
+        """
+        new = cls.__new__(cls)
+        new._columns = {name: array("q") for name in cls.fields}
+        new.extend(shapes)
+        return new
+
+    def column(self, name):
+        """Return the array backing a column.
+
+        Args:
+            name (str): The column name. Squares also accept `width` and
+                `height` as names for their `size` column.
+        """
+        return self._columns[self._aliases.get(name, name)]
+
+    def append(self, shape):
+        """Append the attributes of a shape to the batch.
+
+        Args:
+            shape (Rectangle): An instance of the batch's shape class.
+        """
+        for name in self.fields:
+            self._columns[name].append(getattr(shape, name))
+
+    def extend(self, shapes):
+        """Append the attributes of many shapes to the batch.
+
+        Args:
+            shapes (iterable): Instances of the batch's shape class.
+        """
+        for shape in shapes:
+            self.append(shape)
+
+    def area(self):
+        """Return an array of the area of every shape in the batch."""
+        first, second = (self.column(f) for f in self._area_fields)
+        return array("q", map(mul, first, second))
+
+    def total_area(self):
+        """Return the sum of the areas of every shape in the batch."""
+        first, second = (self.column(f) for f in self._area_fields)
+        return sum(map(mul, first, second))
+
+    def bounds(self):
+        """Return the box covering every shape in the batch.
+
+        Returns:
+            None for an empty batch.
+            Otherwise - a tuple (x, y, width, height).
+        """
+        if not len(self):
+            return None
+        xs, ys = self.column("x"), self.column("y")
+        x0, y0 = min(xs), min(ys)
+        x1 = max(map(add, xs, self.column("width")))
+        y1 = max(map(add, ys, self.column("height")))
+        return (x0, y0, x1 - x0, y1 - y0)
+
+    def __len__(self):
+        """Return the number of shapes in the batch."""
+        return len(self._columns["id"])
+
+    def __getitem__(self, index):
+        """Return a shape (or a batch, for a slice) built from the columns.
+
+        Args:
+            index (int or slice): The position of the shape(s).
+        """
+        if isinstance(index, slice):
+            new = self.__class__.__new__(self.__class__)
+            new._columns = {name: column[index]
+                            for name, column in self._columns.items()}
+            return new
+        return self.shape(**{name: column[index]
+                             for name, column in self._columns.items()})
+
+    def __setitem__(self, index, shape):
+        """Overwrite the attributes stored at a position with a shape's.
+
+        Args:
+            index (int): The position to overwrite.
+            shape (Rectangle): An instance of the batch's shape class.
+        """
+        for name in self.fields:
+            self._columns[name][index] = getattr(shape, name)
+
+    def __iter__(self):
+        """Yield a shape built from each row of the batch."""
+        for index in range(len(self)):
+            yield self[index]
+
+
+class SquareBatch(RectangleBatch):
+    """Represent many Squares stored column by column."""
+
+    shape = Square
+    fields = ("id", "size", "x", "y")
+    _aliases = {"width": "size", "height": "size"}
+    _area_fields = ("size", "size")
+
+    def __init__(self, size=(), x=None, y=None, id=None):
+        """Initialize a new SquareBatch.
+
+        Args:
+            size (iterable): The sizes of the Squares.
+            x (iterable): The x coordinates. Defaults to all 0.
+            y (iterable): The y coordinates. Defaults to all 0.
+            id (iterable): The identities. Defaults to fresh Base ids.
+        Raises:
+            TypeError: If a value is not an int.
+            ValueError: If a value is out of range, or if the columns
+                have different lengths.
+        """
+        self._set_columns(id=id, size=size, x=x, y=y)
+
+
+def batch_class(cls):
+    """Return the batch type whose columns match the fields of `cls`.
+
+    Args:
+        cls (type): A Base subclass, such as Rectangle or CompactSquare.
+    Raises:
+        ValueError: If no batch type stores the fields of `cls`.
+    """
+    fields = tuple(cls._field_names())
+    for batch_cls in (RectangleBatch, SquareBatch):
+        if batch_cls.fields == fields:
+            return batch_cls
+    raise ValueError("no batch type for {}".format(cls.__name__))
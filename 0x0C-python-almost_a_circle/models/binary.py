@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+"""Defines a fixed-width binary file format for Base instances."""
+import mmap
+import struct
+
+
+class ShapeFile:
+    """Represent a memory-mapped file of fixed-width shape records.
+
+    The file starts with a header holding a magic number and the length
+    of a descriptor such as `Rectangle:id,width,height,x,y`, padded to a
+    multiple of 8 bytes. Each record that follows is one little-endian
+    64-bit int per field, so record N lives at a known offset and can be
+    decoded without touching the rest of the file.
+
+    Class Attributes:
+        MAGIC (bytes): The bytes every binary shape file starts with.
+    """
+
+    MAGIC = b"0x0C"
+    _header = struct.Struct("<4sI")
+
+    def __init__(self, cls, filename):
+        """Map a binary shape file for random access.
+
+        Args:
+            cls (type): The Base subclass stored in the file.
+            filename (str): The path of the file.
+        Raises:
+            IOError: If the file cannot be opened.
+            ValueError: If the file is not a binary file of `cls` records.
+        """
+        with open(filename, "rb") as binfile:
+            self._buf = mmap.mmap(binfile.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        try:
+            name, fields, offset = self._read_header(self._buf)
+        except ValueError:
+            self._buf.close()
+            raise
+        if name != cls.__name__:
+            self._buf.close()
+            raise ValueError("file holds {} records".format(name))
+        self.cls = cls
+        self.fields = fields
+        self._record = struct.Struct("<{}q".format(len(fields)))
+        self._offset = offset
+        self._len = (len(self._buf) - offset) // self._record.size
+
+    @classmethod
+    def _read_header(cls, buf):
+        """Return the class name, field names and data offset of a file."""
+        if len(buf) < cls._header.size:
+            raise ValueError("not a binary shape file")
+        magic, length = cls._header.unpack_from(buf, 0)
+        if magic != cls.MAGIC:
+            raise ValueError("not a binary shape file")
+        start = cls._header.size
+        descriptor = bytes(buf[start:start + length]).decode("ascii")
+        name, fields = descriptor.split(":")
+        return name, fields.split(","), -(-(start + length) // 8) * 8
+
+    @classmethod
+    def write(cls, filename, name, fields, list_objs):
+        """Write objects to a binary shape file.
+
+        Args:
+            filename (str): The path of the file to write.
+            name (str): The class name recorded in the header.
+            fields (list): The `to_dictionary` keys stored per record.
+            list_objs (iterable): The objects to write.
+        Raises:
+            struct.error: If a value is not an int that fits in 64 bits.
+        """
+        descriptor = "{}:{}".format(name, ",".join(fields)).encode("ascii")
+        header = cls._header.pack(cls.MAGIC, len(descriptor)) + descriptor
+        header += bytes(-len(header) % 8)
+        pack = struct.Struct("<{}q".format(len(fields))).pack
+        with open(filename, "wb") as binfile:
+            binfile.write(header)
+            for obj in list_objs:
+                d = obj.to_dictionary()
+                binfile.write(pack(*[d[f] for f in fields]))
+
+    def record(self, index):
+        """Return the dictionary stored at a position without instantiating.
+
+        Args:
+            index (int): The position of the record.
+        Raises:
+            IndexError: If `index` is out of range.
+        """
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("record index out of range")
+        values = self._record.unpack_from(self._buf,
+                                          self._offset +
+                                          index * self._record.size)
+        return dict(zip(self.fields, values))
+
+    def close(self):
+        """Release the memory map."""
+        self._buf.close()
+
+    def __enter__(self):
+        """Return the ShapeFile itself for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Release the memory map on leaving a with statement."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of records in the file."""
+        return self._len
+
+    def __getitem__(self, index):
+        """Return the class instantiated from the record at a position.
+
+        Args:
+            index (int): The position of the record.
+        """
+        return self.cls.create(**self.record(index))
+
+    def __iter__(self):
+        """Yield the class instantiated from each record, in file order."""
+        for index in range(self._len):
+            yield self[index]
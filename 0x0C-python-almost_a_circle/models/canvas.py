@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+"""Defines a text canvas that draws many shapes at once."""
+
+
+def render_canvas(shapes, fill="#"):
+    """Return the drawing of many shapes composed onto one text canvas.
+
+    Each shape is drawn at its `x`/`y` offset the way `display` draws it,
+    by assigning whole row slices of a byte buffer. Later shapes are drawn
+    over earlier ones and trailing spaces are dropped from each line, so
+    a single shape renders exactly as `display` prints it.
+
+    Args:
+        shapes (iterable): Rectangles or Squares to draw.
+        fill (str): The single ASCII character to draw shapes with.
+    Raises:
+        ValueError: If fill is not a single ASCII character.
+    """
+    if len(fill) != 1 or not fill.isascii():
+        raise ValueError("fill must be a single ASCII character")
+    shapes = list(shapes)
+    if not shapes:
+        return ""
+    width = max(s.x + s.width for s in shapes)
+    height = max(s.y + s.height for s in shapes)
+    rows = [bytearray(b" " * width) for i in range(height)]
+    ink = fill.encode("ascii")
+    for s in shapes:
+        run = ink * s.width
+        for row in rows[s.y:s.y + s.height]:
+            row[s.x:s.x + s.width] = run
+    return "".join(row.rstrip().decode("ascii") + "\n" for row in rows)
+
+
+def display_canvas(shapes, fill="#", *, file=None):
+    """Print many shapes composed onto one text canvas in a single write.
+
+    Args:
+        shapes (iterable): Rectangles or Squares to draw.
+        fill (str): The single ASCII character to draw shapes with.
+        file (file): The stream to write to. Defaults to sys.stdout.
+    """
+    print(render_canvas(shapes, fill), end="", file=file)
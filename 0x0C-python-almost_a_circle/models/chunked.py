@@ -0,0 +1,225 @@
+#!/usr/bin/python3
+"""Defines a compressed, chunked file format for Base instances."""
+import bisect
+import gzip
+import itertools
+import lzma
+import operator
+import struct
+import sys
+import zlib
+from array import array
+
+
+class ChunkFile:
+    """Represent a file of shape records compressed in independent chunks.
+
+    The file starts with a magic number and a descriptor such as
+    `zlib:Rectangle:id,width,height,x,y`. Records follow in chunks: each
+    chunk stores its records column by column as little-endian 64-bit
+    ints and is compressed on its own with the codec. An index after the
+    last chunk gives the offset, size, record count and id range of every
+    chunk, so a reader only decompresses the chunks it needs.
+
+    Class Attributes:
+        MAGIC (bytes): The bytes every chunked shape file starts with.
+        CODECS (dict): The (compress, decompress) functions of each codec.
+    """
+
+    MAGIC = b"0xCZ"
+    CODECS = {
+        "gzip": (lambda data: gzip.compress(data, 6, mtime=0),
+                 gzip.decompress),
+        "zlib": (zlib.compress, zlib.decompress),
+        "lzma": (lzma.compress, lzma.decompress)
+    }
+    _header = struct.Struct("<4sI")
+    _entry = struct.Struct("<QIIqq")
+    _footer = struct.Struct("<QI4s")
+
+    def __init__(self, cls, filename):
+        """Open a chunked shape file and read its index.
+
+        Args:
+            cls (type): The Base subclass stored in the file.
+            filename (str): The path of the file.
+        Raises:
+            IOError: If the file cannot be opened.
+            ValueError: If the file is not a chunked file of `cls` records.
+        """
+        self._file = open(filename, "rb")
+        try:
+            self._read_index(cls)
+        except ValueError:
+            self._file.close()
+            raise
+        except (KeyError, struct.error):
+            self._file.close()
+            raise ValueError("not a chunked shape file") from None
+        self.cls = cls
+        self._chunk = (None, None)
+
+    def _read_index(self, cls):
+        """Read the header and chunk index of the open file."""
+        magic, length = self._header.unpack(
+            self._file.read(self._header.size))
+        if magic != self.MAGIC:
+            raise ValueError("not a chunked shape file")
+        codec, name, fields = self._file.read(length).decode(
+            "ascii").split(":")
+        if name != cls.__name__:
+            raise ValueError("file holds {} records".format(name))
+        self.codec = codec
+        self.fields = fields.split(",")
+        self._decompress = self.CODECS[codec][1]
+        self._file.seek(-self._footer.size, 2)
+        offset, count, magic = self._footer.unpack(
+            self._file.read(self._footer.size))
+        if magic != self.MAGIC:
+            raise ValueError("not a chunked shape file")
+        self._file.seek(offset)
+        data = self._file.read(count * self._entry.size)
+        self._index = list(self._entry.iter_unpack(data))
+        self._starts = list(itertools.accumulate(
+            (entry[2] for entry in self._index), initial=0))
+
+    @classmethod
+    def write(cls, filename, name, fields, list_objs, codec="zlib",
+              chunk_size=65536):
+        """Write objects to a chunked shape file.
+
+        Args:
+            filename (str): The path of the file to write.
+            name (str): The class name recorded in the header.
+            fields (list): The `to_dictionary` keys stored per record.
+            list_objs (iterable): The objects to write.
+            codec (str): "gzip", "zlib" or "lzma".
+            chunk_size (int): The number of records per chunk.
+        Raises:
+            ValueError: If codec is unknown or chunk_size <= 0.
+            OverflowError: If a value does not fit in 64 bits.
+        """
+        if codec not in cls.CODECS:
+            raise ValueError("codec must be one of {}".format(
+                ", ".join(sorted(cls.CODECS))))
+        if type(chunk_size) != int or chunk_size <= 0:
+            raise ValueError("chunk_size must be an integer > 0")
+        compress = cls.CODECS[codec][0]
+        descriptor = "{}:{}:{}".format(codec, name, ",".join(fields))
+        descriptor = descriptor.encode("ascii")
+        row = operator.attrgetter(*fields)
+        id_column = fields.index("id")
+        index = []
+        objs = iter(list_objs)
+        with open(filename, "wb") as chunkfile:
+            chunkfile.write(cls._header.pack(cls.MAGIC, len(descriptor)))
+            chunkfile.write(descriptor)
+            while True:
+                rows = list(map(row, itertools.islice(objs, chunk_size)))
+                if not rows:
+                    break
+                columns = [array("q", column) for column in zip(*rows)]
+                ids = columns[id_column]
+                if sys.byteorder == "big":
+                    for column in columns:
+                        column.byteswap()
+                data = compress(b"".join(map(bytes, columns)))
+                index.append((chunkfile.tell(), len(data), len(rows),
+                              min(ids), max(ids)))
+                chunkfile.write(data)
+            offset = chunkfile.tell()
+            for entry in index:
+                chunkfile.write(cls._entry.pack(*entry))
+            chunkfile.write(cls._footer.pack(offset, len(index), cls.MAGIC))
+
+    @property
+    def chunk_count(self):
+        """Get the number of chunks in the file."""
+        return len(self._index)
+
+    def columns(self, chunk):
+        """Return the decompressed columns of a chunk, by field name.
+
+        The last chunk read is cached.
+
+        Args:
+            chunk (int): The position of the chunk.
+        Raises:
+            IndexError: If `chunk` is out of range.
+        """
+        if self._chunk[0] != chunk:
+            offset, size, count = self._index[chunk][:3]
+            self._file.seek(offset)
+            values = array("q", self._decompress(self._file.read(size)))
+            if sys.byteorder == "big":
+                values.byteswap()
+            columns = {name: values[i * count:(i + 1) * count]
+                       for i, name in enumerate(self.fields)}
+            self._chunk = (chunk, columns)
+        return self._chunk[1]
+
+    def load_chunk(self, chunk):
+        """Return the classes instantiated from the records of a chunk.
+
+        Args:
+            chunk (int): The position of the chunk.
+        Raises:
+            IndexError: If `chunk` is out of range.
+        """
+        columns = self.columns(chunk)
+        return self.cls.create_many(
+            dict(zip(self.fields, row)) for row in zip(*columns.values()))
+
+    def find(self, shape_id):
+        """Return the class saved with a given id, or None.
+
+        Only the chunks whose id range holds `shape_id` are decompressed.
+
+        Args:
+            shape_id (int): The id to look for.
+        """
+        for chunk, entry in enumerate(self._index):
+            if entry[3] <= shape_id <= entry[4]:
+                ids = self.columns(chunk)["id"]
+                if shape_id in ids:
+                    return self[self._starts[chunk] + ids.index(shape_id)]
+        return None
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self):
+        """Return the ChunkFile itself for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the file on leaving a with statement."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of records in the file."""
+        return self._starts[-1]
+
+    def __getitem__(self, index):
+        """Return the class instantiated from the record at a position.
+
+        Args:
+            index (int): The position of the record.
+        Raises:
+            IndexError: If `index` is out of range.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        chunk = bisect.bisect_right(self._starts, index) - 1
+        columns = self.columns(chunk)
+        row = index - self._starts[chunk]
+        return self.cls.create(**{name: columns[name][row]
+                                  for name in self.fields})
+
+    def __iter__(self):
+        """Yield the class instantiated from each record, in file order."""
+        for chunk in range(self.chunk_count):
+            yield from self.load_chunk(chunk)
@@ -0,0 +1,261 @@
+#!/usr/bin/python3
+"""Defines a collection of shapes indexed by area and by id."""
+import bisect
+import itertools
+
+
+class ShapeCollection:
+    """Represent a set of shapes with a sorted area index and an id index.
+
+    Shapes are kept sorted by `area()` in a list of short sorted buckets,
+    so adding or removing a shape bisects to its bucket and shifts at
+    most `_load` * 2 entries, and the k largest or smallest shapes and
+    the shapes in an area range are found without a full sort. A dict
+    maps each `id` to its shape. Ids must be unique within a collection.
+
+    The indexes remember each shape's area and id when it was added.
+    A watching collection (`watch=True`) hooks the change tracker of
+    each class it holds (see `track_changes`), so any `update`, setter
+    or `set_fields` call on one of its shapes reindexes the shape. This
+    switches those classes to tracked setters and keeps the collection
+    referenced by them until `close`. Otherwise, mutate indexed shapes
+    through `update` or `set_fields`, or call `reindex` after changing
+    one directly.
+
+    Class Attributes:
+        _load (int): The bucket size at which buckets are split in two
+            halves.
+    """
+
+    _load = 512
+
+    def __init__(self, shapes=(), *, watch=False):
+        """Initialize a new ShapeCollection.
+
+        Args:
+            shapes (iterable): Rectangles or Squares to add.
+            watch (bool): Reindex shapes whenever they change.
+        """
+        self.watch = watch
+        self._keys = []
+        self._shapes = []
+        self._maxes = []
+        self._count = 0
+        self._entries = {}
+        self._by_id = {}
+        self._seq = 0
+        self._watched = set()
+        for shape in shapes:
+            self.add(shape)
+
+    @classmethod
+    def from_file(cls, shape_cls, *, watch=False):
+        """Return a collection of the shapes saved in `<shape_cls>.json`.
+
+        Args:
+            shape_cls (type): Rectangle or Square.
+            watch (bool): Reindex shapes whenever they change.
+        """
+        return cls(shape_cls.load_from_file_iter(), watch=watch)
+
+    def add(self, shape):
+        """Add a shape to the collection.
+
+        Args:
+            shape (Rectangle): The shape to add.
+        Raises:
+            ValueError: If the shape or another shape with its id is
+                already in the collection.
+        """
+        if id(shape) in self._entries:
+            raise ValueError("shape is already in the collection")
+        if shape.id in self._by_id:
+            raise ValueError("id {} is already in the collection"
+                             .format(shape.id))
+        if self.watch and type(shape) not in self._watched:
+            type(shape).track_changes(record=False).watch(self._changed)
+            self._watched.add(type(shape))
+        key = (shape.area(), self._seq)
+        self._seq += 1
+        self._insert(key, shape)
+        self._entries[id(shape)] = (key, shape.id)
+        self._by_id[shape.id] = shape
+
+    def _insert(self, key, shape):
+        """Insert a shape into the area index under a key."""
+        if not self._maxes:
+            self._keys.append([key])
+            self._shapes.append([shape])
+            self._maxes.append(key)
+            self._count = 1
+            return
+        i = min(bisect.bisect_left(self._maxes, key), len(self._maxes) - 1)
+        keys = self._keys[i]
+        j = bisect.bisect_left(keys, key)
+        keys.insert(j, key)
+        self._shapes[i].insert(j, shape)
+        self._maxes[i] = keys[-1]
+        self._count += 1
+        if len(keys) > 2 * self._load:
+            half = len(keys) // 2
+            shapes = self._shapes[i]
+            self._keys[i + 1:i + 1] = [keys[half:]]
+            self._shapes[i + 1:i + 1] = [shapes[half:]]
+            del keys[half:], shapes[half:]
+            self._maxes[i:i + 1] = [keys[-1], self._keys[i + 1][-1]]
+
+    def remove(self, shape):
+        """Remove a shape from the collection.
+
+        Args:
+            shape (Rectangle): The shape to remove.
+        Raises:
+            KeyError: If the shape is not in the collection.
+        """
+        key, shape_id = self._entries.pop(id(shape))
+        i = bisect.bisect_left(self._maxes, key)
+        keys = self._keys[i]
+        j = bisect.bisect_left(keys, key)
+        del keys[j], self._shapes[i][j]
+        if keys:
+            self._maxes[i] = keys[-1]
+        else:
+            del self._keys[i], self._shapes[i], self._maxes[i]
+        self._count -= 1
+        del self._by_id[shape_id]
+
+    def reindex(self, shape):
+        """Move a shape to match its current area and id.
+
+        Args:
+            shape (Rectangle): A shape in the collection.
+        Raises:
+            KeyError: If the shape is not in the collection.
+            ValueError: If another shape in the collection has its id.
+                The shape is left out of the collection.
+        """
+        self.remove(shape)
+        self.add(shape)
+
+    def _changed(self, shape):
+        """Reindex a shape of a watched class if it is in the collection.
+
+        Raises:
+            ValueError: If another shape in the collection has its new
+                id. The shape is left out of the collection.
+        """
+        if id(shape) in self._entries:
+            self.reindex(shape)
+
+    def _mutate(self, shape, method, args, kwargs):
+        """Apply a mutating method to a shape and reindex it.
+
+        If the new id clashes with another shape, the change is undone.
+        """
+        old = shape.to_dictionary()
+        self.remove(shape)
+        try:
+            getattr(shape, method)(*args, **kwargs)
+            self.add(shape)
+        except BaseException:
+            if id(shape) in self._entries:
+                self.remove(shape)
+            shape.update(**old)
+            self.add(shape)
+            raise
+
+    def update(self, shape, *args, **kwargs):
+        """Call `shape.update(*args, **kwargs)` and reindex the shape.
+
+        Args:
+            shape (Rectangle): A shape in the collection.
+            *args, **kwargs: Passed to `shape.update`.
+        Raises:
+            KeyError: If the shape is not in the collection.
+            ValueError: If the new id belongs to another shape in the
+                collection. The shape is left unchanged.
+        """
+        self._mutate(shape, "update", args, kwargs)
+
+    def set_fields(self, shape, **fields):
+        """Call `shape.set_fields(**fields)` and reindex the shape.
+
+        Args:
+            shape (Rectangle): A shape in the collection.
+            **fields: Passed to `shape.set_fields`.
+        Raises:
+            KeyError: If the shape is not in the collection.
+        """
+        self._mutate(shape, "set_fields", (), fields)
+
+    def get(self, shape_id, default=None):
+        """Return the shape with the given id, or default if there is none.
+
+        Args:
+            shape_id (int): The id to look up.
+            default: The value returned when no shape has that id.
+        """
+        return self._by_id.get(shape_id, default)
+
+    def largest(self, k):
+        """Return the k shapes with the largest area, largest first."""
+        found = []
+        for shapes in reversed(self._shapes):
+            if len(found) >= k:
+                break
+            found.extend(shapes[:-(k - len(found)) - 1:-1])
+        return found
+
+    def smallest(self, k):
+        """Return the k shapes with the smallest area, smallest first."""
+        found = []
+        for shapes in self._shapes:
+            if len(found) >= k:
+                break
+            found.extend(shapes[:k - len(found)])
+        return found
+
+    def area_range(self, low, high):
+        """Return the shapes with low <= area() <= high, smallest first.
+
+        Args:
+            low (int): The smallest area to return.
+            high (int): The largest area to return.
+        """
+        found = []
+        first = bisect.bisect_left(self._maxes, (low,))
+        for i in range(first, len(self._maxes)):
+            keys = self._keys[i]
+            lo = bisect.bisect_left(keys, (low,)) if i == first else 0
+            hi = bisect.bisect_right(keys, (high, float("inf")))
+            found.extend(self._shapes[i][lo:hi])
+            if hi < len(keys):
+                break
+        return found
+
+    def close(self):
+        """Stop watching the classes of the collection's shapes."""
+        for cls in self._watched:
+            cls._tracker.unwatch(self._changed)
+        self._watched.clear()
+        self.watch = False
+
+    def __enter__(self):
+        """Return the collection itself for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop watching on leaving a with statement."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of shapes in the collection."""
+        return self._count
+
+    def __contains__(self, shape):
+        """Return True if the shape is in the collection."""
+        return id(shape) in self._entries
+
+    def __iter__(self):
+        """Iterate over the shapes, smallest area first."""
+        return iter(list(itertools.chain.from_iterable(self._shapes)))
@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+"""Defines compact, __slots__-based rectangle and square classes."""
+from models.rectangle import RectangleBase
+from models.square import SquareBase
+
+
+class CompactRectangle(RectangleBase):
+    """Represent a rectangle without a per-instance `__dict__`.
+
+    Attributes are stored in slots under the private names Rectangle's
+    properties use, and everything else is inherited from RectangleBase.
+    Instances behave like Rectangles but are not Rectangle instances and
+    are saved to `CompactRectangle.*` files.
+    """
+
+    __slots__ = ("_Rectangle__width", "_Rectangle__height",
+                 "_Rectangle__x", "_Rectangle__y")
+
+
+class CompactSquare(SquareBase, CompactRectangle):
+    """Represent a square without a per-instance `__dict__`."""
+
+    __slots__ = ()
@@ -0,0 +1,154 @@
+#!/usr/bin/python3
+"""Defines opt-in geometric equality and deduplication of saved shapes."""
+import csv
+import json
+import os
+import struct
+from models.base import Base
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class GeometryMixin:
+    """Make shapes compare and hash by (width, height, x, y).
+
+    Mix in before Rectangle or Square to opt in. The id is ignored, and a
+    Rectangle and a Square with the same geometry are equal. Changing
+    the geometry of a shape held in a set or as a dict key breaks that
+    set or dict, as for any mutable value-hashed object.
+    """
+
+    __slots__ = ()
+
+    def geometry(self):
+        """Return the (width, height, x, y) tuple shapes are compared by."""
+        return (self.width, self.height, self.x, self.y)
+
+    def __eq__(self, other):
+        """Return True if other has the same geometry."""
+        if not isinstance(other, GeometryMixin):
+            return NotImplemented
+        return self.geometry() == other.geometry()
+
+    def __hash__(self):
+        """Return the hash of the geometry."""
+        return hash(self.geometry())
+
+
+class HashableRectangle(GeometryMixin, Rectangle):
+    """Represent a rectangle that compares and hashes by geometry."""
+
+
+class HashableSquare(GeometryMixin, Square):
+    """Represent a square that compares and hashes by geometry."""
+
+
+def _record_key(fields):
+    """Return a function packing a record's geometry into 32 bytes."""
+    pack = struct.Struct("<4q").pack
+    if "size" in fields:
+        return lambda d: pack(d["size"], d["size"], d["x"], d["y"])
+    return lambda d: pack(d["width"], d["height"], d["x"], d["y"])
+
+
+def _iter_records(cls, fmt):
+    """Yield the dictionaries saved by cls, one at a time."""
+    filename = "{}.{}".format(cls.__name__, fmt)
+    fields = cls._field_names()
+    try:
+        datafile = open(filename, "r", newline="")
+    except IOError:
+        return
+    with datafile:
+        if fmt == "json":
+            yield from Base._iter_json_list(datafile)
+        else:
+            for row in csv.reader(datafile):
+                if row != ["[]"]:
+                    yield dict(zip(fields, map(int, row)))
+
+
+def iter_unique_records(cls, fmt="json"):
+    """Yield the saved dictionaries of cls, skipping repeated geometries.
+
+    The file is streamed and each geometry seen so far is kept as a
+    packed 32-byte key in a set, so memory grows with the number of
+    unique shapes and not with the size of the records. The first record
+    of each geometry is kept.
+
+    Args:
+        cls (type): Rectangle or Square.
+        fmt (str): "json" to read `<cls.__name__>.json` or "csv" to read
+            `<cls.__name__>.csv`.
+    Raises:
+        ValueError: If fmt is not "json" or "csv".
+    """
+    if fmt not in ("json", "csv"):
+        raise ValueError("fmt must be json or csv")
+    key = _record_key(cls._field_names())
+    seen = set()
+    for d in _iter_records(cls, fmt):
+        k = key(d)
+        if k not in seen:
+            seen.add(k)
+            yield d
+
+
+def load_unique(cls, fmt="json"):
+    """Return the shapes saved by cls, one per geometry.
+
+    Args:
+        cls (type): Rectangle or Square.
+        fmt (str): "json" or "csv".
+    """
+    return cls.create_many(iter_unique_records(cls, fmt))
+
+
+def dedup_file(cls, fmt="json"):
+    """Rewrite a saved file of cls keeping one shape per geometry.
+
+    The unique records are streamed to a temporary file that then
+    replaces the original. The temporary file is removed if reading or
+    writing fails, leaving the original untouched.
+
+    Args:
+        cls (type): Rectangle or Square.
+        fmt (str): "json" or "csv".
+    Returns:
+        If the file does not exist - 0, and nothing is written.
+        Otherwise - the number of records kept.
+    Raises:
+        ValueError: If fmt is not "json" or "csv".
+    """
+    if fmt not in ("json", "csv"):
+        raise ValueError("fmt must be json or csv")
+    filename = "{}.{}".format(cls.__name__, fmt)
+    if not os.path.exists(filename):
+        return 0
+    tmpname = filename + ".tmp"
+    kept = 0
+    try:
+        with open(tmpname, "w", newline="") as outfile:
+            if fmt == "json":
+                outfile.write("[")
+                for d in iter_unique_records(cls, fmt):
+                    outfile.write(", " if kept else "")
+                    outfile.write(json.dumps(d))
+                    kept += 1
+                outfile.write("]")
+            else:
+                fields = cls._field_names()
+                writer = csv.writer(outfile)
+                for d in iter_unique_records(cls, fmt):
+                    writer.writerow([d[f] for f in fields])
+                    kept += 1
+                if not kept:
+                    outfile.write("[]")
+        os.replace(tmpname, filename)
+    except BaseException:
+        try:
+            os.remove(tmpname)
+        except OSError:
+            pass
+        raise
+    return kept
@@ -0,0 +1,135 @@
+#!/usr/bin/python3
+"""Defines validated int attributes and updates compiled from tables."""
+from operator import attrgetter
+
+
+class IntField:
+    """Represent the validation rule of an int attribute.
+
+    A rule is declared once per attribute and turned into a property whose
+    setter is generated from source with the attribute names, limit and
+    error messages written in as constants, so each assignment runs the
+    same checks a hand-written setter would with no extra lookups.
+
+    Attributes:
+        name (str): The public name of the attribute.
+        minimum (int): The smallest value allowed.
+        attrs (tuple): The private attribute names a value is stored in.
+        type_message (str): The message of the TypeError for non-ints.
+        value_message (str): The message of the ValueError for values
+            below minimum.
+    """
+
+    def __init__(self, name, minimum, attrs, label=None):
+        """Initialize a new IntField.
+
+        Args:
+            name (str): The public name of the attribute.
+            minimum (int): The smallest value allowed.
+            attrs (str or tuple): The private attribute name(s) to store
+                a value in. The first one is read back by the getter.
+            label (str): The name used in error messages. Defaults to name.
+        Raises:
+            ValueError: If an attribute name is not an identifier.
+        """
+        if isinstance(attrs, str):
+            attrs = (attrs,)
+        if not all(attr.isidentifier() for attr in attrs):
+            raise ValueError("attrs must be identifiers")
+        label = label or name
+        self.name = name
+        self.minimum = minimum
+        self.attrs = attrs
+        self.type_message = "{} must be an integer".format(label)
+        if minimum > 0:
+            limit = "> {}".format(minimum - 1)
+        else:
+            limit = ">= {}".format(minimum)
+        self.value_message = "{} must be {}".format(label, limit)
+
+    def check(self, value):
+        """Raise if a value breaks the rule.
+
+        Args:
+            value (int): The value to check.
+        Raises:
+            TypeError: If value is not an int.
+            ValueError: If value < minimum.
+        """
+        if type(value) is not int:
+            raise TypeError(self.type_message)
+        if value < self.minimum:
+            raise ValueError(self.value_message)
+
+    def setter(self, tracked=False):
+        """Return a setter function that checks and stores a value.
+
+        Args:
+            tracked (bool): Also mark the instance in its class's
+                `_tracker`, when that is not None.
+        """
+        lines = ["def setter(self, value):",
+                 "    if type(value) is not int:",
+                 "        raise TypeError(type_message)",
+                 "    if value < minimum:",
+                 "        raise ValueError(value_message)"]
+        lines.extend("    self.{} = value".format(a) for a in self.attrs)
+        if tracked:
+            lines.extend(["    tracker = self._tracker",
+                          "    if tracker is not None:",
+                          "        tracker.mark(self)"])
+        namespace = {"type_message": self.type_message,
+                     "value_message": self.value_message,
+                     "minimum": self.minimum}
+        exec("\n".join(lines), namespace)
+        return namespace["setter"]
+
+    def property(self, doc=None, tracked=False):
+        """Return a property reading and validating the attribute.
+
+        Args:
+            doc (str): The docstring of the property.
+            tracked (bool): Generate a setter that marks changes.
+        """
+        return property(attrgetter(self.attrs[0]), self.setter(tracked),
+                        None, doc)
+
+
+def compile_update(order, doc=None):
+    """Return an `update` method generated from a table of attribute names.
+
+    Positional arguments are assigned in `order` and keyword arguments
+    are matched against it, with unknown keys ignored. The generated code
+    assigns each attribute directly, so an update costs one property set
+    per field. `id` is passed to `self._set_id` instead.
+
+    Args:
+        order (tuple): The attribute names, in positional order.
+        doc (str): The docstring of the method.
+    Raises:
+        ValueError: If a name is not an identifier.
+    """
+    if not all(name.isidentifier() for name in order):
+        raise ValueError("order must hold identifiers")
+
+    def assign(name, expr):
+        if name == "id":
+            return "self._set_id({})".format(expr)
+        return "self.{} = {}".format(name, expr)
+
+    lines = ["def update(self, *args, **kwargs):",
+             "    if args:",
+             "        n = len(args)"]
+    for i, name in enumerate(order):
+        lines.append("        if n > {}:".format(i))
+        lines.append("            " + assign(name, "args[{}]".format(i)))
+    lines.append("    elif kwargs:")
+    lines.append("        for name, value in kwargs.items():")
+    for i, name in enumerate(order):
+        lines.append('            {} name == "{}":'.format(
+            "if" if i == 0 else "elif", name))
+        lines.append("                " + assign(name, "value"))
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    namespace["update"].__doc__ = doc
+    return namespace["update"]
@@ -0,0 +1,214 @@
+#!/usr/bin/python3
+"""Defines an append-only journal for saving Base instances."""
+import json
+import os
+import threading
+from models.base import Base
+
+
+class Journal:
+    """Represent the saved objects of a class as a snapshot plus a journal.
+
+    The snapshot is `<cls.__name__>.json`, in the format written by
+    `save_to_file`. Changes made since the snapshot are appended to
+    `<cls.__name__>.journal`, one JSON line per change: `{"put": {...}}`
+    with an object's dictionary, or `{"del": id}`. Saving a change costs
+    one short append, whatever the number of saved objects.
+
+    Once `compact_every` changes have been appended, they are folded into
+    a new snapshot by a background thread. While that happens, the
+    changes being folded in live in `<cls.__name__>.journal.compacting`,
+    so a crash at any point leaves files that `load` still replays. If a
+    background compaction fails, its error is raised by the next `put`,
+    `delete`, `wait` or `close`, and the changes stay pending so a later
+    compaction retries.
+    """
+
+    def __init__(self, cls, compact_every=10000):
+        """Open the journal of a class.
+
+        Args:
+            cls (type): The Base subclass whose objects are saved.
+            compact_every (int): Number of appended changes that triggers
+                a background compaction. 0 disables it.
+        """
+        self.cls = cls
+        self.compact_every = compact_every
+        self.snapshot = cls.__name__ + ".json"
+        self.filename = cls.__name__ + ".journal"
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._compactor = None
+        self._error = None
+        self._pending = 0
+        for filename in (self.filename + ".compacting", self.filename):
+            try:
+                with open(filename, "r") as journal:
+                    self._pending += sum(1 for line in journal)
+            except IOError:
+                pass
+        self._file = open(self.filename, "a")
+
+    def put(self, *objs):
+        """Record that objects were created or updated.
+
+        Args:
+            *objs (Base): The objects to save.
+        """
+        self._append('{{"put": {}}}\n'.format(json.dumps(o.to_dictionary()))
+                     for o in objs)
+
+    def delete(self, *objs):
+        """Record that objects were deleted.
+
+        Args:
+            *objs (Base or int): The objects, or ids, to delete.
+        """
+        self._append('{{"del": {}}}\n'.format(
+            json.dumps(getattr(o, "id", o))) for o in objs)
+
+    def _append(self, lines):
+        """Append journal lines and start a compaction if one is due.
+
+        Raises:
+            Exception: The error of a failed background compaction. The
+                lines are not appended.
+        """
+        with self._lock:
+            self._raise_error()
+            count = 0
+            for line in lines:
+                self._file.write(line)
+                count += 1
+            self._file.flush()
+            self._pending += count
+            due = (self.compact_every and
+                   self._pending >= self.compact_every and
+                   (self._compactor is None or
+                    not self._compactor.is_alive()))
+            if due:
+                self._compactor = threading.Thread(
+                    target=self._compact_in_background, daemon=True)
+                self._compactor.start()
+
+    def _compact_in_background(self):
+        """Run `compact`, keeping its error for `_raise_error`."""
+        try:
+            self.compact()
+        except BaseException as e:
+            self._error = e
+
+    def _raise_error(self):
+        """Raise, once, the error of a failed background compaction."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _records(self, journals):
+        """Return the saved dictionaries keyed by id, in saved order.
+
+        Args:
+            journals (tuple): The journal files to replay on the snapshot.
+        """
+        records = {}
+        try:
+            with open(self.snapshot, "r") as jsonfile:
+                for d in Base._iter_json_list(jsonfile):
+                    records[d.get("id")] = d
+        except IOError:
+            pass
+        for filename in journals:
+            try:
+                with open(filename, "r") as journal:
+                    for line in journal:
+                        change = json.loads(line)
+                        if "put" in change:
+                            records[change["put"].get("id")] = change["put"]
+                        else:
+                            records.pop(change["del"], None)
+            except IOError:
+                pass
+        return records
+
+    def load(self):
+        """Return the saved objects, with every journaled change applied."""
+        with self._lock:
+            records = self._records((self.filename + ".compacting",
+                                     self.filename))
+        return self.cls.create_many(records.values())
+
+    def compact(self):
+        """Fold the journaled changes into a new snapshot.
+
+        Changes appended while the snapshot is being written go to a new
+        journal and are kept. If writing the snapshot fails, the folded
+        changes stay in the `.compacting` file and are still pending.
+        """
+        compacting = self.filename + ".compacting"
+        tmpname = self.snapshot + ".tmp"
+        with self._compact_lock:
+            with self._lock:
+                self._file.close()
+                try:
+                    if os.path.exists(compacting):
+                        with open(self.filename, "r") as journal, \
+                                open(compacting, "a") as old:
+                            old.write(journal.read())
+                        os.remove(self.filename)
+                    else:
+                        os.replace(self.filename, compacting)
+                finally:
+                    self._file = open(self.filename, "a")
+                folded = self._pending
+            try:
+                records = self._records((compacting,))
+                with open(tmpname, "w") as jsonfile:
+                    jsonfile.write("[")
+                    sep = ""
+                    for d in records.values():
+                        jsonfile.write(sep)
+                        jsonfile.write(json.dumps(d))
+                        sep = ", "
+                    jsonfile.write("]")
+            except BaseException:
+                try:
+                    os.remove(tmpname)
+                except OSError:
+                    pass
+                raise
+            with self._lock:
+                os.replace(tmpname, self.snapshot)
+                os.remove(compacting)
+                self._pending -= folded
+
+    def wait(self):
+        """Block until a running background compaction has finished.
+
+        Raises:
+            Exception: The error of a failed background compaction.
+        """
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._lock:
+            self._raise_error()
+
+    def close(self):
+        """Wait for any background compaction and close the journal.
+
+        Raises:
+            Exception: The error of a failed background compaction. The
+                journal is closed anyway.
+        """
+        try:
+            self.wait()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        """Return the Journal itself for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the journal on leaving a with statement."""
+        self.close()
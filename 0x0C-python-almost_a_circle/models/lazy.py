@@ -0,0 +1,135 @@
+#!/usr/bin/python3
+"""Defines a lazily instantiated view of a JSON shape file."""
+import json
+import mmap
+import re
+from array import array
+
+
+class LazyShapeList:
+    """Represent the shapes of a JSON file, instantiated on access.
+
+    The file is memory-mapped and nothing is decoded on opening. Record
+    boundaries are found by scanning forward only as far as an access
+    needs, and their byte offsets are kept in compact arrays. A record is
+    decoded and passed to `create` the first time its shape is accessed,
+    and the shape is cached so later accesses return the same object.
+
+    The records written by `save_to_file` are flat objects of ints, so a
+    record runs from one `{` to the next `}`. Do not rewrite the file
+    while a LazyShapeList is open on it.
+    """
+
+    _record = re.compile(rb"{[^{}]*}")
+
+    def __init__(self, cls, filename):
+        """Map a JSON shape file for lazy access.
+
+        Args:
+            cls (type): The Base subclass stored in the file.
+            filename (str): The path of the file.
+        Raises:
+            IOError: If the file cannot be opened.
+        """
+        self.cls = cls
+        self._starts = array("q")
+        self._ends = array("q")
+        self._cache = {}
+        with open(filename, "rb") as jsonfile:
+            if jsonfile.seek(0, 2) == 0:
+                self._buf = None
+                self._scanner = iter(())
+                return
+            self._buf = mmap.mmap(jsonfile.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        self._scanner = self._record.finditer(self._buf)
+
+    def _scan(self, count=None):
+        """Find record boundaries until `count` records are known.
+
+        Scans to the end of the file if count is None.
+        """
+        starts, ends = self._starts, self._ends
+        for match in self._scanner:
+            starts.append(match.start())
+            ends.append(match.end())
+            if count is not None and len(starts) >= count:
+                return
+
+    def record(self, index):
+        """Return the dictionary stored at a position without instantiating.
+
+        Args:
+            index (int): The position of the record.
+        Raises:
+            IndexError: If `index` is out of range.
+        """
+        if index < 0:
+            self._scan()
+            index += len(self._starts)
+        elif index >= len(self._starts):
+            self._scan(index + 1)
+        if not 0 <= index < len(self._starts):
+            raise IndexError("record index out of range")
+        return json.loads(self._buf[self._starts[index]:self._ends[index]])
+
+    def close(self):
+        """Release the memory map."""
+        self._scanner = iter(())
+        if self._buf is not None:
+            self._buf.close()
+
+    def __enter__(self):
+        """Return the LazyShapeList itself for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Release the memory map on leaving a with statement."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of records in the file.
+
+        This scans the whole file the first time, without decoding it.
+        """
+        self._scan()
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        """Return the shape at a position, instantiating it on first access.
+
+        Args:
+            index (int or slice): The position of the shape, or a slice
+                returning a list of shapes.
+        Raises:
+            IndexError: If `index` is out of range.
+        """
+        if isinstance(index, slice):
+            if (index.stop is not None and index.stop >= 0 and
+                    (index.start or 0) >= 0 and (index.step or 1) > 0):
+                self._scan(index.stop)
+                known = len(self._starts)
+            else:
+                known = len(self)
+            return [self[i] for i in range(*index.indices(known))]
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("shape index out of range")
+        try:
+            return self._cache[index]
+        except KeyError:
+            shape = self.cls.create(**self.record(index))
+            self._cache[index] = shape
+            return shape
+
+    def __iter__(self):
+        """Yield the shapes in file order, scanning only as far as needed."""
+        index = 0
+        while True:
+            if index >= len(self._starts):
+                self._scan(index + 1)
+                if index >= len(self._starts):
+                    return
+            yield self[index]
+            index += 1
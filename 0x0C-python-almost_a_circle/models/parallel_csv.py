@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""Defines a multi-process loader for files written by save_to_file_csv."""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from models.batch import batch_class
+
+
+def parse_chunk(task):
+    """Return the ints of a range of CSV lines as one flat array.
+
+    Blank lines are skipped.
+
+    Args:
+        task (tuple): The file name, the start and end byte offsets of a
+            run of whole lines, and the number of fields per line.
+    Raises:
+        ValueError: If a line does not hold one int per field.
+    """
+    filename, start, end, width = task
+    with open(filename, "rb") as csvfile:
+        csvfile.seek(start)
+        data = csvfile.read(end - start)
+    lines = [line for line in data.split(b"\n") if line.strip()]
+    for line in lines:
+        if line.count(b",") != width - 1:
+            raise ValueError("expected {} fields per line, got {!r}"
+                             .format(width, line.strip().decode()))
+    if not lines:
+        return array("q")
+    return array("q", map(int, b",".join(lines).split(b",")))
+
+
+def chunk_bounds(filename, chunk_size):
+    """Return (start, end) byte offsets splitting a file at line breaks.
+
+    Args:
+        filename (str): The path of the file to split.
+        chunk_size (int): The approximate number of bytes per chunk.
+    """
+    size = os.path.getsize(filename)
+    bounds = []
+    start = 0
+    with open(filename, "rb") as csvfile:
+        while start < size:
+            csvfile.seek(min(start + chunk_size, size))
+            csvfile.readline()
+            end = min(csvfile.tell(), size)
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def load_from_file_csv_parallel(cls, workers=None, as_batch=False,
+                                chunk_size=1 << 22):
+    """Return the classes saved in `<cls.__name__>.csv`, parsed in parallel.
+
+    The file is split at line breaks into chunks that a pool of processes
+    parses into flat arrays of ints. Results are joined in file order.
+    Blank lines are skipped.
+
+    Args:
+        cls (type): Rectangle or Square.
+        workers (int): Number of worker processes. Defaults to the number
+            of CPUs.
+        as_batch (bool): Return a RectangleBatch or SquareBatch instead
+            of instantiating each class.
+        chunk_size (int): The approximate number of bytes per chunk.
+    Returns:
+        If the file does not exist - an empty list.
+        Otherwise - a list of instantiated classes, or a batch.
+    Raises:
+        ValueError: If a line does not hold one int per field.
+    """
+    filename = cls.__name__ + ".csv"
+    fields = cls._field_names()
+    try:
+        with open(filename, "rb") as csvfile:
+            empty = csvfile.read(3).strip() in (b"", b"[]")
+    except IOError:
+        return []
+    if empty:
+        values = array("q")
+    else:
+        tasks = [(filename, start, end, len(fields))
+                 for start, end in chunk_bounds(filename, chunk_size)]
+        values = array("q")
+        with ProcessPoolExecutor(workers) as pool:
+            for chunk in pool.map(parse_chunk, tasks):
+                values.extend(chunk)
+    columns = {name: values[i::len(fields)] for i, name in enumerate(fields)}
+    if as_batch:
+        return batch_class(cls)(**columns)
+    return cls.create_many(dict(zip(fields, row))
+                           for row in zip(*columns.values()))
@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+"""Defines a free list that recycles instances of a Base subclass."""
+import inspect
+from contextlib import contextmanager
+from models.base import Base
+
+
+def _compile_reset(cls):
+    """Return a function reinitializing an instance of cls in place.
+
+    The function takes the arguments of `cls.__init__` and is generated
+    from `cls._fields`, so it checks every value with its field's `check`
+    and then stores it straight into its private attributes. A missing
+    id is taken from `Base._reserve_ids`. A tracked instance is marked
+    like `_set_id` does, so its tracker remembers the id it had.
+
+    Returns:
+        None if a constructor argument is neither a field nor `id`, or
+        if cls has no `_fields`. Otherwise - the reset function.
+    """
+    fields = getattr(cls, "_fields", None)
+    params = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    if fields is None or not all(
+            p.name == "id" or p.name in fields for p in params) or \
+            any(p.kind not in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+                for p in params):
+        return None
+    namespace = {"reserve": Base._reserve_ids}
+    args = []
+    for p in params:
+        if p.default is p.empty:
+            args.append(p.name)
+        else:
+            namespace["d_" + p.name] = p.default
+            args.append("{0}=d_{0}".format(p.name))
+    lines = ["def reset(self, {}):".format(", ".join(args))]
+    stores = []
+    for p in params:
+        if p.name == "id":
+            continue
+        field = fields[p.name]
+        namespace["check_" + p.name] = field.check
+        lines.append("    check_{0}({0})".format(p.name))
+        stores.extend("    self.{} = {}".format(attr, p.name)
+                      for attr in field.attrs)
+    lines.extend(["    tracker = self._tracker",
+                  "    if tracker is not None:",
+                  "        tracker.mark_id(self)"])
+    lines.extend(stores)
+    if "id" in (p.name for p in params):
+        lines.extend(["    if id is None:",
+                      "        id = reserve(1)[0]",
+                      "    self.id = id"])
+    else:
+        lines.append("    self.id = reserve(1)[0]")
+    lines.extend(["    if tracker is not None:",
+                  "        tracker.mark(self)"])
+    exec("\n".join(lines), namespace)
+    return namespace["reset"]
+
+
+class ShapePool:
+    """Represent a pool of released instances of one class.
+
+    `acquire` takes the constructor's arguments. It reinitializes a
+    released instance in place when there is one, and builds a new one
+    otherwise, so a workload that keeps creating and discarding shapes
+    reuses the same objects instead of allocating and freeing them.
+
+    A released instance is reset by a function generated from the
+    class's `_fields`, which checks the arguments like the constructor
+    does and stores them without going through the property setters.
+    Classes whose constructor takes anything else are reset by calling
+    `__init__` again. Either way, a shape without an explicit id gets a
+    fresh one from the same counter as every other Base, so a recycled
+    shape never reuses an old id.
+
+    Attributes:
+        cls (type): The class of the pooled instances.
+        maxsize (int): The most released instances kept for reuse.
+    """
+
+    def __init__(self, cls, maxsize=1024):
+        """Initialize a new, empty ShapePool.
+
+        Args:
+            cls (type): The Base subclass to pool.
+            maxsize (int): The most released instances kept for reuse.
+        Raises:
+            TypeError: If maxsize is not an integer.
+            ValueError: If maxsize < 0.
+        """
+        if type(maxsize) != int:
+            raise TypeError("maxsize must be an integer")
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.cls = cls
+        self.maxsize = maxsize
+        self._reset = _compile_reset(cls) or cls.__init__
+        self._free = {}
+
+    def acquire(self, *args, **kwargs):
+        """Return an instance initialized with the constructor's arguments.
+
+        Args:
+            *args, **kwargs: The arguments of `cls`.
+        Raises:
+            TypeError, ValueError: As raised by `cls` for bad arguments.
+                The reused instance is then dropped from the pool.
+        """
+        if not self._free:
+            return self.cls(*args, **kwargs)
+        obj = self._free.popitem()[1]
+        self._reset(obj, *args, **kwargs)
+        return obj
+
+    def release(self, *objs):
+        """Return instances to the pool for reuse.
+
+        The caller must not use an instance after releasing it. Instances
+        beyond `maxsize` are left to the garbage collector.
+
+        Args:
+            *objs (Base): The instances to release.
+        Raises:
+            TypeError: If an object is not exactly of class `cls`.
+            ValueError: If an object is already in the pool.
+        """
+        free = self._free
+        for obj in objs:
+            if type(obj) is not self.cls:
+                raise TypeError("can only release {} instances".format(
+                    self.cls.__name__))
+            if id(obj) in free:
+                raise ValueError("object is already released")
+            if len(free) < self.maxsize:
+                free[id(obj)] = obj
+
+    @contextmanager
+    def borrowed(self, *args, **kwargs):
+        """Acquire an instance for the duration of a with statement.
+
+        Args:
+            *args, **kwargs: The arguments of `cls`.
+        """
+        obj = self.acquire(*args, **kwargs)
+        try:
+            yield obj
+        finally:
+            self.release(obj)
+
+    def clear(self):
+        """Drop every released instance."""
+        self._free.clear()
+
+    def __len__(self):
+        """Return the number of released instances ready for reuse."""
+        return len(self._free)
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+"""Defines aggregate queries over saved Rectangles and Squares."""
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from functools import partial
+from operator import itemgetter
+from models.base import Base
+from models.batch import batch_class
+from models.parallel_csv import chunk_bounds, parse_chunk
+
+
+def load_batch(cls, fmt="json"):
+    """Return the shapes saved by `cls` as a columnar batch.
+
+    Records are parsed straight into columns; no Rectangle or Square is
+    instantiated.
+
+    Args:
+        cls (type): Rectangle or Square.
+        fmt (str): "json" to read `<cls.__name__>.json` or "csv" to read
+            `<cls.__name__>.csv`.
+    Returns:
+        A RectangleBatch or SquareBatch, empty if the file does not exist.
+    Raises:
+        ValueError: If fmt is not "json" or "csv", or a CSV line does not
+            hold one int per field.
+    """
+    if fmt not in ("json", "csv"):
+        raise ValueError("fmt must be json or csv")
+    fields = cls._field_names()
+    batch_cls = batch_class(cls)
+    filename = "{}.{}".format(cls.__name__, fmt)
+    values = array("q")
+    try:
+        if fmt == "json":
+            with open(filename, "r") as jsonfile:
+                row = itemgetter(*fields)
+                for d in Base._iter_json_list(jsonfile):
+                    values.extend(row(d))
+        else:
+            with open(filename, "rb") as csvfile:
+                empty = csvfile.read(3).strip() in (b"", b"[]")
+            if not empty:
+                for start, end in chunk_bounds(filename, 1 << 22):
+                    values.extend(parse_chunk((filename, start, end,
+                                               len(fields))))
+    except IOError:
+        pass
+    return batch_cls(**{name: values[i::len(fields)]
+                        for i, name in enumerate(fields)})
+
+
+def summarize(batch):
+    """Return aggregates over a batch of shapes.
+
+    Args:
+        batch (RectangleBatch): The shapes to aggregate.
+    Returns:
+        A dictionary with the `count` of shapes, the `total_area`,
+        `min_area` and `max_area`, and the `bounds` of the box covering
+        every shape as (x, y, width, height). Areas and bounds are None
+        for an empty batch.
+    """
+    areas = batch.area()
+    return {
+        "count": len(batch),
+        "total_area": sum(areas),
+        "min_area": min(areas, default=None),
+        "max_area": max(areas, default=None),
+        "bounds": batch.bounds()
+    }
+
+
+def histogram(values, edges):
+    """Return how many values fall between consecutive edges.
+
+    Args:
+        values (iterable): The ints to count, such as `batch.area()` or
+            `batch.column("width")`.
+        edges (list): Increasing bin edges. Bin i counts the values v with
+            `edges[i - 1] <= v < edges[i]`; bin 0 counts values below
+            `edges[0]` and the last bin values from `edges[-1]` up.
+    Returns:
+        A list of len(edges) + 1 counts.
+    """
+    counts = Counter(map(partial(bisect_right, edges), values))
+    return [counts[i] for i in range(len(edges) + 1)]
+
+
+def summarize_file(cls, fmt="json"):
+    """Return `summarize` of the shapes saved by `cls` in a file.
+
+    Args:
+        cls (type): Rectangle or Square.
+        fmt (str): "json" or "csv".
+    """
+    return summarize(load_batch(cls, fmt))
@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+"""Defines an RGB pixel buffer that shapes are rasterized into."""
+import struct
+import zlib
+
+
+class Raster:
+    """Represent an RGB image held in a single bytearray.
+
+    Shapes are filled a row slice at a time, so drawing cost grows with
+    the number of rows a shape covers rather than its number of pixels.
+    Pixel (x, y) is x pixels from the left and y pixels from the top, the
+    way `display` lays shapes out. The image can be written as a binary
+    PPM or a PNG with nothing but the standard library.
+    """
+
+    def __init__(self, width, height, background="#000000"):
+        """Initialize a new Raster.
+
+        Args:
+            width (int): The width of the image in pixels.
+            height (int): The height of the image in pixels.
+            background (str): The `#rrggbb` color of every pixel.
+        Raises:
+            TypeError: If either of width or height is not an int.
+            ValueError: If either of width or height <= 0, or if
+                background is not a `#rrggbb` color.
+        """
+        for name, value in (("width", width), ("height", height)):
+            if type(value) != int:
+                raise TypeError("{} must be an integer".format(name))
+            if value <= 0:
+                raise ValueError("{} must be > 0".format(name))
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(self._rgb(background) * (width * height))
+
+    @staticmethod
+    def _rgb(color):
+        """Return the three bytes of a `#rrggbb` color."""
+        if len(color) != 7 or color[0] != "#":
+            raise ValueError("color must be a #rrggbb string")
+        return bytes.fromhex(color[1:])
+
+    def fill(self, shape, color):
+        """Fill the area covered by a shape, clipped to the image.
+
+        Args:
+            shape (Rectangle): The shape to fill.
+            color (str): The `#rrggbb` color to fill with.
+        """
+        self.fill_all([shape], color)
+
+    def fill_all(self, shapes, color):
+        """Fill the areas covered by many shapes with one color.
+
+        Args:
+            shapes (iterable): The shapes to fill.
+            color (str): The `#rrggbb` color to fill with.
+        """
+        rgb = self._rgb(color)
+        pixels = self.pixels
+        width, height = self.width, self.height
+        stride = width * 3
+        for shape in shapes:
+            x0, x1 = max(shape.x, 0), min(shape.x + shape.width, width)
+            y0, y1 = max(shape.y, 0), min(shape.y + shape.height, height)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            run = rgb * (x1 - x0)
+            size = len(run)
+            for start in range(y0 * stride + x0 * 3, y1 * stride, stride):
+                pixels[start:start + size] = run
+
+    def to_ppm(self):
+        """Return the image encoded as a binary (P6) PPM file."""
+        header = "P6\n{} {}\n255\n".format(self.width, self.height)
+        return header.encode("ascii") + bytes(self.pixels)
+
+    def to_png(self):
+        """Return the image encoded as an 8-bit RGB PNG file."""
+        stride = self.width * 3
+        raw = b"".join(b"\x00" + self.pixels[i:i + stride]
+                       for i in range(0, len(self.pixels), stride))
+
+        def chunk(kind, data):
+            body = kind + data
+            return (struct.pack(">I", len(data)) + body +
+                    struct.pack(">I", zlib.crc32(body)))
+
+        header = struct.pack(">IIBBBBB", self.width, self.height,
+                             8, 2, 0, 0, 0)
+        return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) +
+                chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b""))
+
+    def save(self, filename):
+        """Write the image to a file, as PNG if its name ends in `.png`.
+
+        Args:
+            filename (str): The path of the file to write. Names ending
+                in `.png` get a PNG file, anything else a PPM file.
+        """
+        if filename.lower().endswith(".png"):
+            data = self.to_png()
+        else:
+            data = self.to_ppm()
+        with open(filename, "wb") as imgfile:
+            imgfile.write(data)
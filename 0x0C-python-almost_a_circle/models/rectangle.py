@@ -1,10 +1,37 @@
 #!/usr/bin/python3
 """Defines a rectangle class."""
 from models.base import Base
+from models.fields import IntField, compile_update
+from models.tracking import ChangeTracker
 
 
-class Rectangle(Base):
-    """Represent a rectangle."""
+class RectangleBase(Base):
+    """Represent the behaviour shared by every rectangle class.
+
+    The class has no slots of its own, so Rectangle keeps a per-instance
+    `__dict__` while CompactRectangle (see models/compact.py) adds slots
+    for the private attributes and no `__dict__`.
+
+    Class Attributes:
+        _fields (dict): The validation rule of each attribute, by name.
+        _tracker (ChangeTracker): The tracker set by `track_changes`, or
+            None.
+    """
+
+    _fields = {
+        "width": IntField("width", 1, "_Rectangle__width"),
+        "height": IntField("height", 1, "_Rectangle__height"),
+        "x": IntField("x", 0, "_Rectangle__x"),
+        "y": IntField("y", 0, "_Rectangle__y")
+    }
+
+    __slots__ = ()
+
+    width = _fields["width"].property("Set/get the width of the Rectangle.")
+    height = _fields["height"].property(
+        "Set/get the height of the Rectangle.")
+    x = _fields["x"].property("Set/get the x coordinate of the Rectangle.")
+    y = _fields["y"].property("Set/get the y coordinate of the Rectangle.")
 
     def __init__(self, width, height, x=0, y=0, id=None):
         """Initialize a new Rectangle.
@@ -27,76 +54,65 @@ class Rectangle(Base):
         self.y = y
         super().__init__(id)
 
-    @property
-    def width(self):
-        """Set/get the width of the Rectangle."""
-        return self.__width
-
-    @width.setter
-    def width(self, value):
-        if type(value) != int:
-            raise TypeError("width must be an integer")
-        if value <= 0:
-            raise ValueError("width must be > 0")
-        self.__width = value
-
-    @property
-    def height(self):
-        """Set/get the height of the Rectangle."""
-        return self.__height
-
-    @height.setter
-    def height(self, value):
-        if type(value) != int:
-            raise TypeError("height must be an integer")
-        if value <= 0:
-            raise ValueError("height must be > 0")
-        self.__height = value
-
-    @property
-    def x(self):
-        """Set/get the x coordinate of the Rectangle."""
-        return self.__x
-
-    @x.setter
-    def x(self, value):
-        if type(value) != int:
-            raise TypeError("x must be an integer")
-        if value < 0:
-            raise ValueError("x must be >= 0")
-        self.__x = value
-
-    @property
-    def y(self):
-        """Set/get the y coordinate of the Rectangle."""
-        return self.__y
-
-    @y.setter
-    def y(self, value):
-        if type(value) != int:
-            raise TypeError("y must be an integer")
-        if value < 0:
-            raise ValueError("y must be >= 0")
-        self.__y = value
+    def set_fields(self, **fields):
+        """Validate several attributes, then set them all.
+
+        Nothing is changed if any value is invalid.
+
+        Args:
+            **fields (dict): New values keyed by attribute name.
+        Raises:
+            TypeError: If a name is not a validated attribute, or if a
+                value is not an int.
+            ValueError: If a value is out of range.
+        """
+        rules = self._fields
+        for name, value in fields.items():
+            if name not in rules:
+                raise TypeError("unexpected field '{}'".format(name))
+            rules[name].check(value)
+        for name, value in fields.items():
+            for attr in rules[name].attrs:
+                setattr(self, attr, value)
+        if self._tracker is not None:
+            self._tracker.mark(self)
 
     def area(self):
         """Return the area of the Rectangle."""
         return self.width * self.height
 
-    def display(self):
-        """Print the Rectangle using the `#` character."""
-        if self.width == 0 or self.height == 0:
-            print("")
-            return
+    def render(self):
+        """Return the `#` drawing of the Rectangle as a string."""
+        row = " " * self.x + "#" * self.width + "\n"
+        return "\n" * self.y + row * self.height
 
-        [print("") for y in range(self.y)]
-        for h in range(self.height):
-            [print(" ", end="") for x in range(self.x)]
-            [print("#", end="") for w in range(self.width)]
-            print("")
+    def display(self, *, file=None):
+        """Print the Rectangle using the `#` character.
 
-    def update(self, *args, **kwargs):
-        """Update the Rectangle.
+        The drawing is built once and written in a single call.
+
+        Args:
+            file (file): The stream to write to. Defaults to sys.stdout.
+        """
+        print(self.render(), end="", file=file)
+
+    def _set_id(self, value):
+        """Set the id, or assign a fresh one if value is None."""
+        tracker = self._tracker
+        if tracker is not None:
+            tracker.mark_id(self)
+        if value is None:
+            self.id = Base._reserve_ids(1)[0]
+        else:
+            self.id = value
+        if tracker is not None:
+            tracker.mark(self)
+
+    _update_order = ("id", "width", "height", "x", "y")
+    update = compile_update(_update_order, """Update the Rectangle.
+
+        Generated from `_update_order`, so each attribute is set with a
+        single assignment.
 
         Args:
             *args (ints): New attribute values.
@@ -106,40 +122,62 @@ class Rectangle(Base):
                 - 4th argument represents x attribute
                 - 5th argument represents y attribute
             **kwargs (dict): New key/value pairs of attributes.
+        """)
+
+    @classmethod
+    def bulk_update(cls, objs, **changes):
+        """Apply the same keyword update to many shapes.
+
+        Every value is validated once, up front, and then stored directly
+        on each shape. An `id` of None gives each shape a fresh id.
+
+        Args:
+            objs (iterable): The shapes to update.
+            **changes (dict): New key/value pairs of attributes, as for
+                `update`. Unknown keys are ignored.
+        Raises:
+            TypeError: If a value is not an int.
+            ValueError: If a value is out of range.
         """
-        if args and len(args) != 0:
-            a = 0
-            for arg in args:
-                if a == 0:
-                    if arg is None:
-                        self.__init__(self.width, self.height, self.x, self.y)
-                    else:
-                        self.id = arg
-                elif a == 1:
-                    self.width = arg
-                elif a == 2:
-                    self.height = arg
-                elif a == 3:
-                    self.x = arg
-                elif a == 4:
-                    self.y = arg
-                a += 1
-
-        elif kwargs and len(kwargs) != 0:
-            for k, v in kwargs.items():
-                if k == "id":
-                    if v is None:
-                        self.__init__(self.width, self.height, self.x, self.y)
-                    else:
-                        self.id = v
-                elif k == "width":
-                    self.width = v
-                elif k == "height":
-                    self.height = v
-                elif k == "x":
-                    self.x = v
-                elif k == "y":
-                    self.y = v
+        stores = []
+        for name, value in changes.items():
+            if name in cls._fields and name in cls._update_order:
+                cls._fields[name].check(value)
+                stores.extend((attr, value)
+                              for attr in cls._fields[name].attrs)
+        new_id = "id" in changes
+        for obj in objs:
+            for attr, value in stores:
+                setattr(obj, attr, value)
+            if new_id:
+                obj._set_id(changes["id"])
+            elif obj._tracker is not None:
+                obj._tracker.mark(obj)
+
+    @classmethod
+    def track_changes(cls, *, record=True):
+        """Start recording which instances of the class change.
+
+        Replaces the class's attribute properties with ones whose setters
+        also mark the instance, so classes that are not tracked keep the
+        plain setters. Subclasses are not tracked unless they call this
+        themselves.
+
+        Args:
+            record (bool): Record the changed instances. False only sets
+                up the tracker for its watchers; a later call with True
+                turns recording on.
+        Returns:
+            The class's ChangeTracker, created on the first call.
+        """
+        if cls._tracker is None:
+            for name, field in cls._fields.items():
+                doc = getattr(cls, name).__doc__
+                setattr(cls, name, field.property(doc, tracked=True))
+            cls._tracker = ChangeTracker(record)
+        elif record:
+            cls._tracker.record = True
+        return cls._tracker
 
     def to_dictionary(self):
         """Return the dictionary representation of a Rectangle."""
@@ -156,3 +194,7 @@ class Rectangle(Base):
         return "[Rectangle] ({}) {}/{} - {}/{}".format(self.id,
                                                        self.x, self.y,
                                                        self.width, self.height)
+
+
+class Rectangle(RectangleBase):
+    """Represent a rectangle."""
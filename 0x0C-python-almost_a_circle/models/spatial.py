@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+"""Defines a uniform-grid spatial index over Rectangles and Squares."""
+
+
+class GridIndex:
+    """Represent a spatial index of shapes bucketed into square grid cells.
+
+    A shape covers the points with `x <= px < x + width` and
+    `y <= py < y + height`, which are the cells `display` fills.
+
+    Cells come in levels: level k has cells `cell_size << k` wide, and a
+    shape is listed in the cells it overlaps at the lowest level whose
+    cells are at least as large as the shape, so it is never listed in
+    more than four cells however large it is. A query looks at the cells
+    it overlaps on each level in use, i.e. only at shapes sharing a cell
+    with it.
+
+    The index remembers where each shape was when it was inserted. After
+    moving or resizing an indexed shape (for example with `update`),
+    call `move` so the index follows it.
+    """
+
+    def __init__(self, shapes=(), cell_size=64):
+        """Initialize a new GridIndex.
+
+        Args:
+            shapes (iterable): Rectangles or Squares to index.
+            cell_size (int): The width and height of a level 0 grid cell.
+        Raises:
+            TypeError: If cell_size is not an integer.
+            ValueError: If cell_size <= 0.
+        """
+        if type(cell_size) != int:
+            raise TypeError("cell_size must be an integer")
+        if cell_size <= 0:
+            raise ValueError("cell_size must be > 0")
+        self.cell_size = cell_size
+        self._cells = {}
+        self._bounds = {}
+        for shape in shapes:
+            self.insert(shape)
+
+    @classmethod
+    def from_file(cls, shape_cls, cell_size=64):
+        """Return an index of the shapes saved in `<shape_cls>.json`.
+
+        Args:
+            shape_cls (type): Rectangle or Square.
+            cell_size (int): The width and height of a level 0 grid cell.
+        """
+        return cls(shape_cls.load_from_file_iter(), cell_size)
+
+    def _level(self, x0, y0, x1, y1):
+        """Return the lowest level whose cells fit [x0, x1) x [y0, y1)."""
+        span = max(x1 - x0, y1 - y0)
+        return ((span - 1) // self.cell_size).bit_length()
+
+    @staticmethod
+    def _cell_keys(size, x0, y0, x1, y1):
+        """Yield the keys of the cells overlapping [x0, x1) x [y0, y1).
+
+        Args:
+            size (int): The width and height of the cells.
+        """
+        for cx in range(x0 // size, (x1 - 1) // size + 1):
+            for cy in range(y0 // size, (y1 - 1) // size + 1):
+                yield cx, cy
+
+    def insert(self, shape):
+        """Add a shape to the index.
+
+        Args:
+            shape (Rectangle): The shape to add.
+        Raises:
+            ValueError: If the shape is already indexed.
+        """
+        key = id(shape)
+        if key in self._bounds:
+            raise ValueError("shape is already indexed")
+        bounds = (shape.x, shape.y,
+                  shape.x + shape.width, shape.y + shape.height)
+        level = self._level(*bounds)
+        self._bounds[key] = (bounds, level)
+        cells = self._cells.setdefault(level, {})
+        for cell in self._cell_keys(self.cell_size << level, *bounds):
+            cells.setdefault(cell, {})[key] = shape
+
+    def remove(self, shape):
+        """Remove a shape from the index.
+
+        Args:
+            shape (Rectangle): The shape to remove.
+        Raises:
+            KeyError: If the shape is not indexed.
+        """
+        key = id(shape)
+        bounds, level = self._bounds.pop(key)
+        cells = self._cells[level]
+        for cell in self._cell_keys(self.cell_size << level, *bounds):
+            bucket = cells[cell]
+            del bucket[key]
+            if not bucket:
+                del cells[cell]
+        if not cells:
+            del self._cells[level]
+
+    def move(self, shape):
+        """Re-index a shape after its position or size changed.
+
+        Args:
+            shape (Rectangle): The indexed shape that changed.
+        Raises:
+            KeyError: If the shape is not indexed.
+        """
+        self.remove(shape)
+        self.insert(shape)
+
+    def query_point(self, px, py):
+        """Return the shapes covering a point.
+
+        Args:
+            px (int): The x coordinate of the point.
+            py (int): The y coordinate of the point.
+        """
+        found = []
+        for level, cells in self._cells.items():
+            size = self.cell_size << level
+            bucket = cells.get((px // size, py // size), {})
+            for key, shape in bucket.items():
+                bx0, by0, bx1, by1 = self._bounds[key][0]
+                if bx0 <= px < bx1 and by0 <= py < by1:
+                    found.append(shape)
+        return found
+
+    def query_box(self, x, y, width, height):
+        """Return the shapes overlapping a box.
+
+        Args:
+            x (int): The x coordinate of the box.
+            y (int): The y coordinate of the box.
+            width (int): The width of the box.
+            height (int): The height of the box.
+        """
+        if width <= 0 or height <= 0:
+            return []
+        x1, y1 = x + width, y + height
+        seen = set()
+        found = []
+        for level, cells in self._cells.items():
+            size = self.cell_size << level
+            cx0, cy0 = x // size, y // size
+            cx1, cy1 = (x1 - 1) // size, (y1 - 1) // size
+            if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+                keys = [cell for cell in cells
+                        if cx0 <= cell[0] <= cx1 and cy0 <= cell[1] <= cy1]
+            else:
+                keys = self._cell_keys(size, x, y, x1, y1)
+            for cell in keys:
+                for key, shape in cells.get(cell, {}).items():
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    bx0, by0, bx1, by1 = self._bounds[key][0]
+                    if bx0 < x1 and x < bx1 and by0 < y1 and y < by1:
+                        found.append(shape)
+        return found
+
+    def __len__(self):
+        """Return the number of indexed shapes."""
+        return len(self._bounds)
+
+    def __contains__(self, shape):
+        """Return True if a shape is indexed."""
+        return id(shape) in self._bounds
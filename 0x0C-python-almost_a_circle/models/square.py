@@ -1,10 +1,24 @@
 #!/usr/bin/python3
 """Defines a square class."""
-from models.rectangle import Rectangle
+from models.fields import IntField, compile_update
+from models.rectangle import Rectangle, RectangleBase
 
 
-class Square(Rectangle):
-    """Represent a square."""
+class SquareBase(RectangleBase):
+    """Represent the behaviour shared by every square class.
+
+    Like RectangleBase, the class has no slots of its own and leaves the
+    instance layout to its subclasses.
+    """
+
+    _fields = dict(RectangleBase._fields,
+                   size=IntField("size", 1, ("_Rectangle__width",
+                                             "_Rectangle__height"),
+                                 label="width"))
+
+    __slots__ = ()
+
+    size = _fields["size"].property("Get/set the size of the Square.")
 
     def __init__(self, size, x=0, y=0, id=None):
         """Initialize a new Square.
@@ -17,18 +31,8 @@ class Square(Rectangle):
         """
         super().__init__(size, size, x, y, id)
 
-    @property
-    def size(self):
-        """Get/set the size of the Square."""
-        return self.width
-
-    @size.setter
-    def size(self, value):
-        self.width = value
-        self.height = value
-
-    def update(self, *args, **kwargs):
-        """Update the Square.
+    _update_order = ("id", "size", "x", "y")
+    update = compile_update(_update_order, """Update the Square.
 
         Args:
             *args (ints): New attribute values.
@@ -37,36 +41,7 @@ class Square(Rectangle):
                 - 3rd argument represents x attribute
                 - 4th argument represents y attribute
             **kwargs (dict): New key/value pairs of attributes.
-        """
-        if args and len(args) != 0:
-            a = 0
-            for arg in args:
-                if a == 0:
-                    if arg is None:
-                        self.__init__(self.size, self.x, self.y)
-                    else:
-                        self.id = arg
-                elif a == 1:
-                    self.size = arg
-                elif a == 2:
-                    self.x = arg
-                elif a == 3:
-                    self.y = arg
-                a += 1
-
-        elif kwargs and len(kwargs) != 0:
-            for k, v in kwargs.items():
-                if k == "id":
-                    if v is None:
-                        self.__init__(self.size, self.x, self.y)
-                    else:
-                        self.id = v
-                elif k == "size":
-                    self.size = v
-                elif k == "x":
-                    self.x = v
-                elif k == "y":
-                    self.y = v
+        """)
 
     def to_dictionary(self):
         """Return the dictionary representation of the Square."""
@@ -81,3 +56,7 @@ class Square(Rectangle):
         """Return the print() and str() representation of a Square."""
         return "[Square] ({}) {}/{} - {}".format(self.id, self.x, self.y,
                                                  self.width)
+
+
+class Square(SquareBase, Rectangle):
+    """Represent a square."""
@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+"""Defines a single-file store for shapes of mixed classes."""
+import csv
+import json
+import operator
+from models.base import Base
+
+
+def _format(filename):
+    """Return "json" or "csv" from the extension of a store file name."""
+    if filename.endswith(".json"):
+        return "json"
+    if filename.endswith(".csv"):
+        return "csv"
+    raise ValueError("store file name must end in .json or .csv")
+
+
+def save_shapes(filename, shapes):
+    """Write shapes of any Base subclasses to one file in a single pass.
+
+    Each record is tagged with the name of its class. A `.json` file holds
+    a list of `to_dictionary` objects with an extra "type" key, and a
+    `.csv` file holds one line per shape: the class name followed by the
+    fields in `_update_order`.
+
+    Args:
+        filename (str): The path of the file, ending in .json or .csv.
+        shapes (iterable): The shapes to write, in any mix of classes.
+    Raises:
+        ValueError: If filename does not end in .json or .csv.
+    """
+    fmt = _format(filename)
+    if shapes is None:
+        shapes = []
+    with open(filename, "w", newline="", buffering=1 << 20) as storefile:
+        if fmt == "json":
+            storefile.write("[")
+            sep = ""
+            for obj in shapes:
+                record = {"type": type(obj).__name__}
+                record.update(obj.to_dictionary())
+                storefile.write(sep)
+                storefile.write(json.dumps(record))
+                sep = ", "
+            storefile.write("]")
+        else:
+            rows = {}
+
+            def row(obj):
+                cls = type(obj)
+                if cls not in rows:
+                    rows[cls] = operator.attrgetter(*cls._field_names())
+                return (cls.__name__,) + rows[cls](obj)
+            csv.writer(storefile).writerows(map(row, shapes))
+
+
+def _iter_records(storefile, fmt):
+    """Yield the class and field dictionary of each record in a store."""
+    if fmt == "json":
+        for d in Base._iter_json_list(storefile):
+            yield Base.subclass(d.pop("type")), d
+        return
+    fields = {}
+    for row in csv.reader(storefile):
+        cls = Base.subclass(row[0])
+        if cls not in fields:
+            fields[cls] = cls._field_names()
+        if len(row) - 1 != len(fields[cls]):
+            raise ValueError("expected {} fields for {}"
+                             .format(len(fields[cls]), row[0]))
+        yield cls, dict(zip(fields[cls], map(int, row[1:])))
+
+
+def load_shapes(filename):
+    """Return the shapes of a file written by `save_shapes`, in order.
+
+    Records are grouped by class while the file is read, and each group
+    is built with one `create_many` call.
+
+    Args:
+        filename (str): The path of the file, ending in .json or .csv.
+    Returns:
+        If the file does not exist - an empty list.
+        Otherwise - the shapes, each of the class it was saved from.
+    Raises:
+        ValueError: If filename does not end in .json or .csv, or if a
+            record names a class that is not a subclass of Base.
+    """
+    fmt = _format(filename)
+    groups = {}
+    count = 0
+    try:
+        storefile = open(filename, "r", newline="")
+    except IOError:
+        return []
+    with storefile:
+        for cls, d in _iter_records(storefile, fmt):
+            if cls not in groups:
+                groups[cls] = ([], [])
+            groups[cls][0].append(count)
+            groups[cls][1].append(d)
+            count += 1
+    shapes = [None] * count
+    for cls, (positions, dictionaries) in groups.items():
+        for i, shape in zip(positions, cls.create_many(dictionaries)):
+            shapes[i] = shape
+    return shapes
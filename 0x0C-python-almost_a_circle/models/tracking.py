@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+"""Defines change tracking for Rectangles and Squares."""
+
+
+class ChangeTracker:
+    """Represent the shapes of a class changed since the last checkpoint.
+
+    A tracker is attached to a class by `track_changes`. From then on,
+    every attribute set, `update`, `set_fields` and `bulk_update` on an
+    instance of exactly that class marks the instance, and creating one
+    marks it too. The first id change of a shape also records the id it
+    was saved under, so a checkpoint can delete the stale record.
+
+    Watchers are called with each marked object after it changed, e.g.
+    so a ShapeCollection can reindex it. A tracker created only for its
+    watchers does not need to record anything.
+
+    Attributes:
+        record (bool): Whether marked objects are recorded.
+    """
+
+    def __init__(self, record=True):
+        """Initialize a new, empty ChangeTracker.
+
+        Args:
+            record (bool): Whether marked objects are recorded.
+        """
+        self.record = record
+        self._changed = {}
+        self._old_ids = {}
+        self._watchers = []
+
+    def mark(self, obj):
+        """Record that an object changed and notify the watchers.
+
+        Args:
+            obj (Base): The changed object.
+        """
+        if self.record:
+            self._changed[id(obj)] = obj
+        for watcher in self._watchers:
+            watcher(obj)
+
+    def mark_id(self, obj):
+        """Record that an object's id is about to change.
+
+        Watchers are not notified: `mark` is called once the id changed.
+
+        Args:
+            obj (Base): The object, still holding its current id.
+        """
+        if self.record:
+            if hasattr(obj, "id"):
+                self._old_ids.setdefault(id(obj), obj.id)
+            self._changed[id(obj)] = obj
+
+    def watch(self, watcher):
+        """Call a function with every object marked from now on.
+
+        Args:
+            watcher (callable): Called with the changed object.
+        """
+        self._watchers.append(watcher)
+
+    def unwatch(self, watcher):
+        """Stop calling a function added by `watch`.
+
+        Args:
+            watcher (callable): The function to remove.
+        Raises:
+            ValueError: If watcher is not watching.
+        """
+        self._watchers.remove(watcher)
+
+    def changed(self):
+        """Return the objects changed since the last checkpoint."""
+        return list(self._changed.values())
+
+    def stale_ids(self):
+        """Return the ids that changed objects no longer have."""
+        return [old for key, old in self._old_ids.items()
+                if self._changed[key].id != old]
+
+    def clear(self):
+        """Forget every change, e.g. after loading or saving all shapes."""
+        self._changed.clear()
+        self._old_ids.clear()
+
+    def checkpoint(self, journal):
+        """Save the changed objects to a journal and clear the changes.
+
+        Stale ids are deleted and changed objects are put, so the cost is
+        proportional to the number of changes, not to the number of
+        saved objects.
+
+        Args:
+            journal (Journal): The journal of the tracked class.
+        Returns:
+            The number of objects saved.
+        """
+        changed = self.changed()
+        stale = self.stale_ids()
+        if stale:
+            journal.delete(*stale)
+        if changed:
+            journal.put(*changed)
+        self.clear()
+        return len(changed)
+
+    def __len__(self):
+        """Return the number of changed objects."""
+        return len(self._changed)
+
+    def __contains__(self, obj):
+        """Return True if an object changed since the last checkpoint."""
+        return id(obj) in self._changed
@@ -2,18 +2,34 @@
 """Defines unittests for base.py.
 
 Unittest classes:
-    TestBase_instantiation - line 21
-    TestBase_to_json_string - line 108
-    TestBase_save_to_file - line 154
-    TestBase_from_json_string - line 232
-    TestBase_create - line 286
-    TestBase_load_from_file - line 338
-    TestBase_save_to_file_csv - line 404
-    TestBase_load_from_file_csv - line 482
+    TestBase_instantiation - line 37
+    TestBase_to_json_string - line 144
+    TestBase_save_to_file - line 190
+    TestBase_from_json_string - line 268
+    TestBase_create - line 322
+    TestBase_load_from_file - line 374
+    TestBase_save_to_file_csv - line 440
+    TestBase_load_from_file_csv - line 532
+    TestBase_load_from_file_iter - line 616
+    TestBase_save_to_file_bin - line 744
+    TestBase_create_many - line 798
+    TestBase_save_to_file_csv_stream - line 845
+    TestBase_ids_threads - line 890
+    TestBase_draw_to_file - line 929
+    TestBase_without_update_order - line 977
+    TestBase_subclass - line 1010
+    TestBase_save_to_file_chunked - line 1069
+    TestBase_save_to_file_async - line 1101
+    TestBase_load_from_file_lazy - line 1191
 """
+import asyncio
+import glob
+import io
 import os
+import threading
 import unittest
 from models.base import Base
+from models.compact import CompactRectangle
 from models.rectangle import Rectangle
 from models.square import Square
 
@@ -46,6 +62,26 @@ class TestBase_instantiation(unittest.TestCase):
         b3 = Base()
         self.assertEqual(b1.id, b3.id - 1)
 
+    def test_no_new_attributes(self):
+        with self.assertRaises(AttributeError):
+            Base(12).color = "red"
+
+    def test_subclass_new_attributes(self):
+        r = Rectangle(1, 1)
+        r.color = "red"
+        self.assertEqual("red", r.color)
+
+    def test_no_dict(self):
+        with self.assertRaises(AttributeError):
+            Base(12).__dict__
+
+    def test_id_not_in_subclass_dict(self):
+        r = Rectangle(1, 2, 3, 4, 5)
+        self.assertNotIn("id", vars(r))
+        self.assertEqual(["_Rectangle__width", "_Rectangle__height",
+                          "_Rectangle__x", "_Rectangle__y"], list(vars(r)))
+        self.assertEqual(5, r.id)
+
     def test_id_public(self):
         b = Base(12)
         b.id = 15
@@ -452,6 +488,20 @@ class TestBase_save_to_file_csv(unittest.TestCase):
         with open("Base.csv", "r") as f:
             self.assertTrue("8,10,7,2", f.read())
 
+    def test_save_to_file_csv_square_as_rectangle(self):
+        with self.assertRaises(ValueError):
+            Rectangle.save_to_file_csv([Square(7, 2, 3, 4)])
+
+    def test_save_to_file_csv_mixed_types(self):
+        with self.assertRaises(ValueError):
+            Base.save_to_file_csv([Square(7, 2, 3, 4), Rectangle(1, 2)])
+
+    def test_save_to_file_csv_same_fields(self):
+        r = CompactRectangle(10, 7, 2, 8, 5)
+        Rectangle.save_to_file_csv([r])
+        with open("Rectangle.csv", "r") as f:
+            self.assertEqual("5,10,7,2,8\n", f.read())
+
     def test_save_to_file_csv_overwrite(self):
         s = Square(9, 2, 39, 2)
         Square.save_to_file_csv([s])
@@ -540,10 +590,635 @@ class TestBase_load_from_file_csv(unittest.TestCase):
         output = Square.load_from_file_csv()
         self.assertEqual([], output)
 
+    def test_load_from_file_csv_blank_lines(self):
+        with open("Rectangle.csv", "w") as f:
+            f.write("1,10,7,2,8\n\n2,2,4,5,6\n\n")
+        output = Rectangle.load_from_file_csv()
+        self.assertEqual([1, 2], [r.id for r in output])
+
+    def test_load_from_file_csv_short_row(self):
+        with open("Rectangle.csv", "w") as f:
+            f.write("1,2,3,4\n")
+        with self.assertRaisesRegex(ValueError, "expected 5 values"):
+            Rectangle.load_from_file_csv()
+
+    def test_load_from_file_csv_long_row(self):
+        with open("Square.csv", "w") as f:
+            f.write("1,2,3,4\n5,6,7,8,9,10\n")
+        with self.assertRaisesRegex(ValueError, "expected 4 values"):
+            Square.load_from_file_csv()
+
     def test_load_from_file_csv_more_than_one_arg(self):
         with self.assertRaises(TypeError):
             Base.load_from_file_csv([], 1)
 
 
+class TestBase_load_from_file_iter(unittest.TestCase):
+    """Unittests for testing streaming save/load of the Base class."""
+
+    @classmethod
+    def tearDown(self):
+        """Delete any created files."""
+        try:
+            os.remove("Rectangle.json")
+        except IOError:
+            pass
+        try:
+            os.remove("Square.json")
+        except IOError:
+            pass
+
+    def test_save_to_file_generator(self):
+        Rectangle.save_to_file(Rectangle(i, 2, 0, 0, i) for i in (1, 2))
+        with open("Rectangle.json", "r") as f:
+            self.assertEqual(2, len(Base.from_json_string(f.read())))
+
+    def test_save_to_file_same_as_to_json_string(self):
+        rects = [Rectangle(10, 7, 2, 8, 5), Rectangle(2, 4, 1, 2, 3)]
+        Rectangle.save_to_file(rects)
+        expected = Base.to_json_string([r.to_dictionary() for r in rects])
+        with open("Rectangle.json", "r") as f:
+            self.assertEqual(expected, f.read())
+
+    def test_save_to_file_empty_generator(self):
+        Square.save_to_file(s for s in [])
+        with open("Square.json", "r") as f:
+            self.assertEqual("[]", f.read())
+
+    def test_load_from_file_iter_is_iterator(self):
+        Square.save_to_file([Square(5, 1, 3, 3)])
+        output = Square.load_from_file_iter()
+        self.assertIs(output, iter(output))
+
+    def test_load_from_file_iter_rectangles(self):
+        r1 = Rectangle(10, 7, 2, 8, 1)
+        r2 = Rectangle(2, 4, 5, 6, 2)
+        Rectangle.save_to_file([r1, r2])
+        output = [str(r) for r in Rectangle.load_from_file_iter()]
+        self.assertEqual([str(r1), str(r2)], output)
+
+    def test_load_from_file_iter_squares(self):
+        s1 = Square(5, 1, 3, 3)
+        s2 = Square(9, 5, 2, 3)
+        Square.save_to_file([s1, s2])
+        output = list(Square.load_from_file_iter())
+        self.assertTrue(all(type(obj) == Square for obj in output))
+        self.assertEqual(str(s2), str(output[1]))
+
+    def test_load_from_file_iter_many_records(self):
+        Square.save_to_file(Square(i, 0, 0, i) for i in range(1, 3001))
+        output = list(Square.load_from_file_iter())
+        self.assertEqual(3000, len(output))
+        self.assertEqual("[Square] (3000) 0/0 - 3000", str(output[-1]))
+
+    def test_iter_json_list_small_chunks(self):
+        list_input = [{"id": 89, "width": 10}, {"id": 7, "width": 123456}]
+        with open("Rectangle.json", "w") as f:
+            f.write(Base.to_json_string(list_input))
+        with open("Rectangle.json", "r") as f:
+            output = list(Base._iter_json_list(f, chunk_size=3))
+        self.assertEqual(list_input, output)
+
+    def test_iter_json_list_truncated(self):
+        with open("Rectangle.json", "w") as f:
+            f.write('[{"id": 89, "width": 10}, {"id": 7')
+        with open("Rectangle.json", "r") as f:
+            with self.assertRaises(ValueError):
+                list(Base._iter_json_list(f, chunk_size=8))
+
+    def test_iter_json_list_leading_whitespace(self):
+        f = io.StringIO(" " * 70000 + '[{"id": 1}]')
+        self.assertEqual([{"id": 1}], list(Base._iter_json_list(f)))
+
+    def test_iter_json_list_only_whitespace(self):
+        f = io.StringIO(" " * 70000)
+        self.assertEqual([], list(Base._iter_json_list(f)))
+
+    def test_iter_json_list_split_tokens(self):
+        text = '[{"a": true, "b": -1.5e3, "c": "x\\"y", "d": null}]'
+        for size in range(1, len(text) + 1):
+            output = list(Base._iter_json_list(io.StringIO(text), size))
+            self.assertEqual(
+                [{"a": True, "b": -1500.0, "c": 'x"y', "d": None}], output)
+
+    def test_iter_json_list_malformed_stops_early(self):
+        f = io.StringIO('[{"id": 1}, {"id" 2}, ' + '{"id": 3}, ' * 10000)
+        with self.assertRaisesRegex(ValueError, "malformed"):
+            list(Base._iter_json_list(f, chunk_size=64))
+        self.assertLess(f.tell(), 1000)
+
+    def test_iter_json_list_missing_comma(self):
+        f = io.StringIO('[{"id": 1} {"id": 2}]')
+        with self.assertRaisesRegex(ValueError, "expected ','"):
+            list(Base._iter_json_list(f))
+
+    def test_iter_json_list_extra_commas(self):
+        for text in ('[,{"id": 1}]', '[{"id": 1},,{"id": 2}]',
+                     '[{"id": 1},]', '[,,{"id": 1},]', '[,]'):
+            with self.assertRaises(ValueError):
+                list(Base._iter_json_list(io.StringIO(text)))
+
+    def test_iter_json_list_trailing_data(self):
+        f = io.StringIO('[{"id": 1}] trailing junk')
+        with self.assertRaisesRegex(ValueError, "after JSON list"):
+            list(Base._iter_json_list(f))
+
+    def test_iter_json_list_trailing_whitespace(self):
+        for size in (1, 4, 64):
+            f = io.StringIO('[ {"id": 1} ,\n{"id": 2} ]\n' + " " * 100)
+            self.assertEqual([{"id": 1}, {"id": 2}],
+                             list(Base._iter_json_list(f, size)))
+
+    def test_load_from_file_iter_empty_list(self):
+        Square.save_to_file([])
+        self.assertEqual([], list(Square.load_from_file_iter()))
+
+    def test_load_from_file_iter_no_file(self):
+        self.assertEqual([], list(Square.load_from_file_iter()))
+
+    def test_load_from_file_iter_more_than_one_arg(self):
+        with self.assertRaises(TypeError):
+            Square.load_from_file_iter(1)
+
+
+class TestBase_save_to_file_bin(unittest.TestCase):
+    """Unittests for testing binary save/load methods of Base class."""
+
+    @classmethod
+    def tearDown(self):
+        """Delete any created files."""
+        try:
+            os.remove("Rectangle.bin")
+        except IOError:
+            pass
+        try:
+            os.remove("Square.bin")
+        except IOError:
+            pass
+
+    def test_save_to_file_bin_size(self):
+        Rectangle.save_to_file_bin([Rectangle(10, 7, 2, 8, 5)])
+        self.assertEqual(40 + 40, os.path.getsize("Rectangle.bin"))
+
+    def test_save_to_file_bin_None(self):
+        Square.save_to_file_bin(None)
+        self.assertEqual(0, len(Square.load_from_file_bin()))
+
+    def test_load_from_file_bin_rectangles(self):
+        r1 = Rectangle(10, 7, 2, 8, 1)
+        r2 = Rectangle(2, 4, 5, 6, 2)
+        Rectangle.save_to_file_bin([r1, r2])
+        output = Rectangle.load_from_file_bin()
+        self.assertEqual(2, len(output))
+        self.assertEqual(str(r2), str(output[1]))
+        output.close()
+
+    def test_load_from_file_bin_squares(self):
+        s1 = Square(5, 1, 3, 3)
+        s2 = Square(9, 5, 2, 4)
+        Square.save_to_file_bin(s for s in [s1, s2])
+        with Square.load_from_file_bin() as output:
+            self.assertEqual([str(s1), str(s2)], [str(s) for s in output])
+            self.assertTrue(all(type(obj) == Square for obj in output))
+
+    def test_load_from_file_bin_wrong_class(self):
+        Square.save_to_file_bin([Square(5, 1, 3, 3)])
+        os.rename("Square.bin", "Rectangle.bin")
+        with self.assertRaises(ValueError):
+            Rectangle.load_from_file_bin()
+
+    def test_load_from_file_bin_no_file(self):
+        self.assertEqual([], Square.load_from_file_bin())
+
+    def test_save_to_file_bin_more_than_one_arg(self):
+        with self.assertRaises(TypeError):
+            Square.save_to_file_bin([], 1)
+
+
+class TestBase_create_many(unittest.TestCase):
+    """Unittests for testing create_many method of Base class."""
+
+    def test_create_many_rectangles(self):
+        dicts = [Rectangle(3, 5, 1, 2, 7).to_dictionary(),
+                 Rectangle(4, 6, 0, 1, 8).to_dictionary()]
+        output = Rectangle.create_many(dicts)
+        self.assertEqual(["[Rectangle] (7) 1/2 - 3/5",
+                          "[Rectangle] (8) 0/1 - 4/6"],
+                         [str(r) for r in output])
+
+    def test_create_many_squares(self):
+        output = Square.create_many([Square(3, 5, 1, 7).to_dictionary()])
+        self.assertEqual(Square, type(output[0]))
+        self.assertEqual("[Square] (7) 5/1 - 3", str(output[0]))
+
+    def test_create_many_generator(self):
+        output = Square.create_many({"id": i, "size": i} for i in (1, 2))
+        self.assertEqual([1, 2], [s.size for s in output])
+
+    def test_create_many_matches_create(self):
+        dicts = [{"id": 89}, {"width": 4, "y": 3}, {"id": 5, "size": 9},
+                 {"height": 2, "unknown": 3}]
+        for d in dicts:
+            expected = str(Rectangle.create(**d)).split(")")[1]
+            output = str(Rectangle.create_many([d])[0]).split(")")[1]
+            self.assertEqual(expected, output)
+
+    def test_create_many_fresh_id(self):
+        r = Rectangle.create_many([{"width": 4}])[0]
+        self.assertEqual(r.id, Base().id - 1)
+
+    def test_create_many_empty_dict(self):
+        self.assertEqual([None], Rectangle.create_many([{}]))
+
+    def test_create_many_empty(self):
+        self.assertEqual([], Square.create_many([]))
+
+    def test_create_many_invalid_width(self):
+        with self.assertRaisesRegex(TypeError, "width must be an integer"):
+            Rectangle.create_many([{"id": 1, "width": "4", "height": 2}])
+
+    def test_create_many_invalid_size(self):
+        with self.assertRaisesRegex(ValueError, "width must be > 0"):
+            Square.create_many([{"id": 1, "size": 0}])
+
+
+class TestBase_save_to_file_csv_stream(unittest.TestCase):
+    """Unittests for testing streaming and gzip CSV output of Base class."""
+
+    @classmethod
+    def tearDown(self):
+        """Delete any created files."""
+        for filename in ("Rectangle.csv", "Square.csv", "Square.csv.gz"):
+            try:
+                os.remove(filename)
+            except IOError:
+                pass
+
+    def test_save_to_file_csv_exact_output(self):
+        r1 = Rectangle(10, 7, 2, 8, 5)
+        r2 = Rectangle(2, 4, 1, 2, 3)
+        Rectangle.save_to_file_csv([r1, r2])
+        with open("Rectangle.csv", "r", newline="") as f:
+            self.assertEqual("5,10,7,2,8\r\n3,2,4,1,2\r\n", f.read())
+
+    def test_save_to_file_csv_generator(self):
+        Square.save_to_file_csv(Square(i, 0, 0, i) for i in (1, 2, 3))
+        self.assertEqual(3, len(Square.load_from_file_csv()))
+
+    def test_save_to_file_csv_empty_generator(self):
+        Square.save_to_file_csv(s for s in [])
+        with open("Square.csv", "r") as f:
+            self.assertEqual("[]", f.read())
+
+    def test_save_to_file_csv_compress(self):
+        s1 = Square(5, 1, 3, 3)
+        s2 = Square(9, 5, 2, 4)
+        Square.save_to_file_csv([s1, s2], compress=True)
+        self.assertFalse(os.path.exists("Square.csv"))
+        output = Square.load_from_file_csv(compress=True)
+        self.assertEqual([str(s1), str(s2)], [str(s) for s in output])
+
+    def test_save_to_file_csv_compress_is_gzip(self):
+        Square.save_to_file_csv([Square(5, 1, 3, 3)], compress=True)
+        with open("Square.csv.gz", "rb") as f:
+            self.assertEqual(b"\x1f\x8b", f.read(2))
+
+    def test_load_from_file_csv_compress_no_file(self):
+        self.assertEqual([], Square.load_from_file_csv(compress=True))
+
+
+class TestBase_ids_threads(unittest.TestCase):
+    """Unittests for testing id allocation of Base class across threads."""
+
+    def test_reserve_ids_consecutive(self):
+        ids = Base._reserve_ids(5)
+        self.assertEqual(5, len(ids))
+        self.assertEqual(ids[-1], Base().id - 1)
+
+    def test_reserve_ids_larger_than_block(self):
+        ids = Base._reserve_ids(1000)
+        self.assertEqual(list(range(ids[0], ids[0] + 1000)), list(ids))
+        self.assertEqual(ids[-1], Base().id - 1)
+
+    def test_ids_increase_within_thread(self):
+        first = [Base().id for i in range(600)]
+        self.assertEqual(sorted(first), first)
+        self.assertEqual(len(set(first)), len(first))
+
+    def test_unique_ids_across_threads(self):
+        results = []
+        barrier = threading.Barrier(16)
+
+        def worker():
+            barrier.wait()
+            ids = [Rectangle(1, 1).id for i in range(2000)]
+            ids.extend(Base._reserve_ids(37))
+            ids.extend(Square(2).id for i in range(500))
+            results.append(ids)
+
+        threads = [threading.Thread(target=worker) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        all_ids = [i for ids in results for i in ids]
+        self.assertEqual(16 * 2537, len(all_ids))
+        self.assertEqual(len(all_ids), len(set(all_ids)))
+
+
+class TestBase_draw_to_file(unittest.TestCase):
+    """Unittests for testing draw_to_file method of Base class."""
+
+    @classmethod
+    def tearDown(self):
+        """Delete any created files."""
+        for filename in ("shapes.ppm", "shapes.png"):
+            try:
+                os.remove(filename)
+            except IOError:
+                pass
+
+    def test_draw_to_file_size_fits_shapes(self):
+        raster = Base.draw_to_file([Rectangle(3, 2, 1, 4)], [Square(2, 6)],
+                                   "shapes.ppm")
+        self.assertEqual((8, 6), (raster.width, raster.height))
+
+    def test_draw_to_file_colors(self):
+        raster = Base.draw_to_file([Rectangle(1, 1)], [Square(1, 1)],
+                                   "shapes.ppm", 3, 1)
+        self.assertEqual(b"\xff\xff\xff\xb5\xe3\xd8\xb7\x31\x2c",
+                         bytes(raster.pixels))
+
+    def test_draw_to_file_writes_png(self):
+        Base.draw_to_file([Rectangle(3, 2)], [], "shapes.png")
+        with open("shapes.png", "rb") as f:
+            self.assertEqual(b"\x89PNG", f.read(4))
+
+    def test_draw_to_file_no_shapes(self):
+        raster = Base.draw_to_file([], [], "shapes.ppm")
+        self.assertEqual((1, 1), (raster.width, raster.height))
+
+
+class Disc(Base):
+    """A Base subclass without `_update_order`, as written before it."""
+
+    def __init__(self, radius, id=None):
+        self.radius = radius
+        super().__init__(id)
+
+    def update(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def to_dictionary(self):
+        return {"id": self.id, "radius": self.radius}
+
+
+class TestBase_without_update_order(unittest.TestCase):
+    """Unittests for testing Base subclasses without `_update_order`."""
+
+    def tearDown(self):
+        """Delete any created files."""
+        for filename in ("Disc.json", "Disc.csv", "Disc.bin"):
+            try:
+                os.remove(filename)
+            except IOError:
+                pass
+
+    def test_create(self):
+        d = Disc.create(**{"id": 5, "radius": 3})
+        self.assertEqual({"id": 5, "radius": 3}, d.to_dictionary())
+
+    def test_create_many(self):
+        discs = Disc.create_many([{"id": 1, "radius": 2}, {"radius": 4}])
+        self.assertEqual([2, 4], [d.radius for d in discs])
+
+    def test_json_round_trip(self):
+        Disc.save_to_file([Disc(7, 3)])
+        self.assertEqual([{"id": 3, "radius": 7}],
+                         [d.to_dictionary() for d in Disc.load_from_file()])
+
+    def test_csv_error(self):
+        with self.assertRaisesRegex(ValueError, "_update_order"):
+            Disc.save_to_file_csv([Disc(7, 3)])
+
+    def test_bin_error(self):
+        with self.assertRaisesRegex(ValueError, "_update_order"):
+            Disc.save_to_file_bin([Disc(7, 3)])
+
+
+class TestBase_subclass(unittest.TestCase):
+    """Unittests for testing the registry of Base subclasses."""
+
+    def test_subclass_builtin(self):
+        self.assertIs(Rectangle, Base.subclass("Rectangle"))
+        self.assertIs(Square, Base.subclass("Square"))
+
+    def test_subclass_unknown(self):
+        with self.assertRaises(ValueError):
+            Base.subclass("NoSuchShape")
+
+    def test_subclass_registered_on_definition(self):
+        class Registered(Square):
+            pass
+        self.assertIs(Registered, Base.subclass("Registered"))
+
+    def test_subclass_redefined(self):
+        def define():
+            class Redefined(Base):
+                pass
+            return Redefined
+        first, second = define(), define()
+        self.assertIs(second, Base.subclass("Redefined"))
+
+    def test_subclass_reload(self):
+        source = "from models.base import Base\nclass Reloaded(Base): pass\n"
+        for _ in range(2):
+            namespace = {"__name__": "reloaded_shapes"}
+            exec(source, namespace)
+        self.assertIs(namespace["Reloaded"], Base.subclass("Reloaded"))
+
+    def test_subclass_ambiguous(self):
+        def define():
+            class Ambiguous(Base):
+                pass
+            return Ambiguous
+
+        class Ambiguous(Base):
+            pass
+        other = define()
+        with self.assertRaisesRegex(ValueError, "ambiguous shape type"):
+            Base.subclass("Ambiguous")
+        self.assertIs(other, Base.subclass(other.__module__ + "." +
+                                           other.__qualname__))
+
+    def test_field_names(self):
+        self.assertEqual(["id", "width", "height", "x", "y"],
+                         Rectangle._field_names())
+        self.assertEqual(["id", "size", "x", "y"], Square._field_names())
+
+    def test_create_without_field_constructor(self):
+        class Labelled(Rectangle):
+            def __init__(self, width, height, label="", id=None):
+                super().__init__(width, height, id=id)
+        r = Labelled.create(**{"id": 4, "width": 2, "height": 3,
+                               "x": 1, "y": 2})
+        self.assertEqual("[Rectangle] (4) 1/2 - 2/3", str(r))
+
+
+class TestBase_save_to_file_chunked(unittest.TestCase):
+    """Unittests for testing chunked save/load methods of Base class."""
+
+    def tearDown(self):
+        """Delete any created files."""
+        for filename in ("Rectangle.chunks", "Square.chunks"):
+            try:
+                os.remove(filename)
+            except IOError:
+                pass
+
+    def test_load_from_file_chunked_no_file(self):
+        self.assertEqual([], Square.load_from_file_chunked())
+
+    def test_save_to_file_chunked_None(self):
+        Square.save_to_file_chunked(None)
+        with Square.load_from_file_chunked() as output:
+            self.assertEqual(0, len(output))
+
+    def test_save_to_file_chunked_rectangles(self):
+        rects = [Rectangle(10, 7, 2, 8, 1), Rectangle(2, 4, 5, 6, 2)]
+        Rectangle.save_to_file_chunked(rects, codec="lzma", chunk_size=1)
+        with Rectangle.load_from_file_chunked() as output:
+            self.assertEqual(2, output.chunk_count)
+            self.assertEqual([str(r) for r in rects],
+                             [str(r) for r in output])
+
+    def test_save_to_file_chunked_options_keyword_only(self):
+        with self.assertRaises(TypeError):
+            Square.save_to_file_chunked([], "zlib")
+
+
+class TestBase_save_to_file_async(unittest.IsolatedAsyncioTestCase):
+    """Unittests for testing async save/load methods of Base class."""
+
+    def tearDown(self):
+        """Delete any created files."""
+        for filename in ["Rectangle.json", "Square.json"] + \
+                glob.glob("*.json.*.tmp"):
+            try:
+                os.remove(filename)
+            except IOError:
+                pass
+
+    async def test_save_to_file_async_matches_save_to_file(self):
+        rects = [Rectangle(i + 1, 2, i, 0, i) for i in range(10)]
+        Rectangle.save_to_file(rects)
+        with open("Rectangle.json", "r") as f:
+            expected = f.read()
+        await Rectangle.save_to_file_async(rects, batch_size=3)
+        with open("Rectangle.json", "r") as f:
+            self.assertEqual(expected, f.read())
+
+    async def test_save_to_file_async_None(self):
+        await Square.save_to_file_async(None)
+        with open("Square.json", "r") as f:
+            self.assertEqual("[]", f.read())
+
+    async def test_save_to_file_async_no_temp_left(self):
+        await Square.save_to_file_async([Square(1)])
+        self.assertEqual([], glob.glob("*.json.*.tmp"))
+
+    async def test_save_to_file_async_error_keeps_old_file(self):
+        Square.save_to_file([Square(1, 0, 0, 1)])
+
+        def shapes():
+            yield Square(2)
+            raise RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            await Square.save_to_file_async(shapes(), batch_size=1)
+        with open("Square.json", "r") as f:
+            self.assertEqual('[{"id": 1, "size": 1, "x": 0, "y": 0}]',
+                             f.read())
+        self.assertEqual([], glob.glob("*.json.*.tmp"))
+
+    async def test_save_to_file_async_cancel(self):
+        Square.save_to_file([Square(1, 0, 0, 1)])
+        started = asyncio.Event()
+
+        def shapes():
+            for i in range(100000):
+                if i == 10:
+                    started.set()
+                yield Square(1)
+        task = asyncio.create_task(
+            Square.save_to_file_async(shapes(), batch_size=5))
+        await started.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(1, len(Square.load_from_file()))
+        self.assertEqual([], glob.glob("*.json.*.tmp"))
+
+    async def test_save_to_file_async_yields_to_loop(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+        task = asyncio.create_task(ticker())
+        await Square.save_to_file_async([Square(1)] * 100, batch_size=10)
+        task.cancel()
+        self.assertGreater(ticks, 5)
+
+    async def test_load_from_file_async_no_file(self):
+        self.assertEqual([], await Square.load_from_file_async())
+
+    async def test_load_from_file_async(self):
+        squares = [Square(i + 1, 0, i, i + 100) for i in range(7)]
+        Square.save_to_file(squares)
+        output = await Square.load_from_file_async(batch_size=2)
+        self.assertEqual([str(s) for s in squares],
+                         [str(s) for s in output])
+        self.assertEqual(Square, type(output[0]))
+
+    async def test_load_from_file_async_empty(self):
+        Rectangle.save_to_file([])
+        self.assertEqual([], await Rectangle.load_from_file_async())
+
+
+class TestBase_load_from_file_lazy(unittest.TestCase):
+    """Unittests for testing load_from_file_lazy method of Base class."""
+
+    def tearDown(self):
+        """Delete any created files."""
+        for filename in ("Rectangle.json", "Square.json"):
+            try:
+                os.remove(filename)
+            except IOError:
+                pass
+
+    def test_load_from_file_lazy_no_file(self):
+        self.assertEqual([], Square.load_from_file_lazy())
+
+    def test_load_from_file_lazy_matches_load_from_file(self):
+        squares = [Square(5, 1, 3, 3), Square(9, 5, 2, 4)]
+        Square.save_to_file(squares)
+        with Square.load_from_file_lazy() as output:
+            self.assertEqual([str(s) for s in squares],
+                             [str(s) for s in output])
+
+    def test_load_from_file_lazy_empty_list(self):
+        Rectangle.save_to_file([])
+        with Rectangle.load_from_file_lazy() as output:
+            self.assertEqual(0, len(output))
+
+    def test_load_from_file_lazy_type(self):
+        Rectangle.save_to_file([Rectangle(2, 3, 0, 0, 1)])
+        with Rectangle.load_from_file_lazy() as output:
+            self.assertEqual(Rectangle, type(output[0]))
+
+
 if __name__ == "__main__":
     unittest.main()
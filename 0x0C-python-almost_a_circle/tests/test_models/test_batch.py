@@ -0,0 +1,187 @@
+#!/usr/bin/python3
+"""Defines unittests for models/batch.py.
+
+Unittest classes:
+    TestRectangleBatch_instantiation - line 19
+    TestRectangleBatch_access - line 85
+    TestSquareBatch - line 135
+    TestBatch_batch_class - line 168
+"""
+import unittest
+from array import array
+from models.base import Base
+from models.batch import RectangleBatch, SquareBatch, batch_class
+from models.compact import CompactRectangle, CompactSquare
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestRectangleBatch_instantiation(unittest.TestCase):
+    """Unittests for testing instantiation of the RectangleBatch class."""
+
+    def test_empty(self):
+        self.assertEqual(0, len(RectangleBatch()))
+
+    def test_len(self):
+        self.assertEqual(3, len(RectangleBatch([1, 2, 3], [4, 5, 6])))
+
+    def test_default_x_y(self):
+        b = RectangleBatch([1, 2], [3, 4])
+        self.assertEqual(array("q", [0, 0]), b.column("x"))
+        self.assertEqual(array("q", [0, 0]), b.column("y"))
+
+    def test_default_ids_consecutive(self):
+        b = RectangleBatch([1, 2], [3, 4])
+        ids = b.column("id")
+        self.assertEqual(ids[0], ids[1] - 1)
+        self.assertEqual(ids[1], Base().id - 1)
+
+    def test_given_ids(self):
+        b = RectangleBatch([1, 2], [3, 4], id=[10, 20])
+        self.assertEqual(array("q", [10, 20]), b.column("id"))
+
+    def test_array_input(self):
+        b = RectangleBatch(array("i", [1, 2]), range(1, 3))
+        self.assertEqual(array("q", [1, 2]), b.column("height"))
+
+    def test_generator_input(self):
+        b = RectangleBatch((w for w in [1, 2]), [3, 4])
+        self.assertEqual(array("q", [1, 2]), b.column("width"))
+
+    def test_float_width(self):
+        with self.assertRaisesRegex(TypeError, "width must be an integer"):
+            RectangleBatch([1, 2.0], [3, 4])
+
+    def test_float_array(self):
+        with self.assertRaisesRegex(TypeError, "height must be an integer"):
+            RectangleBatch([1, 2], array("d", [3, 4]))
+
+    def test_bool_x(self):
+        with self.assertRaisesRegex(TypeError, "x must be an integer"):
+            RectangleBatch([1], [3], [True])
+
+    def test_zero_width(self):
+        with self.assertRaisesRegex(ValueError, "width must be > 0"):
+            RectangleBatch([1, 0], [3, 4])
+
+    def test_negative_height(self):
+        with self.assertRaisesRegex(ValueError, "height must be > 0"):
+            RectangleBatch([1, 2], [3, -4])
+
+    def test_negative_y(self):
+        with self.assertRaisesRegex(ValueError, "y must be >= 0"):
+            RectangleBatch([1, 2], [3, 4], [0, 0], [0, -1])
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            RectangleBatch([1, 2], [3])
+
+    def test_from_shapes(self):
+        b = RectangleBatch.from_shapes([Rectangle(1, 2, 3, 4, 5)])
+        self.assertEqual(array("q", [5]), b.column("id"))
+        self.assertEqual(array("q", [4]), b.column("y"))
+
+
+class TestRectangleBatch_access(unittest.TestCase):
+    """Unittests for testing access to the RectangleBatch class."""
+
+    def setUp(self):
+        self.batch = RectangleBatch([2, 3], [4, 5], [1, 0], [0, 2], [7, 8])
+
+    def test_getitem_type(self):
+        self.assertEqual(Rectangle, type(self.batch[0]))
+
+    def test_getitem(self):
+        self.assertEqual("[Rectangle] (8) 0/2 - 3/5", str(self.batch[1]))
+
+    def test_getitem_negative(self):
+        self.assertEqual(8, self.batch[-1].id)
+
+    def test_getitem_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.batch[2]
+
+    def test_getitem_slice(self):
+        part = self.batch[1:]
+        self.assertEqual(RectangleBatch, type(part))
+        self.assertEqual(1, len(part))
+        self.assertEqual(8, part[0].id)
+
+    def test_setitem(self):
+        self.batch[0] = Rectangle(9, 9, 9, 9, 9)
+        self.assertEqual("[Rectangle] (9) 9/9 - 9/9", str(self.batch[0]))
+
+    def test_iter(self):
+        self.assertEqual([7, 8], [r.id for r in self.batch])
+
+    def test_append(self):
+        self.batch.append(Rectangle(1, 1, 0, 0, 3))
+        self.assertEqual(3, len(self.batch))
+        self.assertEqual(3, self.batch[2].id)
+
+    def test_area(self):
+        self.assertEqual(array("q", [8, 15]), self.batch.area())
+
+    def test_total_area(self):
+        self.assertEqual(23, self.batch.total_area())
+
+    def test_bounds(self):
+        self.assertEqual((0, 0, 3, 7), self.batch.bounds())
+
+    def test_bounds_empty(self):
+        self.assertIsNone(RectangleBatch().bounds())
+
+
+class TestSquareBatch(unittest.TestCase):
+    """Unittests for testing the SquareBatch class."""
+
+    def test_getitem(self):
+        b = SquareBatch([3], [1], [2], [7])
+        self.assertEqual(Square, type(b[0]))
+        self.assertEqual("[Square] (7) 1/2 - 3", str(b[0]))
+
+    def test_width_alias(self):
+        b = SquareBatch([3, 4])
+        self.assertIs(b.column("size"), b.column("width"))
+        self.assertIs(b.column("size"), b.column("height"))
+
+    def test_area(self):
+        self.assertEqual(array("q", [9, 16]), SquareBatch([3, 4]).area())
+
+    def test_total_area(self):
+        self.assertEqual(25, SquareBatch([3, 4]).total_area())
+
+    def test_string_size(self):
+        with self.assertRaisesRegex(TypeError, "width must be an integer"):
+            SquareBatch(["3"])
+
+    def test_zero_size(self):
+        with self.assertRaisesRegex(ValueError, "width must be > 0"):
+            SquareBatch([0])
+
+    def test_from_shapes(self):
+        b = SquareBatch.from_shapes([Square(2, 1, 1, 4), Square(5)])
+        self.assertEqual(array("q", [2, 5]), b.column("size"))
+        self.assertEqual(4, b[0].id)
+
+
+class TestBatch_batch_class(unittest.TestCase):
+    """Unittests for testing the batch_class function."""
+
+    def test_rectangle(self):
+        self.assertIs(RectangleBatch, batch_class(Rectangle))
+        self.assertIs(RectangleBatch, batch_class(CompactRectangle))
+
+    def test_square(self):
+        self.assertIs(SquareBatch, batch_class(Square))
+        self.assertIs(SquareBatch, batch_class(CompactSquare))
+
+    def test_unknown(self):
+        class Circle(Base):
+            _update_order = ("id", "radius")
+        with self.assertRaises(ValueError):
+            batch_class(Circle)
+
+
+if __name__ == "__main__":
+    unittest.main()
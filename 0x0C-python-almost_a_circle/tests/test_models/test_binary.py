@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""Defines unittests for models/binary.py.
+
+Unittest classes:
+    TestShapeFile - line 14
+"""
+import os
+import unittest
+from models.binary import ShapeFile
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestShapeFile(unittest.TestCase):
+    """Unittests for testing the ShapeFile class."""
+
+    def setUp(self):
+        """Write a file of three Rectangles."""
+        self.rects = [Rectangle(i, i + 1, i + 2, i + 3, i) for i in (1, 2, 3)]
+        ShapeFile.write("Rectangle.bin", "Rectangle",
+                        ["id", "width", "height", "x", "y"], self.rects)
+
+    def tearDown(self):
+        """Delete any created files."""
+        try:
+            os.remove("Rectangle.bin")
+        except IOError:
+            pass
+
+    def test_fields(self):
+        with ShapeFile(Rectangle, "Rectangle.bin") as f:
+            self.assertEqual(["id", "width", "height", "x", "y"], f.fields)
+
+    def test_len(self):
+        with ShapeFile(Rectangle, "Rectangle.bin") as f:
+            self.assertEqual(3, len(f))
+
+    def test_record(self):
+        with ShapeFile(Rectangle, "Rectangle.bin") as f:
+            self.assertEqual(self.rects[1].to_dictionary(), f.record(1))
+
+    def test_record_negative(self):
+        with ShapeFile(Rectangle, "Rectangle.bin") as f:
+            self.assertEqual(3, f.record(-1)["id"])
+
+    def test_record_out_of_range(self):
+        with ShapeFile(Rectangle, "Rectangle.bin") as f:
+            with self.assertRaises(IndexError):
+                f.record(3)
+
+    def test_getitem(self):
+        with ShapeFile(Rectangle, "Rectangle.bin") as f:
+            self.assertEqual(str(self.rects[2]), str(f[2]))
+
+    def test_wrong_class(self):
+        with self.assertRaises(ValueError):
+            ShapeFile(Square, "Rectangle.bin")
+
+    def test_not_a_shape_file(self):
+        with open("Rectangle.bin", "wb") as f:
+            f.write(b"[]\n" * 4)
+        with self.assertRaises(ValueError):
+            ShapeFile(Rectangle, "Rectangle.bin")
+
+    def test_no_file(self):
+        with self.assertRaises(IOError):
+            ShapeFile(Rectangle, "Missing.bin")
+
+    def test_large_values(self):
+        r = Rectangle(2 ** 40, 2 ** 40, 0, 0, 2 ** 62)
+        ShapeFile.write("Rectangle.bin", "Rectangle",
+                        ["id", "width", "height", "x", "y"], [r])
+        with ShapeFile(Rectangle, "Rectangle.bin") as f:
+            self.assertEqual(r.to_dictionary(), f.record(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
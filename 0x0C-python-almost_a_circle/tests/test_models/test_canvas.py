@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+"""Defines unittests for models/canvas.py.
+
+Unittest classes:
+    TestCanvas_render_canvas - line 15
+    TestCanvas_display_canvas - line 49
+"""
+import io
+import unittest
+from models.canvas import display_canvas, render_canvas
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestCanvas_render_canvas(unittest.TestCase):
+    """Unittests for testing the render_canvas function."""
+
+    def test_empty(self):
+        self.assertEqual("", render_canvas([]))
+
+    def test_one_shape_matches_render(self):
+        r = Rectangle(2, 4, 3, 2, 0)
+        self.assertEqual(r.render(), render_canvas([r]))
+
+    def test_square_matches_render(self):
+        s = Square(3, 1, 1, 0)
+        self.assertEqual(s.render(), render_canvas([s]))
+
+    def test_two_shapes(self):
+        shapes = [Rectangle(2, 1, 0, 0, 0), Square(2, 3, 1, 0)]
+        self.assertEqual("##\n   ##\n   ##\n", render_canvas(shapes))
+
+    def test_overlap(self):
+        shapes = [Rectangle(3, 1, 0, 0, 0), Rectangle(3, 2, 2, 0, 0)]
+        self.assertEqual("#####\n  ###\n", render_canvas(shapes))
+
+    def test_fill(self):
+        self.assertEqual("**\n", render_canvas([Rectangle(2, 1)], "*"))
+
+    def test_generator(self):
+        output = render_canvas(Square(1, i, 0) for i in (0, 2))
+        self.assertEqual("# #\n", output)
+
+    def test_invalid_fill(self):
+        with self.assertRaises(ValueError):
+            render_canvas([Rectangle(2, 1)], "##")
+
+
+class TestCanvas_display_canvas(unittest.TestCase):
+    """Unittests for testing the display_canvas function."""
+
+    def test_display_canvas_file(self):
+        stream = io.StringIO()
+        display_canvas([Rectangle(2, 1, 1, 1, 0)], file=stream)
+        self.assertEqual("\n ##\n", stream.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+"""Defines unittests for models/chunked.py.
+
+Unittest classes:
+    TestChunkFile_write - line 25
+    TestChunkFile_read - line 70
+"""
+import os
+import unittest
+from models.chunked import ChunkFile
+from models.rectangle import Rectangle
+from models.square import Square
+
+FIELDS = ["id", "width", "height", "x", "y"]
+
+
+def remove_files():
+    """Delete any created files."""
+    try:
+        os.remove("shapes.chunks")
+    except IOError:
+        pass
+
+
+class TestChunkFile_write(unittest.TestCase):
+    """Unittests for testing ChunkFile.write."""
+
+    def tearDown(self):
+        remove_files()
+
+    def test_bad_codec(self):
+        with self.assertRaises(ValueError):
+            ChunkFile.write("shapes.chunks", "Rectangle", FIELDS, [], "bz2")
+
+    def test_bad_chunk_size(self):
+        with self.assertRaises(ValueError):
+            ChunkFile.write("shapes.chunks", "Rectangle", FIELDS, [],
+                            chunk_size=0)
+        with self.assertRaises(ValueError):
+            ChunkFile.write("shapes.chunks", "Rectangle", FIELDS, [],
+                            chunk_size=1.5)
+
+    def test_chunks(self):
+        rects = [Rectangle(2, 3, 0, 0, i) for i in range(10)]
+        ChunkFile.write("shapes.chunks", "Rectangle", FIELDS, rects,
+                        chunk_size=4)
+        with ChunkFile(Rectangle, "shapes.chunks") as f:
+            self.assertEqual(3, f.chunk_count)
+            self.assertEqual(10, len(f))
+
+    def test_empty(self):
+        ChunkFile.write("shapes.chunks", "Rectangle", FIELDS, [])
+        with ChunkFile(Rectangle, "shapes.chunks") as f:
+            self.assertEqual(0, f.chunk_count)
+            self.assertEqual([], list(f))
+
+    def test_compresses(self):
+        rects = [Rectangle(5, 5, 1, 1, i) for i in range(1000)]
+        ChunkFile.write("shapes.chunks", "Rectangle", FIELDS, rects)
+        self.assertLess(os.path.getsize("shapes.chunks"), 1000 * 5 * 8 / 4)
+
+    def test_generator(self):
+        ChunkFile.write("shapes.chunks", "Rectangle", FIELDS,
+                        (Rectangle(1, 1, 0, 0, i) for i in range(5)),
+                        chunk_size=2)
+        with ChunkFile(Rectangle, "shapes.chunks") as f:
+            self.assertEqual([0, 1, 2, 3, 4], [r.id for r in f])
+
+
+class TestChunkFile_read(unittest.TestCase):
+    """Unittests for testing reading a ChunkFile."""
+
+    def setUp(self):
+        self.squares = [Square(i % 7 + 1, i % 3, 0, 100 + i)
+                        for i in range(25)]
+
+    def tearDown(self):
+        remove_files()
+
+    def open(self, codec="zlib"):
+        ChunkFile.write("shapes.chunks", "Square", ["id", "size", "x", "y"],
+                        self.squares, codec, 10)
+        return ChunkFile(Square, "shapes.chunks")
+
+    def test_codecs_round_trip(self):
+        for codec in ("gzip", "zlib", "lzma"):
+            with self.open(codec) as f:
+                self.assertEqual(codec, f.codec)
+                self.assertEqual([str(s) for s in self.squares],
+                                 [str(s) for s in f])
+
+    def test_getitem(self):
+        with self.open() as f:
+            self.assertEqual(str(self.squares[13]), str(f[13]))
+            self.assertEqual(str(self.squares[-1]), str(f[-1]))
+            self.assertEqual(Square, type(f[0]))
+
+    def test_getitem_out_of_range(self):
+        with self.open() as f:
+            with self.assertRaises(IndexError):
+                f[25]
+            with self.assertRaises(IndexError):
+                f[-26]
+
+    def test_load_chunk(self):
+        with self.open() as f:
+            self.assertEqual([120 + i for i in range(5)],
+                             [s.id for s in f.load_chunk(2)])
+
+    def test_columns(self):
+        with self.open() as f:
+            columns = f.columns(1)
+            self.assertEqual(list(range(110, 120)), list(columns["id"]))
+            self.assertIs(columns, f.columns(1))
+
+    def test_find(self):
+        with self.open() as f:
+            self.assertEqual(str(self.squares[17]), str(f.find(117)))
+            self.assertIsNone(f.find(5))
+
+    def test_find_reads_one_chunk(self):
+        with self.open() as f:
+            f.find(117)
+            self.assertEqual(1, f._chunk[0])
+
+    def test_wrong_class(self):
+        self.open().close()
+        with self.assertRaisesRegex(ValueError, "Square"):
+            ChunkFile(Rectangle, "shapes.chunks")
+
+    def test_not_a_chunk_file(self):
+        with open("shapes.chunks", "wb") as f:
+            f.write(b"[]")
+        with self.assertRaises(ValueError):
+            ChunkFile(Square, "shapes.chunks")
+
+    def test_truncated(self):
+        self.open().close()
+        with open("shapes.chunks", "r+b") as f:
+            f.truncate(os.path.getsize("shapes.chunks") - 4)
+        with self.assertRaises(ValueError):
+            ChunkFile(Square, "shapes.chunks")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,271 @@
+#!/usr/bin/python3
+"""Defines unittests for models/collection.py.
+
+Unittest classes:
+    TestShapeCollection_init - line 27
+    TestShapeCollection_queries - line 78
+    TestShapeCollection_mutation - line 111
+    TestShapeCollection_buckets - line 165
+    TestShapeCollection_watch - line 206
+"""
+import os
+import random
+import unittest
+from models.collection import ShapeCollection
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class WatchedRectangle(Rectangle):
+    """A Rectangle subclass, so watching it leaves Rectangle untracked."""
+
+
+class WatchedSquare(Square):
+    """A Square subclass, so watching it leaves Square untracked."""
+
+
+class TestShapeCollection_init(unittest.TestCase):
+    """Unittests for testing building a ShapeCollection."""
+
+    def test_empty(self):
+        c = ShapeCollection()
+        self.assertEqual(0, len(c))
+        self.assertEqual([], list(c))
+
+    def test_iter_sorted_by_area(self):
+        shapes = [Rectangle(3, 3, 0, 0, 1), Square(1, 0, 0, 2),
+                  Rectangle(2, 1, 0, 0, 3)]
+        c = ShapeCollection(shapes)
+        self.assertEqual([2, 3, 1], [s.id for s in c])
+
+    def test_equal_areas_keep_insertion_order(self):
+        shapes = [Rectangle(2, 1, 0, 0, i) for i in range(5)]
+        c = ShapeCollection(shapes)
+        self.assertEqual(shapes, list(c))
+
+    def test_add_twice(self):
+        r = Rectangle(1, 1, 0, 0, 1)
+        c = ShapeCollection([r])
+        with self.assertRaises(ValueError):
+            c.add(r)
+
+    def test_add_duplicate_id(self):
+        c = ShapeCollection([Rectangle(1, 1, 0, 0, 1)])
+        with self.assertRaises(ValueError):
+            c.add(Rectangle(2, 2, 0, 0, 1))
+        self.assertEqual(1, len(c))
+
+    def test_remove(self):
+        r1, r2 = Rectangle(1, 1, 0, 0, 1), Rectangle(1, 1, 0, 0, 2)
+        c = ShapeCollection([r1, r2])
+        c.remove(r1)
+        self.assertEqual([r2], list(c))
+        self.assertNotIn(r1, c)
+        self.assertIsNone(c.get(1))
+        with self.assertRaises(KeyError):
+            c.remove(r1)
+
+    def test_from_file(self):
+        rects = [Rectangle(2, 3, 0, 0, 1), Rectangle(1, 1, 0, 0, 2)]
+        Rectangle.save_to_file(rects)
+        try:
+            c = ShapeCollection.from_file(Rectangle)
+        finally:
+            os.remove("Rectangle.json")
+        self.assertEqual([2, 1], [r.id for r in c])
+
+
+class TestShapeCollection_queries(unittest.TestCase):
+    """Unittests for testing ShapeCollection queries."""
+
+    def setUp(self):
+        self.shapes = [Rectangle(w, 1, 0, 0, w) for w in (5, 3, 8, 1, 3)]
+        self.shapes[4].id = 33
+        self.c = ShapeCollection(self.shapes)
+
+    def test_get(self):
+        self.assertIs(self.shapes[2], self.c.get(8))
+        self.assertIsNone(self.c.get(100))
+        self.assertEqual("x", self.c.get(100, "x"))
+
+    def test_largest(self):
+        self.assertEqual([8, 5], [s.area() for s in self.c.largest(2)])
+        self.assertEqual(5, len(self.c.largest(10)))
+        self.assertEqual([], self.c.largest(0))
+
+    def test_smallest(self):
+        self.assertEqual([1, 3, 3], [s.area() for s in self.c.smallest(3)])
+        self.assertEqual([], self.c.smallest(-1))
+
+    def test_area_range(self):
+        self.assertEqual([3, 33, 5],
+                         [s.id for s in self.c.area_range(3, 5)])
+        self.assertEqual([], self.c.area_range(6, 7))
+        self.assertEqual([], self.c.area_range(5, 3))
+
+    def test_contains(self):
+        self.assertIn(self.shapes[0], self.c)
+        self.assertNotIn(Rectangle(5, 1, 0, 0, 5), self.c)
+
+
+class TestShapeCollection_mutation(unittest.TestCase):
+    """Unittests for testing keeping the indexes in step with shapes."""
+
+    def setUp(self):
+        self.r1 = Rectangle(1, 1, 0, 0, 1)
+        self.r2 = Rectangle(2, 2, 0, 0, 2)
+        self.c = ShapeCollection([self.r1, self.r2])
+
+    def test_update_area(self):
+        self.c.update(self.r1, width=10)
+        self.assertEqual([self.r1], self.c.largest(1))
+
+    def test_update_id(self):
+        self.c.update(self.r1, 7, 8)
+        self.assertIs(self.r1, self.c.get(7))
+        self.assertIsNone(self.c.get(1))
+        self.assertEqual([self.r1, self.r2], self.c.largest(2))
+
+    def test_update_square(self):
+        s = Square(1, 0, 0, 3)
+        self.c.add(s)
+        self.c.update(s, size=5)
+        self.assertIs(s, self.c.largest(1)[0])
+
+    def test_update_duplicate_id_undone(self):
+        with self.assertRaises(ValueError):
+            self.c.update(self.r1, 2, 9)
+        self.assertEqual("[Rectangle] (1) 0/0 - 1/1", str(self.r1))
+        self.assertIs(self.r1, self.c.get(1))
+        self.assertEqual(2, len(self.c))
+
+    def test_update_invalid_value_undone(self):
+        with self.assertRaises(ValueError):
+            self.c.update(self.r1, 5, 3, 0)
+        self.assertIs(self.r1, self.c.get(1))
+        self.assertEqual([self.r1], self.c.smallest(1))
+
+    def test_set_fields(self):
+        self.c.set_fields(self.r1, width=3, height=3)
+        self.assertEqual([self.r1], self.c.largest(1))
+
+    def test_reindex(self):
+        self.r2.width = 1
+        self.r2.height = 1
+        self.r2.id = 5
+        self.c.reindex(self.r2)
+        self.assertEqual([self.r1, self.r2], self.c.smallest(2))
+        self.assertIs(self.r2, self.c.get(5))
+
+    def test_update_not_in_collection(self):
+        with self.assertRaises(KeyError):
+            self.c.update(Rectangle(1, 1), 3)
+
+
+class TestShapeCollection_buckets(unittest.TestCase):
+    """Unittests for testing the bucketed area index."""
+
+    def setUp(self):
+        rng = random.Random(5)
+        self.shapes = [Rectangle(rng.randint(1, 20), rng.randint(1, 20),
+                                 0, 0, i) for i in range(200)]
+        self.c = ShapeCollection()
+        self.c._load = 4
+        for shape in self.shapes:
+            self.c.add(shape)
+
+    def expected(self):
+        """Return the shapes sorted by area, in insertion order on ties."""
+        return sorted(self.shapes, key=lambda s: s.area())
+
+    def test_split(self):
+        self.assertGreater(len(self.c._shapes), 20)
+        self.assertTrue(all(len(b) <= 8 for b in self.c._shapes))
+        self.assertEqual(200, len(self.c))
+
+    def test_order(self):
+        self.assertEqual([s.id for s in self.expected()],
+                         [s.id for s in self.c])
+
+    def test_queries(self):
+        ordered = self.expected()
+        self.assertEqual(ordered[:-31:-1], self.c.largest(30))
+        self.assertEqual(ordered[:30], self.c.smallest(30))
+        self.assertEqual([s for s in ordered if 50 <= s.area() <= 120],
+                         self.c.area_range(50, 120))
+
+    def test_remove_all(self):
+        for shape in self.shapes[::2] + self.shapes[1::2]:
+            self.c.remove(shape)
+        self.assertEqual(([], [], 0), (self.c._shapes, self.c._maxes,
+                                       len(self.c)))
+        self.c.add(self.shapes[0])
+        self.assertEqual([self.shapes[0]], list(self.c))
+
+
+class TestShapeCollection_watch(unittest.TestCase):
+    """Unittests for testing collections that watch their shapes."""
+
+    def setUp(self):
+        self.r1 = WatchedRectangle(1, 1, 0, 0, 1)
+        self.r2 = WatchedRectangle(2, 2, 0, 0, 2)
+        self.s = WatchedSquare(3, 0, 0, 3)
+        self.c = ShapeCollection([self.r1, self.r2, self.s], watch=True)
+
+    def tearDown(self):
+        self.c.close()
+
+    def test_not_watching_base_classes(self):
+        self.assertIsNone(Rectangle._tracker)
+        self.assertIsNone(Square._tracker)
+
+    def test_update(self):
+        self.r1.update(width=100)
+        self.assertEqual([self.r1, self.s], self.c.largest(2))
+
+    def test_setter(self):
+        self.s.size = 1
+        self.assertEqual([self.r1, self.s], self.c.smallest(2))
+
+    def test_set_fields(self):
+        self.r2.set_fields(width=1, height=1)
+        self.assertEqual([self.r1, self.r2], self.c.smallest(2))
+
+    def test_update_id(self):
+        self.r1.update(9)
+        self.assertIs(self.r1, self.c.get(9))
+        self.assertIsNone(self.c.get(1))
+
+    def test_bulk_update(self):
+        WatchedRectangle.bulk_update([self.r1, self.r2], width=50)
+        self.assertEqual([self.r2, self.r1], self.c.largest(2))
+
+    def test_collection_update(self):
+        self.c.update(self.r1, width=10)
+        self.assertEqual([self.r1], self.c.largest(1))
+        self.assertEqual(3, len(self.c))
+
+    def test_removed_shape_ignored(self):
+        self.c.remove(self.r1)
+        self.r1.width = 30
+        self.assertNotIn(self.r1, self.c)
+        self.assertEqual([self.s], self.c.largest(1))
+
+    def test_records_nothing(self):
+        self.r1.width = 30
+        self.assertEqual(0, len(WatchedRectangle._tracker))
+
+    def test_close(self):
+        self.c.close()
+        self.r1.width = 30
+        self.assertEqual([self.s], self.c.largest(1))
+
+    def test_two_collections(self):
+        with ShapeCollection([self.r1], watch=True) as other:
+            self.r1.width = 30
+            self.assertEqual([self.r1], other.largest(1))
+        self.assertEqual([self.r1], self.c.largest(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
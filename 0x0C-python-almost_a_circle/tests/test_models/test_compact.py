@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+"""Defines unittests for models/compact.py.
+
+Unittest classes:
+    TestCompactRectangle - line 18
+    TestCompactSquare - line 93
+"""
+import io
+import os
+import sys
+import unittest
+from models.base import Base
+from models.compact import CompactRectangle, CompactSquare
+from models.rectangle import Rectangle, RectangleBase
+from models.square import Square, SquareBase
+
+
+class TestCompactRectangle(unittest.TestCase):
+    """Unittests for testing the CompactRectangle class."""
+
+    def test_is_base(self):
+        self.assertIsInstance(CompactRectangle(10, 2), Base)
+
+    def test_no_dict(self):
+        with self.assertRaises(AttributeError):
+            CompactRectangle(10, 2).__dict__
+
+    def test_shares_rectangle_behaviour(self):
+        self.assertTrue(issubclass(CompactRectangle, RectangleBase))
+        self.assertTrue(issubclass(Rectangle, RectangleBase))
+        for name in ("width", "update", "set_fields", "to_dictionary"):
+            self.assertNotIn(name, vars(CompactRectangle))
+
+    def test_no_new_attributes(self):
+        with self.assertRaises(AttributeError):
+            CompactRectangle(10, 2).color = "red"
+
+    def test_width_private(self):
+        with self.assertRaises(AttributeError):
+            print(CompactRectangle(5, 5, 0, 0, 1).__width)
+
+    def test_consecutive_ids(self):
+        r1 = CompactRectangle(10, 2)
+        r2 = CompactRectangle(2, 10)
+        self.assertEqual(r1.id, r2.id - 1)
+
+    def test_str(self):
+        r = CompactRectangle(4, 6, 2, 1, 12)
+        self.assertEqual("[Rectangle] (12) 2/1 - 4/6", str(r))
+
+    def test_invalid_width(self):
+        with self.assertRaisesRegex(TypeError, "width must be an integer"):
+            CompactRectangle("1", 2)
+
+    def test_invalid_y(self):
+        with self.assertRaisesRegex(ValueError, "y must be >= 0"):
+            CompactRectangle(1, 2, 3, -1)
+
+    def test_area(self):
+        self.assertEqual(12, CompactRectangle(3, 4).area())
+
+    def test_display(self):
+        capture = io.StringIO()
+        sys.stdout = capture
+        CompactRectangle(2, 1, 1, 1, 0).display()
+        sys.stdout = sys.__stdout__
+        self.assertEqual("\n ##\n", capture.getvalue())
+
+    def test_update_args(self):
+        r = CompactRectangle(10, 10, 10, 10, 10)
+        r.update(89, 2, 3, 4, 5)
+        self.assertEqual("[Rectangle] (89) 4/5 - 2/3", str(r))
+
+    def test_update_kwargs(self):
+        r = CompactRectangle(10, 10, 10, 10, 10)
+        r.update(y=1, width=2, x=3, id=89)
+        self.assertEqual("[Rectangle] (89) 3/1 - 2/10", str(r))
+
+    def test_to_dictionary(self):
+        r = CompactRectangle(10, 2, 1, 9, 5)
+        correct = {'x': 1, 'y': 9, 'id': 5, 'height': 2, 'width': 10}
+        self.assertDictEqual(correct, r.to_dictionary())
+
+    def test_save_and_load(self):
+        r = CompactRectangle(10, 7, 2, 8, 1)
+        CompactRectangle.save_to_file([r])
+        output = CompactRectangle.load_from_file()
+        os.remove("CompactRectangle.json")
+        self.assertEqual(CompactRectangle, type(output[0]))
+        self.assertEqual(str(r), str(output[0]))
+
+
+class TestCompactSquare(unittest.TestCase):
+    """Unittests for testing the CompactSquare class."""
+
+    def test_is_compact_rectangle(self):
+        self.assertIsInstance(CompactSquare(10), CompactRectangle)
+
+    def test_no_dict(self):
+        with self.assertRaises(AttributeError):
+            CompactSquare(10).__dict__
+
+    def test_shares_square_behaviour(self):
+        self.assertTrue(issubclass(CompactSquare, SquareBase))
+        self.assertTrue(issubclass(Square, SquareBase))
+        for name in ("size", "update", "to_dictionary", "__str__"):
+            self.assertNotIn(name, vars(CompactSquare))
+
+    def test_track_changes(self):
+        class TrackedCompactSquare(CompactSquare):
+            __slots__ = ()
+        tracker = TrackedCompactSquare.track_changes()
+        s = TrackedCompactSquare(2)
+        tracker.clear()
+        s.size = 3
+        self.assertIn(s, tracker)
+
+    def test_str(self):
+        s = CompactSquare(3, 5, 1, 7)
+        self.assertEqual("[Square] (7) 5/1 - 3", str(s))
+
+    def test_size(self):
+        s = CompactSquare(3)
+        s.size = 8
+        self.assertEqual((8, 8), (s.width, s.height))
+
+    def test_invalid_size(self):
+        with self.assertRaisesRegex(ValueError, "width must be > 0"):
+            CompactSquare(0)
+
+    def test_update_args(self):
+        s = CompactSquare(10, 10, 10, 10)
+        s.update(89, 2, 3, 4)
+        self.assertEqual("[Square] (89) 3/4 - 2", str(s))
+
+    def test_update_kwargs(self):
+        s = CompactSquare(10, 10, 10, 10)
+        s.update(size=1, id=89)
+        self.assertEqual("[Square] (89) 10/10 - 1", str(s))
+
+    def test_bulk_update(self):
+        squares = [CompactSquare(1, 2, 3, 4), CompactSquare(5, 6, 7, 8)]
+        CompactSquare.bulk_update(squares, size=3, x=0)
+        self.assertEqual(["[Square] (4) 0/3 - 3", "[Square] (8) 0/7 - 3"],
+                         [str(s) for s in squares])
+
+    def test_to_dictionary(self):
+        s = CompactSquare(10, 2, 1, 1)
+        correct = {'id': 1, 'x': 2, 'size': 10, 'y': 1}
+        self.assertDictEqual(correct, s.to_dictionary())
+
+    def test_save_and_load_csv(self):
+        s = CompactSquare(5, 1, 3, 3)
+        CompactSquare.save_to_file_csv([s])
+        output = CompactSquare.load_from_file_csv()
+        os.remove("CompactSquare.csv")
+        self.assertEqual(CompactSquare, type(output[0]))
+        self.assertEqual(str(s), str(output[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+"""Defines unittests for models/dedup.py.
+
+Unittest classes:
+    TestDedup_GeometryMixin - line 28
+    TestDedup_iter_unique_records - line 71
+    TestDedup_dedup_file - line 109
+"""
+import glob
+import os
+import unittest
+from models.dedup import (HashableRectangle, HashableSquare, dedup_file,
+                          iter_unique_records, load_unique)
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+def remove_files():
+    """Delete any created files."""
+    for filename in ("Rectangle.json", "Rectangle.csv",
+                     "Square.json", "Square.csv"):
+        try:
+            os.remove(filename)
+        except IOError:
+            pass
+
+
+class TestDedup_GeometryMixin(unittest.TestCase):
+    """Unittests for testing geometric equality and hashing."""
+
+    def test_default_equality_unchanged(self):
+        self.assertNotEqual(Rectangle(2, 3, 0, 0, 1), Rectangle(2, 3, 0, 0, 2))
+
+    def test_equal_ignores_id(self):
+        r1 = HashableRectangle(2, 3, 1, 0, 1)
+        r2 = HashableRectangle(2, 3, 1, 0, 2)
+        self.assertEqual(r1, r2)
+        self.assertEqual(hash(r1), hash(r2))
+
+    def test_not_equal(self):
+        r1 = HashableRectangle(2, 3, 1, 0, 1)
+        self.assertNotEqual(r1, HashableRectangle(2, 3, 0, 1, 1))
+        self.assertNotEqual(r1, HashableRectangle(3, 2, 1, 0, 1))
+
+    def test_square_equals_rectangle(self):
+        self.assertEqual(HashableRectangle(2, 2, 1, 1, 1),
+                         HashableSquare(2, 1, 1, 2))
+
+    def test_not_equal_to_plain_shape(self):
+        self.assertNotEqual(HashableRectangle(2, 2, 0, 0, 1),
+                            Rectangle(2, 2, 0, 0, 1))
+
+    def test_set(self):
+        shapes = [HashableRectangle(2, 3, 0, 0, 1),
+                  HashableRectangle(2, 3, 0, 0, 2),
+                  HashableSquare(2, 0, 0, 3)]
+        self.assertEqual(2, len(set(shapes)))
+
+    def test_geometry(self):
+        self.assertEqual((4, 4, 1, 2), HashableSquare(4, 1, 2).geometry())
+
+    def test_save_and_load(self):
+        r = HashableRectangle(2, 3, 1, 0, 5)
+        HashableRectangle.save_to_file_csv([r])
+        try:
+            self.assertEqual([r], HashableRectangle.load_from_file_csv())
+        finally:
+            os.remove("HashableRectangle.csv")
+
+
+class TestDedup_iter_unique_records(unittest.TestCase):
+    """Unittests for testing the iter_unique_records function."""
+
+    def tearDown(self):
+        remove_files()
+
+    def test_no_file(self):
+        self.assertEqual([], list(iter_unique_records(Rectangle)))
+
+    def test_json_keeps_first(self):
+        Rectangle.save_to_file([Rectangle(2, 3, 0, 0, 1),
+                                Rectangle(4, 5, 0, 0, 2),
+                                Rectangle(2, 3, 0, 0, 3)])
+        ids = [d["id"] for d in iter_unique_records(Rectangle)]
+        self.assertEqual([1, 2], ids)
+
+    def test_csv_squares(self):
+        Square.save_to_file_csv([Square(2, 0, 0, 1), Square(2, 1, 0, 2),
+                                 Square(2, 0, 0, 3)])
+        ids = [d["id"] for d in iter_unique_records(Square, "csv")]
+        self.assertEqual([1, 2], ids)
+
+    def test_empty_csv(self):
+        Square.save_to_file_csv([])
+        self.assertEqual([], list(iter_unique_records(Square, "csv")))
+
+    def test_bad_format(self):
+        with self.assertRaises(ValueError):
+            list(iter_unique_records(Rectangle, "xml"))
+
+    def test_load_unique(self):
+        Rectangle.save_to_file([Rectangle(2, 3, 0, 0, 1),
+                                Rectangle(2, 3, 0, 0, 2)])
+        shapes = load_unique(Rectangle)
+        self.assertEqual(["[Rectangle] (1) 0/0 - 2/3"],
+                         [str(r) for r in shapes])
+
+
+class TestDedup_dedup_file(unittest.TestCase):
+    """Unittests for testing the dedup_file function."""
+
+    def tearDown(self):
+        remove_files()
+
+    def test_json(self):
+        Rectangle.save_to_file([Rectangle(2, 3, 0, 0, 1),
+                                Rectangle(2, 3, 0, 0, 2),
+                                Rectangle(1, 1, 0, 0, 3)])
+        self.assertEqual(2, dedup_file(Rectangle))
+        ids = [r.id for r in Rectangle.load_from_file()]
+        self.assertEqual([1, 3], ids)
+        self.assertFalse(os.path.exists("Rectangle.json.tmp"))
+
+    def test_csv(self):
+        Square.save_to_file_csv([Square(2, 0, 0, 1), Square(2, 0, 0, 2)])
+        self.assertEqual(1, dedup_file(Square, "csv"))
+        self.assertEqual(["[Square] (1) 0/0 - 2"],
+                         [str(s) for s in Square.load_from_file_csv()])
+
+    def test_empty(self):
+        Rectangle.save_to_file([])
+        self.assertEqual(0, dedup_file(Rectangle))
+        self.assertEqual([], Rectangle.load_from_file())
+        Rectangle.save_to_file_csv([])
+        self.assertEqual(0, dedup_file(Rectangle, "csv"))
+        with open("Rectangle.csv", "r") as f:
+            self.assertEqual("[]", f.read())
+
+    def test_no_file(self):
+        self.assertEqual(0, dedup_file(Rectangle))
+        self.assertEqual(0, dedup_file(Square, "csv"))
+        self.assertEqual([], glob.glob("Rectangle.json*"))
+        self.assertEqual([], glob.glob("Square.csv*"))
+
+    def test_bad_format(self):
+        with self.assertRaises(ValueError):
+            dedup_file(Rectangle, "xml")
+        self.assertEqual([], glob.glob("Rectangle.xml*"))
+
+    def test_malformed_file(self):
+        text = '[{"id": 1, "width": 2, "height": 3, "x": 0, "y": 0}, {"id"'
+        with open("Rectangle.json", "w") as f:
+            f.write(text)
+        with self.assertRaises(ValueError):
+            dedup_file(Rectangle)
+        self.assertEqual(["Rectangle.json"], glob.glob("Rectangle.json*"))
+        with open("Rectangle.json", "r") as f:
+            self.assertEqual(text, f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
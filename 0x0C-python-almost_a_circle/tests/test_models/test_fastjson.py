@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+"""Defines unittests for models/fastjson.py.
+
+Unittest classes:
+    TestFastjson_encode_records - line 15
+    TestFastjson_encode_list - line 38
+"""
+import json
+import unittest
+from models.fastjson import encode_list, encode_records
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestFastjson_encode_records(unittest.TestCase):
+    """Unittests for testing the encode_records function."""
+
+    def test_rectangles(self):
+        dicts = [Rectangle(i + 1, 2, i, 0, i).to_dictionary()
+                 for i in range(5)]
+        self.assertEqual(json.dumps(dicts)[1:-1], encode_records(dicts))
+
+    def test_squares(self):
+        dicts = [Square(3, 1, 2, 7).to_dictionary(),
+                 Square(1, 0, 0, -4).to_dictionary()]
+        self.assertEqual(
+            '{"id": 7, "size": 3, "x": 1, "y": 2}, '
+            '{"id": -4, "size": 1, "x": 0, "y": 0}', encode_records(dicts))
+
+    def test_empty(self):
+        self.assertEqual("", encode_records([]))
+
+    def test_big_int(self):
+        dicts = [{"id": 2 ** 80}]
+        self.assertEqual(json.dumps(dicts)[1:-1], encode_records(dicts))
+
+
+class TestFastjson_encode_list(unittest.TestCase):
+    """Unittests for testing that encode_list matches json.dumps."""
+
+    def check(self, value):
+        self.assertEqual(json.dumps(value), encode_list(value))
+
+    def test_shapes(self):
+        self.check([Rectangle(2, 3, 1, 0, 1).to_dictionary(),
+                    Rectangle(4, 5, 0, 2, 2).to_dictionary()])
+
+    def test_mixed_keys(self):
+        self.check([{"id": 1, "size": 2}, {"id": 1, "width": 2}])
+        self.check([{"id": 1}, {"id": 1, "x": 2}])
+
+    def test_key_order(self):
+        self.check([{"id": 1, "x": 2}, {"x": 2, "id": 1}])
+
+    def test_non_int_values(self):
+        for value in (True, 1.5, None, "1", [1], float("inf")):
+            self.check([{"id": 1, "x": value}])
+
+    def test_non_str_keys(self):
+        self.check([{1: 2}])
+
+    def test_escaped_keys(self):
+        self.check([{"%d": 1, "a\"b": 2, "é": 3}])
+
+    def test_not_dicts(self):
+        self.check([1, 2])
+        self.check([{"a": 1}, "a"])
+        self.check([[1], [2]])
+
+    def test_empty_dicts(self):
+        self.check([{}, {}])
+
+    def test_dict_subclass(self):
+        class Record(dict):
+            pass
+        self.check([Record(id=1), {"id": 2}])
+
+    def test_not_a_list(self):
+        self.check(({"id": 1},))
+        self.check({"id": 1})
+        self.check(None)
+
+    def test_empty(self):
+        self.check([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+"""Defines unittests for models/fields.py.
+
+Unittest classes:
+    TestIntField - line 13
+    TestCompileUpdate - line 72
+"""
+import unittest
+from models.fields import IntField, compile_update
+from models.tracking import ChangeTracker
+
+
+class TestIntField(unittest.TestCase):
+    """Unittests for testing the IntField class."""
+
+    def setUp(self):
+        class Shape:
+            side = IntField("side", 1, ("_a", "_b"), label="edge").property(
+                "The side.")
+        self.shape = Shape()
+
+    def test_messages_positive(self):
+        f = IntField("width", 1, "_w")
+        self.assertEqual("width must be an integer", f.type_message)
+        self.assertEqual("width must be > 0", f.value_message)
+
+    def test_messages_non_negative(self):
+        f = IntField("x", 0, "_x")
+        self.assertEqual("x must be >= 0", f.value_message)
+
+    def test_check_valid(self):
+        self.assertIsNone(IntField("x", 0, "_x").check(0))
+
+    def test_check_bool(self):
+        with self.assertRaisesRegex(TypeError, "x must be an integer"):
+            IntField("x", 0, "_x").check(True)
+
+    def test_check_below_minimum(self):
+        with self.assertRaisesRegex(ValueError, "x must be >= 0"):
+            IntField("x", 0, "_x").check(-1)
+
+    def test_bad_attr(self):
+        with self.assertRaises(ValueError):
+            IntField("x", 0, "self.x")
+
+    def test_property_sets_every_attr(self):
+        self.shape.side = 4
+        self.assertEqual((4, 4), (self.shape._a, self.shape._b))
+        self.assertEqual(4, self.shape.side)
+
+    def test_property_label(self):
+        with self.assertRaisesRegex(TypeError, "edge must be an integer"):
+            self.shape.side = "4"
+        with self.assertRaisesRegex(ValueError, "edge must be > 0"):
+            self.shape.side = 0
+
+    def test_property_doc(self):
+        self.assertEqual("The side.", type(self.shape).side.__doc__)
+
+    def test_tracked_property_marks(self):
+        class Shape:
+            side = IntField("side", 1, "_a").property(tracked=True)
+            _tracker = None
+        shape = Shape()
+        shape.side = 2
+        Shape._tracker = ChangeTracker()
+        shape.side = 3
+        self.assertEqual([shape], Shape._tracker.changed())
+        self.assertEqual(3, shape.side)
+
+
+class TestCompileUpdate(unittest.TestCase):
+    """Unittests for testing the compile_update function."""
+
+    def setUp(self):
+        class Shape:
+            update = compile_update(("id", "a", "b"), "Update it.")
+
+            def _set_id(self, value):
+                self.id = value or 0
+        self.shape = Shape()
+
+    def test_doc(self):
+        self.assertEqual("Update it.", type(self.shape).update.__doc__)
+
+    def test_positional(self):
+        self.shape.update(None, 1, 2, 3)
+        self.assertEqual((0, 1, 2), (self.shape.id, self.shape.a,
+                                     self.shape.b))
+
+    def test_positional_partial(self):
+        self.shape.update(5)
+        self.assertEqual(5, self.shape.id)
+        self.assertFalse(hasattr(self.shape, "a"))
+
+    def test_keywords(self):
+        self.shape.update(b=2, c=3)
+        self.assertEqual(2, self.shape.b)
+        self.assertFalse(hasattr(self.shape, "c"))
+
+    def test_args_win_over_keywords(self):
+        self.shape.update(4, b=2)
+        self.assertFalse(hasattr(self.shape, "b"))
+
+    def test_bad_name(self):
+        with self.assertRaises(ValueError):
+            compile_update(("id", "a = 1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
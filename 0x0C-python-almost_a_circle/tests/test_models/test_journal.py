@@ -0,0 +1,195 @@
+#!/usr/bin/python3
+"""Defines unittests for models/journal.py.
+
+Unittest classes:
+    TestJournal - line 26
+    TestJournal_compact - line 91
+    TestJournal_compact_errors - line 145
+"""
+import os
+import unittest
+from models.journal import Journal
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+def remove_files():
+    """Delete any files created by a Journal."""
+    for name in ("Rectangle", "Square"):
+        for ext in (".json", ".journal", ".journal.compacting"):
+            try:
+                os.remove(name + ext)
+            except IOError:
+                pass
+
+
+class TestJournal(unittest.TestCase):
+    """Unittests for testing appending to and loading a Journal."""
+
+    def tearDown(self):
+        remove_files()
+
+    def test_load_empty(self):
+        with Journal(Rectangle) as journal:
+            self.assertEqual([], journal.load())
+
+    def test_put_appends_one_line(self):
+        r = Rectangle(10, 7, 2, 8, 5)
+        with Journal(Rectangle) as journal:
+            journal.put(r)
+            journal.put(r)
+        with open("Rectangle.journal", "r") as f:
+            self.assertEqual(2, len(f.readlines()))
+
+    def test_put_and_load(self):
+        r1 = Rectangle(10, 7, 2, 8, 1)
+        r2 = Rectangle(2, 4, 5, 6, 2)
+        with Journal(Rectangle) as journal:
+            journal.put(r1, r2)
+            output = journal.load()
+        self.assertEqual([str(r1), str(r2)], [str(r) for r in output])
+
+    def test_update_keeps_position(self):
+        r1 = Rectangle(10, 7, 2, 8, 1)
+        r2 = Rectangle(2, 4, 5, 6, 2)
+        with Journal(Rectangle) as journal:
+            journal.put(r1, r2)
+            r1.update(width=3)
+            journal.put(r1)
+            output = journal.load()
+        self.assertEqual([str(r1), str(r2)], [str(r) for r in output])
+
+    def test_delete(self):
+        r1 = Rectangle(10, 7, 2, 8, 1)
+        r2 = Rectangle(2, 4, 5, 6, 2)
+        with Journal(Rectangle) as journal:
+            journal.put(r1, r2)
+            journal.delete(r1)
+            journal.delete(99)
+            output = journal.load()
+        self.assertEqual([str(r2)], [str(r) for r in output])
+
+    def test_replays_on_snapshot(self):
+        s1 = Square(5, 1, 3, 1)
+        s2 = Square(9, 5, 2, 2)
+        Square.save_to_file([s1, s2])
+        s2.update(size=4)
+        with Journal(Square) as journal:
+            journal.put(s2)
+            output = journal.load()
+        self.assertEqual([str(s1), str(s2)], [str(s) for s in output])
+        self.assertTrue(all(type(obj) == Square for obj in output))
+
+    def test_reopen(self):
+        s = Square(5, 1, 3, 1)
+        with Journal(Square) as journal:
+            journal.put(s)
+        with Journal(Square) as journal:
+            self.assertEqual([str(s)], [str(o) for o in journal.load()])
+
+
+class TestJournal_compact(unittest.TestCase):
+    """Unittests for testing compaction of a Journal."""
+
+    def tearDown(self):
+        remove_files()
+
+    def test_compact_writes_snapshot(self):
+        r = Rectangle(10, 7, 2, 8, 1)
+        with Journal(Rectangle) as journal:
+            journal.put(r)
+            journal.compact()
+        self.assertEqual(str(r), str(Rectangle.load_from_file()[0]))
+        self.assertEqual(0, os.path.getsize("Rectangle.journal"))
+        self.assertFalse(os.path.exists("Rectangle.journal.compacting"))
+
+    def test_compact_keeps_state(self):
+        rects = [Rectangle(i, i, 0, 0, i) for i in range(1, 6)]
+        with Journal(Rectangle) as journal:
+            journal.put(*rects)
+            journal.delete(3)
+            before = [str(r) for r in journal.load()]
+            journal.compact()
+            self.assertEqual(before, [str(r) for r in journal.load()])
+
+    def test_background_compaction(self):
+        with Journal(Square, compact_every=10) as journal:
+            for i in range(1, 26):
+                journal.put(Square(i, 0, 0, i))
+            journal.wait()
+            self.assertEqual(25, len(journal.load()))
+        self.assertTrue(os.path.exists("Square.json"))
+
+    def test_interrupted_compaction(self):
+        s1 = Square(5, 1, 3, 1)
+        s2 = Square(9, 5, 2, 2)
+        with Journal(Square) as journal:
+            journal.put(s1)
+        os.rename("Square.journal", "Square.journal.compacting")
+        with Journal(Square) as journal:
+            journal.put(s2)
+            self.assertEqual(2, len(journal.load()))
+            journal.compact()
+            self.assertEqual(2, len(journal.load()))
+
+    def test_reopen_counts_compacting(self):
+        with Journal(Square) as journal:
+            journal.put(Square(1), Square(2))
+        os.rename("Square.journal", "Square.journal.compacting")
+        with Journal(Square, compact_every=3) as journal:
+            journal.put(Square(3))
+            journal.wait()
+        self.assertEqual(3, len(Square.load_from_file()))
+
+
+class TestJournal_compact_errors(unittest.TestCase):
+    """Unittests for testing failed background compactions."""
+
+    def setUp(self):
+        os.mkdir("Square.json.tmp")
+
+    def tearDown(self):
+        try:
+            os.rmdir("Square.json.tmp")
+        except OSError:
+            pass
+        remove_files()
+
+    def test_wait_raises(self):
+        with Journal(Square, compact_every=2) as journal:
+            journal.put(Square(1), Square(2))
+            with self.assertRaises(IsADirectoryError):
+                journal.wait()
+            journal.wait()
+            self.assertEqual(2, len(journal.load()))
+
+    def test_put_raises(self):
+        journal = Journal(Square, compact_every=2)
+        journal.put(Square(1), Square(2))
+        journal._compactor.join()
+        with self.assertRaises(IsADirectoryError):
+            journal.put(Square(3))
+        journal.put(Square(4))
+        journal._compactor.join()
+        with self.assertRaises(IsADirectoryError):
+            journal.close()
+        self.assertTrue(journal._file.closed)
+        with Journal(Square) as journal:
+            self.assertEqual([1, 2, 4], [s.size for s in journal.load()])
+
+    def test_pending_kept_until_retry(self):
+        with Journal(Square, compact_every=2) as journal:
+            journal.put(Square(1), Square(2))
+            with self.assertRaises(IsADirectoryError):
+                journal.wait()
+            self.assertEqual(2, journal._pending)
+            os.rmdir("Square.json.tmp")
+            journal.put(Square(3))
+            journal.wait()
+            self.assertEqual(0, journal._pending)
+        self.assertEqual(3, len(Square.load_from_file()))
+        self.assertFalse(os.path.exists("Square.journal.compacting"))
+
+
+if __name__ == "__main__":
+    unittest.main()
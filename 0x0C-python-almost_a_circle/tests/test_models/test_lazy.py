@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+"""Defines unittests for models/lazy.py.
+
+Unittest classes:
+    TestLazyShapeList - line 14
+"""
+import os
+import unittest
+from models.lazy import LazyShapeList
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestLazyShapeList(unittest.TestCase):
+    """Unittests for testing the LazyShapeList class."""
+
+    def setUp(self):
+        self.squares = [Square(i + 1, i, 0, 10 + i) for i in range(5)]
+        Square.save_to_file(self.squares)
+        self.lazy = LazyShapeList(Square, "Square.json")
+
+    def tearDown(self):
+        self.lazy.close()
+        for filename in ("Square.json", "Empty.json"):
+            try:
+                os.remove(filename)
+            except IOError:
+                pass
+
+    def test_no_file(self):
+        with self.assertRaises(IOError):
+            LazyShapeList(Square, "Missing.json")
+
+    def test_nothing_scanned_on_open(self):
+        self.assertEqual(0, len(self.lazy._starts))
+        self.assertEqual({}, self.lazy._cache)
+
+    def test_getitem_scans_only_as_far_as_needed(self):
+        self.assertEqual("[Square] (11) 1/0 - 2", str(self.lazy[1]))
+        self.assertEqual(2, len(self.lazy._starts))
+        self.assertEqual([1], list(self.lazy._cache))
+
+    def test_getitem_cached(self):
+        self.assertIs(self.lazy[2], self.lazy[2])
+
+    def test_negative_index(self):
+        self.assertEqual(14, self.lazy[-1].id)
+
+    def test_index_error(self):
+        with self.assertRaises(IndexError):
+            self.lazy[5]
+        with self.assertRaises(IndexError):
+            self.lazy[-6]
+
+    def test_slice(self):
+        self.assertEqual([10, 11], [s.id for s in self.lazy[:2]])
+        self.assertEqual(2, len(self.lazy._starts))
+        self.assertEqual([14, 12], [s.id for s in self.lazy[::-2]][:2])
+
+    def test_len(self):
+        self.assertEqual(5, len(self.lazy))
+        self.assertEqual({}, self.lazy._cache)
+
+    def test_iter(self):
+        self.assertEqual([str(s) for s in self.squares],
+                         [str(s) for s in self.lazy])
+
+    def test_iter_partial(self):
+        for shape in self.lazy:
+            break
+        self.assertEqual(1, len(self.lazy._starts))
+
+    def test_record(self):
+        self.assertEqual({"id": 10, "size": 1, "x": 0, "y": 0},
+                         self.lazy.record(0))
+        self.assertEqual({}, self.lazy._cache)
+
+    def test_empty_file(self):
+        open("Empty.json", "w").close()
+        with LazyShapeList(Rectangle, "Empty.json") as lazy:
+            self.assertEqual([], list(lazy))
+
+
+if __name__ == "__main__":
+    unittest.main()
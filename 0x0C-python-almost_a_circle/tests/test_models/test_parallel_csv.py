@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+"""Defines unittests for models/parallel_csv.py.
+
+Unittest classes:
+    TestParallelCsv_chunk_bounds - line 16
+    TestParallelCsv_load - line 40
+"""
+import os
+import unittest
+from models.batch import RectangleBatch, SquareBatch
+from models.parallel_csv import chunk_bounds, load_from_file_csv_parallel
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestParallelCsv_chunk_bounds(unittest.TestCase):
+    """Unittests for testing the chunk_bounds function."""
+
+    def tearDown(self):
+        os.remove("Rectangle.csv")
+
+    def test_chunks_end_at_line_breaks(self):
+        Rectangle.save_to_file_csv([Rectangle(i, i) for i in range(1, 50)])
+        with open("Rectangle.csv", "rb") as f:
+            data = f.read()
+        bounds = chunk_bounds("Rectangle.csv", 40)
+        self.assertTrue(len(bounds) > 1)
+        self.assertEqual(0, bounds[0][0])
+        self.assertEqual(len(data), bounds[-1][1])
+        for start, end in bounds:
+            self.assertEqual(b"\n", data[end - 1:end])
+
+    def test_chunks_are_contiguous(self):
+        Rectangle.save_to_file_csv([Rectangle(i, i) for i in range(1, 50)])
+        bounds = chunk_bounds("Rectangle.csv", 40)
+        for (a, b), (c, d) in zip(bounds, bounds[1:]):
+            self.assertEqual(b, c)
+
+
+class TestParallelCsv_load(unittest.TestCase):
+    """Unittests for testing the load_from_file_csv_parallel function."""
+
+    def tearDown(self):
+        """Delete any created files."""
+        try:
+            os.remove("Rectangle.csv")
+        except IOError:
+            pass
+        try:
+            os.remove("Square.csv")
+        except IOError:
+            pass
+
+    def test_rectangles_in_order(self):
+        rects = [Rectangle(i, i + 1, i % 3, i % 5, i) for i in range(1, 300)]
+        Rectangle.save_to_file_csv(rects)
+        output = load_from_file_csv_parallel(Rectangle, workers=2,
+                                             chunk_size=256)
+        self.assertEqual([str(r) for r in rects], [str(r) for r in output])
+        self.assertTrue(all(type(obj) == Rectangle for obj in output))
+
+    def test_squares(self):
+        s1 = Square(5, 1, 3, 3)
+        s2 = Square(9, 5, 2, 4)
+        Square.save_to_file_csv([s1, s2])
+        output = load_from_file_csv_parallel(Square, workers=2)
+        self.assertEqual([str(s1), str(s2)], [str(s) for s in output])
+
+    def test_same_as_load_from_file_csv(self):
+        Square.save_to_file_csv([Square(i, 1, 2, i) for i in range(1, 40)])
+        expected = [str(s) for s in Square.load_from_file_csv()]
+        output = load_from_file_csv_parallel(Square, chunk_size=64)
+        self.assertEqual(expected, [str(s) for s in output])
+
+    def test_as_batch_rectangle(self):
+        Rectangle.save_to_file_csv([Rectangle(2, 3, 0, 0, 7)])
+        output = load_from_file_csv_parallel(Rectangle, as_batch=True)
+        self.assertEqual(RectangleBatch, type(output))
+        self.assertEqual("[Rectangle] (7) 0/0 - 2/3", str(output[0]))
+
+    def test_as_batch_square(self):
+        Square.save_to_file_csv([Square(4, 1, 2, 3), Square(5, 0, 0, 4)])
+        output = load_from_file_csv_parallel(Square, as_batch=True)
+        self.assertEqual(SquareBatch, type(output))
+        self.assertEqual(41, output.total_area())
+
+    def test_empty_list(self):
+        Square.save_to_file_csv([])
+        self.assertEqual([], load_from_file_csv_parallel(Square))
+
+    def test_no_file(self):
+        self.assertEqual([], load_from_file_csv_parallel(Square))
+
+    def test_wrong_number_of_fields(self):
+        with open("Square.csv", "w") as f:
+            f.write("1,2,3\n")
+        with self.assertRaises(ValueError):
+            load_from_file_csv_parallel(Square)
+
+    def test_fields_split_across_lines(self):
+        with open("Rectangle.csv", "w") as f:
+            f.write("1,2,3,4\n5,6,7,8,9,10\n")
+        with self.assertRaises(ValueError):
+            load_from_file_csv_parallel(Rectangle)
+
+    def test_blank_lines(self):
+        with open("Rectangle.csv", "w", newline="") as f:
+            f.write("1,10,7,2,8\r\n\r\n2,2,4,5,6\r\n\n")
+        output = load_from_file_csv_parallel(Rectangle, chunk_size=8)
+        self.assertEqual([1, 2], [r.id for r in output])
+        self.assertEqual([10, 2], [r.width for r in output])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+"""Defines unittests for models/pool.py.
+
+Unittest classes:
+    TestShapePool_instantiation - line 16
+    TestShapePool_acquire - line 49
+    TestShapePool_release - line 146
+"""
+import unittest
+from models.compact import CompactSquare
+from models.pool import ShapePool, _compile_reset
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestShapePool_instantiation(unittest.TestCase):
+    """Unittests for testing instantiation of the ShapePool class."""
+
+    def test_empty(self):
+        pool = ShapePool(Rectangle)
+        self.assertEqual(0, len(pool))
+        self.assertEqual(1024, pool.maxsize)
+
+    def test_maxsize_not_int(self):
+        with self.assertRaisesRegex(TypeError, "maxsize must be an integer"):
+            ShapePool(Rectangle, "10")
+
+    def test_maxsize_negative(self):
+        with self.assertRaisesRegex(ValueError, "maxsize must be >= 0"):
+            ShapePool(Rectangle, -1)
+
+    def test_compiled_reset(self):
+        self.assertIsNotNone(_compile_reset(Rectangle))
+        self.assertIsNotNone(_compile_reset(Square))
+
+    def test_other_constructor_uses_init(self):
+        class PoolLabelled(Rectangle):
+            def __init__(self, width, height, label="", id=None):
+                super().__init__(width, height, id=id)
+                self.label = label
+        self.assertIsNone(_compile_reset(PoolLabelled))
+        pool = ShapePool(PoolLabelled)
+        r = pool.acquire(2, 3, "a")
+        pool.release(r)
+        self.assertIs(r, pool.acquire(4, 5, "b"))
+        self.assertEqual(("b", 4), (r.label, r.width))
+
+
+class TestShapePool_acquire(unittest.TestCase):
+    """Unittests for testing the acquire method."""
+
+    def setUp(self):
+        self.pool = ShapePool(Rectangle)
+
+    def test_new_when_empty(self):
+        r = self.pool.acquire(2, 3, 1, 4, 9)
+        self.assertEqual("[Rectangle] (9) 1/4 - 2/3", str(r))
+
+    def test_reuses_released(self):
+        r = self.pool.acquire(2, 3)
+        self.pool.release(r)
+        self.assertIs(r, self.pool.acquire(5, 6, 1, 2, 7))
+        self.assertEqual("[Rectangle] (7) 1/2 - 5/6", str(r))
+        self.assertEqual(0, len(self.pool))
+
+    def test_defaults_reset(self):
+        r = self.pool.acquire(2, 3, 4, 5, 6)
+        self.pool.release(r)
+        self.pool.acquire(1, 1)
+        self.assertEqual((0, 0), (r.x, r.y))
+
+    def test_keywords(self):
+        self.pool.release(self.pool.acquire(2, 3))
+        r = self.pool.acquire(height=4, width=2, y=1, id=12)
+        self.assertEqual("[Rectangle] (12) 0/1 - 2/4", str(r))
+
+    def test_fresh_id(self):
+        r = self.pool.acquire(2, 3)
+        old = r.id
+        self.pool.release(r)
+        self.pool.acquire(2, 3)
+        self.assertGreater(r.id, old)
+        self.assertGreater(Rectangle(1, 1).id, r.id)
+
+    def test_tracked_old_id(self):
+        class PoolTracked(Rectangle):
+            pass
+        tracker = PoolTracked.track_changes()
+        pool = ShapePool(PoolTracked)
+        r = pool.acquire(2, 3, id=5)
+        tracker.clear()
+        pool.release(r)
+        pool.acquire(4, 4)
+        self.assertEqual([r], tracker.changed())
+        self.assertEqual([5], tracker.stale_ids())
+
+    def test_width_not_int(self):
+        self.pool.release(self.pool.acquire(1, 1))
+        with self.assertRaisesRegex(TypeError, "width must be an integer"):
+            self.pool.acquire("2", 3)
+
+    def test_height_zero(self):
+        self.pool.release(self.pool.acquire(1, 1))
+        with self.assertRaisesRegex(ValueError, "height must be > 0"):
+            self.pool.acquire(2, 0)
+
+    def test_x_negative(self):
+        self.pool.release(self.pool.acquire(1, 1))
+        with self.assertRaisesRegex(ValueError, "x must be >= 0"):
+            self.pool.acquire(2, 3, -1)
+
+    def test_y_float(self):
+        self.pool.release(self.pool.acquire(1, 1))
+        with self.assertRaisesRegex(TypeError, "y must be an integer"):
+            self.pool.acquire(2, 3, 0, 1.5)
+
+    def test_missing_argument(self):
+        self.pool.release(self.pool.acquire(1, 1))
+        with self.assertRaises(TypeError):
+            self.pool.acquire(1)
+
+    def test_square(self):
+        pool = ShapePool(Square)
+        s = pool.acquire(4, 1, 2, 3)
+        pool.release(s)
+        self.assertIs(s, pool.acquire(5, id=3))
+        self.assertEqual("[Square] (3) 0/0 - 5", str(s))
+        pool.release(s)
+        with self.assertRaisesRegex(ValueError, "width must be > 0"):
+            pool.acquire(0)
+
+    def test_compact_square(self):
+        pool = ShapePool(CompactSquare)
+        s = pool.acquire(2)
+        pool.release(s)
+        self.assertIs(s, pool.acquire(3, 1, 1, 8))
+        self.assertEqual("[Square] (8) 1/1 - 3", str(s))
+
+    def test_borrowed(self):
+        with self.pool.borrowed(2, 2) as r:
+            self.assertEqual(4, r.area())
+            self.assertEqual(0, len(self.pool))
+        self.assertEqual(1, len(self.pool))
+
+
+class TestShapePool_release(unittest.TestCase):
+    """Unittests for testing the release method."""
+
+    def setUp(self):
+        self.pool = ShapePool(Rectangle, maxsize=2)
+
+    def test_release_many(self):
+        self.pool.release(Rectangle(1, 1), Rectangle(2, 2))
+        self.assertEqual(2, len(self.pool))
+
+    def test_maxsize(self):
+        self.pool.release(Rectangle(1, 1), Rectangle(2, 2), Rectangle(3, 3))
+        self.assertEqual(2, len(self.pool))
+
+    def test_maxsize_zero(self):
+        pool = ShapePool(Rectangle, maxsize=0)
+        pool.release(Rectangle(1, 1))
+        self.assertEqual(0, len(pool))
+
+    def test_wrong_class(self):
+        with self.assertRaisesRegex(TypeError, "Rectangle instances"):
+            self.pool.release(Square(1))
+
+    def test_twice(self):
+        r = Rectangle(1, 1)
+        self.pool.release(r)
+        with self.assertRaises(ValueError):
+            self.pool.release(r)
+
+    def test_clear(self):
+        self.pool.release(Rectangle(1, 1))
+        self.pool.clear()
+        self.assertEqual(0, len(self.pool))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""Defines unittests for models/query.py.
+
+Unittest classes:
+    TestQuery_load_batch - line 27
+    TestQuery_summarize - line 59
+    TestQuery_histogram - line 86
+"""
+import os
+import unittest
+from models.batch import RectangleBatch, SquareBatch
+from models.query import histogram, load_batch, summarize, summarize_file
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+def remove_files():
+    """Delete any created files."""
+    for filename in ("Rectangle.json", "Rectangle.csv",
+                     "Square.json", "Square.csv"):
+        try:
+            os.remove(filename)
+        except IOError:
+            pass
+
+
+class TestQuery_load_batch(unittest.TestCase):
+    """Unittests for testing the load_batch function."""
+
+    def tearDown(self):
+        remove_files()
+
+    def test_json_rectangles(self):
+        rects = [Rectangle(2, 3, 1, 0, 7), Rectangle(4, 5, 0, 2, 8)]
+        Rectangle.save_to_file(rects)
+        batch = load_batch(Rectangle)
+        self.assertEqual(RectangleBatch, type(batch))
+        self.assertEqual([str(r) for r in rects], [str(r) for r in batch])
+
+    def test_csv_squares(self):
+        squares = [Square(2, 1, 0, 7), Square(4, 0, 2, 8)]
+        Square.save_to_file_csv(squares)
+        batch = load_batch(Square, "csv")
+        self.assertEqual(SquareBatch, type(batch))
+        self.assertEqual([str(s) for s in squares], [str(s) for s in batch])
+
+    def test_no_file(self):
+        self.assertEqual(0, len(load_batch(Square, "csv")))
+
+    def test_empty_csv(self):
+        Square.save_to_file_csv([])
+        self.assertEqual(0, len(load_batch(Square, "csv")))
+
+    def test_bad_format(self):
+        with self.assertRaises(ValueError):
+            load_batch(Square, "xml")
+
+
+class TestQuery_summarize(unittest.TestCase):
+    """Unittests for testing the summarize functions."""
+
+    def tearDown(self):
+        remove_files()
+
+    def test_summarize(self):
+        batch = RectangleBatch([2, 4], [3, 5], [1, 0], [0, 2])
+        self.assertEqual({"count": 2, "total_area": 26, "min_area": 6,
+                          "max_area": 20, "bounds": (0, 0, 4, 7)},
+                         summarize(batch))
+
+    def test_summarize_empty(self):
+        self.assertEqual({"count": 0, "total_area": 0, "min_area": None,
+                          "max_area": None, "bounds": None},
+                         summarize(SquareBatch()))
+
+    def test_summarize_file_matches_objects(self):
+        squares = [Square(i % 7 + 1, i % 5, i % 3, i) for i in range(1, 50)]
+        Square.save_to_file(squares)
+        Square.save_to_file_csv(squares)
+        expected = sum(s.area() for s in squares)
+        self.assertEqual(expected, summarize_file(Square)["total_area"])
+        self.assertEqual(summarize_file(Square),
+                         summarize_file(Square, "csv"))
+
+
+class TestQuery_histogram(unittest.TestCase):
+    """Unittests for testing the histogram function."""
+
+    def test_histogram(self):
+        self.assertEqual([1, 2, 0, 2],
+                         histogram([0, 1, 5, 99, 100], [1, 10, 99]))
+
+    def test_histogram_of_areas(self):
+        batch = SquareBatch([1, 2, 3, 4])
+        self.assertEqual([1, 2, 1], histogram(batch.area(), [2, 10]))
+
+    def test_histogram_empty(self):
+        self.assertEqual([0, 0], histogram([], [5]))
+
+
+if __name__ == "__main__":
+    unittest.main()
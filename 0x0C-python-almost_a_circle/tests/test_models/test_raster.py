@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+"""Defines unittests for models/raster.py.
+
+Unittest classes:
+    TestRaster_instantiation - line 18
+    TestRaster_fill - line 38
+    TestRaster_files - line 73
+"""
+import os
+import struct
+import unittest
+import zlib
+from models.raster import Raster
+from models.rectangle import Rectangle
+from models.square import Square
+
+
+class TestRaster_instantiation(unittest.TestCase):
+    """Unittests for testing instantiation of the Raster class."""
+
+    def test_background(self):
+        r = Raster(2, 3, "#102030")
+        self.assertEqual(b"\x10\x20\x30" * 6, bytes(r.pixels))
+
+    def test_width_type(self):
+        with self.assertRaisesRegex(TypeError, "width must be an integer"):
+            Raster(2.0, 3)
+
+    def test_height_zero(self):
+        with self.assertRaisesRegex(ValueError, "height must be > 0"):
+            Raster(2, 0)
+
+    def test_bad_color(self):
+        with self.assertRaises(ValueError):
+            Raster(2, 2, "red")
+
+
+class TestRaster_fill(unittest.TestCase):
+    """Unittests for testing fill methods of the Raster class."""
+
+    def pixel(self, raster, x, y):
+        start = (y * raster.width + x) * 3
+        return bytes(raster.pixels[start:start + 3])
+
+    def test_fill_inside(self):
+        r = Raster(4, 4)
+        r.fill(Rectangle(2, 3, 1, 1), "#ffffff")
+        filled = [(x, y) for y in range(4) for x in range(4)
+                  if self.pixel(r, x, y) == b"\xff\xff\xff"]
+        self.assertEqual([(1, 1), (2, 1), (1, 2), (2, 2), (1, 3), (2, 3)],
+                         filled)
+
+    def test_fill_clipped(self):
+        r = Raster(3, 3)
+        r.fill(Square(5, 1, 1), "#ffffff")
+        self.assertEqual(b"\xff\xff\xff", self.pixel(r, 2, 2))
+        self.assertEqual(b"\x00\x00\x00", self.pixel(r, 0, 2))
+        self.assertEqual(27, len(r.pixels))
+
+    def test_fill_outside(self):
+        r = Raster(3, 3)
+        r.fill(Square(2, 10, 10), "#ffffff")
+        self.assertEqual(bytes(27), bytes(r.pixels))
+
+    def test_fill_all_order(self):
+        r = Raster(3, 1)
+        r.fill_all([Rectangle(3, 1), Rectangle(1, 1, 1)], "#0000ff")
+        r.fill(Rectangle(1, 1, 2), "#ff0000")
+        self.assertEqual(b"\x00\x00\xff" * 2 + b"\xff\x00\x00",
+                         bytes(r.pixels))
+
+
+class TestRaster_files(unittest.TestCase):
+    """Unittests for testing PPM and PNG output of the Raster class."""
+
+    def tearDown(self):
+        """Delete any created files."""
+        for filename in ("image.ppm", "image.png"):
+            try:
+                os.remove(filename)
+            except IOError:
+                pass
+
+    def test_ppm(self):
+        r = Raster(2, 1, "#010203")
+        self.assertEqual(b"P6\n2 1\n255\n\x01\x02\x03\x01\x02\x03",
+                         r.to_ppm())
+
+    def test_png_decodes(self):
+        r = Raster(2, 2, "#010203")
+        r.fill(Rectangle(1, 1, 1, 1), "#ffffff")
+        data = r.to_png()
+        self.assertEqual(b"\x89PNG\r\n\x1a\n", data[:8])
+        self.assertEqual((2, 2), struct.unpack(">II", data[16:24]))
+        start = data.index(b"IDAT") + 4
+        length = struct.unpack(">I", data[start - 8:start - 4])[0]
+        raw = zlib.decompress(data[start:start + length])
+        self.assertEqual(b"\x00" + b"\x01\x02\x03" * 2 +
+                         b"\x00\x01\x02\x03\xff\xff\xff", raw)
+
+    def test_save_by_extension(self):
+        r = Raster(1, 1)
+        r.save("image.ppm")
+        r.save("image.png")
+        with open("image.ppm", "rb") as f:
+            self.assertEqual(b"P6", f.read(2))
+        with open("image.png", "rb") as f:
+            self.assertEqual(b"\x89PNG", f.read(4))
+
+
+if __name__ == "__main__":
+    unittest.main()
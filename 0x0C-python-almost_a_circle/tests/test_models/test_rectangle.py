@@ -4,16 +4,18 @@
 """Defines unittests for models/rectangle.py.
 
 Unittest classes:
-    TestRectangle_instantiation - line 25
-    TestRectangle_width - line 114
-    TestRectangle_height - line 190
-    TestRectangle_x - line 262
-    TestRectangle_y - line 334
-    TestRectangle_order_of_initialization - line 402
-    TestRectangle_area - line 430
-    TestRectangle_update_args - line 538
-    TestRectangle_update_kwargs - line 676
-    TestRectangle_to_dictionary - line 788
+    TestRectangle_instantiation - line 27
+    TestRectangle_width - line 116
+    TestRectangle_height - line 192
+    TestRectangle_x - line 264
+    TestRectangle_y - line 336
+    TestRectangle_order_of_initialization - line 404
+    TestRectangle_area - line 432
+    TestRectangle_update_args - line 566
+    TestRectangle_update_kwargs - line 704
+    TestRectangle_to_dictionary - line 816
+    TestRectangle_set_fields - line 836
+    TestRectangle_bulk_update - line 871
 """
 import io
 import sys
@@ -534,6 +536,32 @@ class TestRectangle_stdout(unittest.TestCase):
         with self.assertRaises(TypeError):
             r.display(1)
 
+    def test_display_file(self):
+        r = Rectangle(2, 1, 1, 1, 0)
+        stream = io.StringIO()
+        r.display(file=stream)
+        self.assertEqual("\n ##\n", stream.getvalue())
+
+    def test_display_single_write(self):
+        writes = []
+
+        class Stream:
+            def write(self, text):
+                writes.append(text)
+
+        Rectangle(30, 40, 2, 3, 0).display(file=Stream())
+        self.assertEqual(1, len([w for w in writes if w]))
+
+    # Test render method
+    def test_render(self):
+        r = Rectangle(2, 4, 3, 2, 0)
+        self.assertEqual("\n\n   ##\n   ##\n   ##\n   ##\n", r.render())
+
+    def test_render_matches_display(self):
+        r = Rectangle(3, 2, 1, 0, 1)
+        capture = TestRectangle_stdout.capture_stdout(r, "display")
+        self.assertEqual(capture.getvalue(), r.render())
+
 
 class TestRectangle_update_args(unittest.TestCase):
     """Unittests for testing update args method of the Rectangle class."""
@@ -804,5 +832,86 @@ class TestRectangle_to_dictionary(unittest.TestCase):
         with self.assertRaises(TypeError):
             r.to_dictionary(1)
 
+
+class TestRectangle_set_fields(unittest.TestCase):
+    """Unittests for testing set_fields method of the Rectangle class."""
+
+    def test_set_fields(self):
+        r = Rectangle(10, 10, 10, 10, 10)
+        r.set_fields(width=2, y=3)
+        self.assertEqual("[Rectangle] (10) 10/3 - 2/10", str(r))
+
+    def test_set_fields_none(self):
+        r = Rectangle(10, 10, 10, 10, 10)
+        r.set_fields()
+        self.assertEqual("[Rectangle] (10) 10/10 - 10/10", str(r))
+
+    def test_set_fields_invalid_changes_nothing(self):
+        r = Rectangle(10, 10, 10, 10, 10)
+        with self.assertRaisesRegex(ValueError, "height must be > 0"):
+            r.set_fields(width=2, height=0)
+        self.assertEqual(10, r.width)
+
+    def test_set_fields_invalid_type(self):
+        r = Rectangle(10, 10, 10, 10, 10)
+        with self.assertRaisesRegex(TypeError, "x must be an integer"):
+            r.set_fields(x=1.5)
+
+    def test_set_fields_unknown(self):
+        r = Rectangle(10, 10, 10, 10, 10)
+        with self.assertRaises(TypeError):
+            r.set_fields(id=4)
+
+    def test_set_fields_args(self):
+        r = Rectangle(10, 10, 10, 10, 10)
+        with self.assertRaises(TypeError):
+            r.set_fields(4)
+
+
+class TestRectangle_bulk_update(unittest.TestCase):
+    """Unittests for testing bulk_update method of the Rectangle class."""
+
+    def test_bulk_update(self):
+        rects = [Rectangle(1, 2, 3, 4, 5), Rectangle(6, 7, 8, 9, 10)]
+        Rectangle.bulk_update(rects, width=3, y=0)
+        self.assertEqual(["[Rectangle] (5) 3/0 - 3/2",
+                          "[Rectangle] (10) 8/0 - 3/7"],
+                         [str(r) for r in rects])
+
+    def test_bulk_update_generator(self):
+        rects = [Rectangle(1, 2, 3, 4, 5), Rectangle(6, 7, 8, 9, 10)]
+        Rectangle.bulk_update((r for r in rects), x=1)
+        self.assertEqual([1, 1], [r.x for r in rects])
+
+    def test_bulk_update_id_None(self):
+        rects = [Rectangle(1, 2, 3, 4, 5), Rectangle(6, 7, 8, 9, 10)]
+        Rectangle.bulk_update(rects, id=None)
+        self.assertEqual(rects[0].id, rects[1].id - 1)
+        self.assertNotIn(5, [r.id for r in rects])
+
+    def test_bulk_update_id(self):
+        rects = [Rectangle(1, 2, 3, 4, 5), Rectangle(6, 7, 8, 9, 10)]
+        Rectangle.bulk_update(rects, id=89)
+        self.assertEqual([89, 89], [r.id for r in rects])
+
+    def test_bulk_update_invalid_changes_nothing(self):
+        rects = [Rectangle(1, 2, 3, 4, 5)]
+        with self.assertRaisesRegex(ValueError, "height must be > 0"):
+            Rectangle.bulk_update(rects, width=9, height=0)
+        self.assertEqual(1, rects[0].width)
+
+    def test_bulk_update_unknown_key(self):
+        rects = [Rectangle(1, 2, 3, 4, 5)]
+        Rectangle.bulk_update(rects, size=9)
+        self.assertEqual("[Rectangle] (5) 3/4 - 1/2", str(rects[0]))
+
+    def test_bulk_update_matches_update(self):
+        r1 = Rectangle(1, 2, 3, 4, 5)
+        r2 = Rectangle(1, 2, 3, 4, 5)
+        r1.update(height=6, x=0)
+        Rectangle.bulk_update([r2], height=6, x=0)
+        self.assertEqual(str(r1), str(r2))
+
+
 if __name__ == "__main__":
     unittest.main()
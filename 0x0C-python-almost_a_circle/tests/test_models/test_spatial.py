@@ -0,0 +1,153 @@
+#!/usr/bin/python3
+"""Defines unittests for models/spatial.py.
+
+Unittest classes:
+    TestGridIndex_instantiation - line 22
+    TestGridIndex_queries - line 47
+    TestGridIndex_updates - line 108
+"""
+import os
+import random
+import unittest
+from models.rectangle import Rectangle
+from models.spatial import GridIndex
+from models.square import Square
+
+
+def ids(shapes):
+    """Return the sorted ids of shapes."""
+    return sorted(s.id for s in shapes)
+
+
+class TestGridIndex_instantiation(unittest.TestCase):
+    """Unittests for testing instantiation of the GridIndex class."""
+
+    def test_empty(self):
+        self.assertEqual(0, len(GridIndex()))
+
+    def test_from_list(self):
+        index = GridIndex([Rectangle(2, 2), Square(3)])
+        self.assertEqual(2, len(index))
+
+    def test_cell_size_type(self):
+        with self.assertRaisesRegex(TypeError, "cell_size must be an integer"):
+            GridIndex(cell_size=1.5)
+
+    def test_cell_size_zero(self):
+        with self.assertRaisesRegex(ValueError, "cell_size must be > 0"):
+            GridIndex(cell_size=0)
+
+    def test_from_file(self):
+        Square.save_to_file([Square(5, 1, 3, 1), Square(9, 5, 2, 2)])
+        index = GridIndex.from_file(Square, cell_size=4)
+        os.remove("Square.json")
+        self.assertEqual([1, 2], ids(index.query_point(5, 3)))
+
+
+class TestGridIndex_queries(unittest.TestCase):
+    """Unittests for testing point and box queries of the GridIndex class."""
+
+    def setUp(self):
+        self.shapes = [Rectangle(4, 2, 0, 0, 1), Rectangle(3, 3, 2, 1, 2),
+                       Square(10, 20, 20, 3), Rectangle(100, 1, 0, 50, 4)]
+        self.index = GridIndex(self.shapes, cell_size=8)
+
+    def test_point_inside(self):
+        self.assertEqual([1, 2], ids(self.index.query_point(3, 1)))
+
+    def test_point_edges_half_open(self):
+        self.assertEqual([1], ids(self.index.query_point(0, 0)))
+        self.assertEqual([], ids(self.index.query_point(4, 0)))
+        self.assertEqual([3], ids(self.index.query_point(29, 29)))
+        self.assertEqual([], ids(self.index.query_point(30, 29)))
+
+    def test_point_outside(self):
+        self.assertEqual([], self.index.query_point(500, 500))
+
+    def test_box_overlap(self):
+        self.assertEqual([1, 2], ids(self.index.query_box(3, 1, 1, 1)))
+
+    def test_box_touching_is_not_overlap(self):
+        self.assertEqual([], ids(self.index.query_box(4, 0, 1, 1)))
+
+    def test_box_wide_shape(self):
+        self.assertEqual([4], ids(self.index.query_box(90, 45, 5, 10)))
+
+    def test_huge_shape_bounded_cells(self):
+        big = Rectangle(10 ** 12, 10 ** 12, 5, 5, 1)
+        index = GridIndex([big, Rectangle(2, 2, 0, 0, 2)])
+        self.assertLessEqual(len(index._cells[index._bounds[id(big)][1]]),
+                             4)
+        self.assertEqual([1], ids(index.query_point(10 ** 11, 7)))
+        self.assertEqual([1, 2], ids(index.query_box(0, 0, 6, 6)))
+        self.assertEqual([2], ids(index.query_box(0, 0, 5, 5)))
+
+    def test_box_covering_everything(self):
+        self.assertEqual([1, 2, 3, 4],
+                         ids(self.index.query_box(0, 0, 10 ** 9, 10 ** 9)))
+
+    def test_box_empty(self):
+        self.assertEqual([], self.index.query_box(0, 0, 0, 10))
+
+    def test_matches_scan(self):
+        rng = random.Random(12)
+        shapes = [Rectangle(rng.randint(1, 30), rng.randint(1, 30),
+                            rng.randint(0, 200), rng.randint(0, 200), i)
+                  for i in range(300)]
+        index = GridIndex(shapes, cell_size=16)
+        for _ in range(50):
+            x, y = rng.randint(0, 230), rng.randint(0, 230)
+            w, h = rng.randint(1, 40), rng.randint(1, 40)
+            expected = [s.id for s in shapes
+                        if s.x < x + w and x < s.x + s.width and
+                        s.y < y + h and y < s.y + s.height]
+            self.assertEqual(sorted(expected),
+                             ids(index.query_box(x, y, w, h)))
+
+
+class TestGridIndex_updates(unittest.TestCase):
+    """Unittests for testing insert, remove and move of GridIndex."""
+
+    def test_insert(self):
+        index = GridIndex(cell_size=4)
+        r = Rectangle(2, 2, 5, 5, 1)
+        index.insert(r)
+        self.assertIn(r, index)
+        self.assertEqual([r], index.query_point(6, 6))
+
+    def test_insert_twice(self):
+        r = Rectangle(2, 2)
+        index = GridIndex([r])
+        with self.assertRaises(ValueError):
+            index.insert(r)
+
+    def test_remove(self):
+        r = Rectangle(20, 20, 0, 0, 1)
+        index = GridIndex([r], cell_size=4)
+        index.remove(r)
+        self.assertNotIn(r, index)
+        self.assertEqual([], index.query_point(1, 1))
+        self.assertEqual({}, index._cells)
+
+    def test_remove_large(self):
+        r = Rectangle(1000, 3, 0, 0, 1)
+        index = GridIndex([r, Rectangle(1, 1)], cell_size=4)
+        index.remove(r)
+        self.assertEqual([], index.query_point(999, 1))
+        self.assertEqual([0], list(index._cells))
+
+    def test_remove_missing(self):
+        with self.assertRaises(KeyError):
+            GridIndex().remove(Rectangle(1, 1))
+
+    def test_move_after_update(self):
+        r = Rectangle(2, 2, 0, 0, 1)
+        index = GridIndex([r], cell_size=4)
+        r.update(x=100, y=100)
+        index.move(r)
+        self.assertEqual([], index.query_point(1, 1))
+        self.assertEqual([r], index.query_point(101, 101))
+
+
+if __name__ == "__main__":
+    unittest.main()
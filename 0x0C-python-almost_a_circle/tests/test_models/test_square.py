@@ -4,16 +4,18 @@
 """Defines unittests for models/square.py.
 
 Unittest classes:
-    TestSquare_instantiation - line 24
-    TestSquare_size - line 88
-    TestSquare_x - line 166
-    TestSquare_y - line 238
-    TestSquare_order_of_initialization - line 306
-    TestSquare_area - line 322
-    TestSquare_stdout - line 343
-    TestSquare_update_args - line 426
-    TestSquare_update_kwargs - line 538
-    TestSquare_to_dictionary - 640
+    TestSquare_instantiation - line 27
+    TestSquare_size - line 91
+    TestSquare_x - line 168
+    TestSquare_y - line 240
+    TestSquare_order_of_initialization - line 308
+    TestSquare_area - line 324
+    TestSquare_stdout - line 345
+    TestSquare_update_args - line 428
+    TestSquare_update_kwargs - line 540
+    TestSquare_to_dictionary - 642
+    TestSquare_set_fields - line 662
+    TestSquare_bulk_update - line 680
 """
 import io
 import sys
@@ -656,5 +658,44 @@ class TestSquare_to_dictionary(unittest.TestCase):
         with self.assertRaises(TypeError):
             s.to_dictionary(1)
 
+
+class TestSquare_set_fields(unittest.TestCase):
+    """Unittests for testing set_fields method of the Square class."""
+
+    def test_set_fields_size(self):
+        s = Square(10, 10, 10, 10)
+        s.set_fields(size=3, x=1)
+        self.assertEqual("[Square] (10) 1/10 - 3", str(s))
+        self.assertEqual(3, s.height)
+
+    def test_set_fields_invalid_size(self):
+        s = Square(10, 10, 10, 10)
+        with self.assertRaisesRegex(TypeError, "width must be an integer"):
+            s.set_fields(size="3")
+        with self.assertRaisesRegex(ValueError, "width must be > 0"):
+            s.set_fields(x=1, size=-3)
+        self.assertEqual(10, s.x)
+
+
+class TestSquare_bulk_update(unittest.TestCase):
+    """Unittests for testing bulk_update method of the Square class."""
+
+    def test_bulk_update_size(self):
+        squares = [Square(1, 2, 3, 4), Square(5, 6, 7, 8)]
+        Square.bulk_update(squares, size=3)
+        self.assertEqual(["[Square] (4) 2/3 - 3", "[Square] (8) 6/7 - 3"],
+                         [str(s) for s in squares])
+        self.assertEqual([3, 3], [s.height for s in squares])
+
+    def test_bulk_update_width_ignored(self):
+        squares = [Square(1, 2, 3, 4)]
+        Square.bulk_update(squares, width=3)
+        self.assertEqual(1, squares[0].width)
+
+    def test_bulk_update_invalid_size(self):
+        with self.assertRaisesRegex(TypeError, "width must be an integer"):
+            Square.bulk_update([Square(1)], size="3")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+"""Defines unittests for models/store.py.
+
+Unittest classes:
+    TestStore_save_shapes - line 25
+    TestStore_load_shapes - line 62
+"""
+import os
+import unittest
+from models.compact import CompactSquare
+from models.rectangle import Rectangle
+from models.square import Square
+from models.store import load_shapes, save_shapes
+
+
+def remove_files():
+    """Delete any created files."""
+    for filename in ("shapes.json", "shapes.csv"):
+        try:
+            os.remove(filename)
+        except IOError:
+            pass
+
+
+class TestStore_save_shapes(unittest.TestCase):
+    """Unittests for testing the save_shapes function."""
+
+    def tearDown(self):
+        remove_files()
+
+    def test_json(self):
+        save_shapes("shapes.json", [Rectangle(2, 3, 1, 0, 1),
+                                    Square(4, 0, 0, 2)])
+        with open("shapes.json", "r") as f:
+            self.assertEqual(
+                '[{"type": "Rectangle", "id": 1, "width": 2, "height": 3, '
+                '"x": 1, "y": 0}, '
+                '{"type": "Square", "id": 2, "size": 4, "x": 0, "y": 0}]',
+                f.read())
+
+    def test_csv(self):
+        save_shapes("shapes.csv", [Square(4, 0, 0, 2),
+                                   Rectangle(2, 3, 1, 0, 1)])
+        with open("shapes.csv", "r") as f:
+            self.assertEqual("Square,2,4,0,0\nRectangle,1,2,3,1,0\n",
+                             f.read())
+
+    def test_generator(self):
+        save_shapes("shapes.json", (Square(i + 1) for i in range(3)))
+        self.assertEqual(3, len(load_shapes("shapes.json")))
+
+    def test_none(self):
+        save_shapes("shapes.json", None)
+        with open("shapes.json", "r") as f:
+            self.assertEqual("[]", f.read())
+
+    def test_bad_extension(self):
+        with self.assertRaises(ValueError):
+            save_shapes("shapes.txt", [])
+
+
+class TestStore_load_shapes(unittest.TestCase):
+    """Unittests for testing the load_shapes function."""
+
+    def setUp(self):
+        self.shapes = [Rectangle(2, 3, 1, 0, 1), Square(4, 0, 0, 2),
+                       CompactSquare(3, 1, 1, 3), Rectangle(5, 5, 0, 0, 4)]
+
+    def tearDown(self):
+        remove_files()
+
+    def check_round_trip(self, filename):
+        save_shapes(filename, self.shapes)
+        output = load_shapes(filename)
+        self.assertEqual([type(s) for s in self.shapes],
+                         [type(s) for s in output])
+        self.assertEqual([str(s) for s in self.shapes],
+                         [str(s) for s in output])
+
+    def test_json_round_trip(self):
+        self.check_round_trip("shapes.json")
+
+    def test_csv_round_trip(self):
+        self.check_round_trip("shapes.csv")
+
+    def test_no_file(self):
+        self.assertEqual([], load_shapes("shapes.json"))
+
+    def test_empty(self):
+        for filename in ("shapes.json", "shapes.csv"):
+            save_shapes(filename, [])
+            self.assertEqual([], load_shapes(filename))
+
+    def test_new_subclass(self):
+        class Tile(Square):
+            pass
+        save_shapes("shapes.csv", [Tile(2, 0, 0, 9), Rectangle(1, 1)])
+        output = load_shapes("shapes.csv")
+        self.assertIs(Tile, type(output[0]))
+        self.assertEqual(9, output[0].id)
+
+    def test_unknown_type(self):
+        with open("shapes.csv", "w") as f:
+            f.write("NoSuchShape,1,2\n")
+        with self.assertRaises(ValueError):
+            load_shapes("shapes.csv")
+
+    def test_wrong_field_count(self):
+        with open("shapes.csv", "w") as f:
+            f.write("Square,1,2\n")
+        with self.assertRaises(ValueError):
+            load_shapes("shapes.csv")
+
+if __name__ == "__main__":
+    unittest.main()
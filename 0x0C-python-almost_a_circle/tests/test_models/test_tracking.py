@@ -0,0 +1,245 @@
+#!/usr/bin/python3
+"""Defines unittests for models/tracking.py.
+
+Unittest classes:
+    TestChangeTracker - line 32
+    TestTrackChanges - line 99
+    TestChangeTracker_checkpoint - line 184
+"""
+import os
+import unittest
+from models.compact import CompactRectangle
+from models.journal import Journal
+from models.rectangle import Rectangle
+from models.square import Square
+from models.tracking import ChangeTracker
+
+
+class TrackedRectangle(Rectangle):
+    """A Rectangle subclass whose changes the tests track."""
+
+
+class TrackedSquare(Square):
+    """A Square subclass whose changes the tests track."""
+
+
+class TrackedCompact(CompactRectangle):
+    """A CompactRectangle subclass whose changes the tests track."""
+
+    __slots__ = ()
+
+
+class TestChangeTracker(unittest.TestCase):
+    """Unittests for testing the ChangeTracker class."""
+
+    def test_empty(self):
+        tracker = ChangeTracker()
+        self.assertEqual(0, len(tracker))
+        self.assertEqual([], tracker.changed())
+        self.assertEqual([], tracker.stale_ids())
+
+    def test_mark_once(self):
+        tracker = ChangeTracker()
+        r = Rectangle(1, 1)
+        tracker.mark(r)
+        tracker.mark(r)
+        self.assertEqual([r], tracker.changed())
+        self.assertIn(r, tracker)
+
+    def test_mark_id_keeps_first_id(self):
+        tracker = ChangeTracker()
+        r = Rectangle(1, 1, 0, 0, 5)
+        tracker.mark_id(r)
+        r.id = 6
+        tracker.mark_id(r)
+        r.id = 7
+        self.assertEqual([5], tracker.stale_ids())
+
+    def test_mark_id_back_to_old_id(self):
+        tracker = ChangeTracker()
+        r = Rectangle(1, 1, 0, 0, 5)
+        tracker.mark_id(r)
+        self.assertEqual([], tracker.stale_ids())
+
+    def test_clear(self):
+        tracker = ChangeTracker()
+        r = Rectangle(1, 1, 0, 0, 5)
+        tracker.mark_id(r)
+        tracker.clear()
+        self.assertEqual(0, len(tracker))
+        self.assertEqual([], tracker.stale_ids())
+
+    def test_watch(self):
+        tracker = ChangeTracker()
+        seen = []
+        tracker.watch(seen.append)
+        r = Rectangle(1, 1)
+        tracker.mark_id(r)
+        tracker.mark(r)
+        self.assertEqual([r], seen)
+        tracker.unwatch(seen.append)
+        tracker.mark(r)
+        self.assertEqual([r], seen)
+
+    def test_unwatch_missing(self):
+        with self.assertRaises(ValueError):
+            ChangeTracker().unwatch(print)
+
+    def test_no_record(self):
+        tracker = ChangeTracker(record=False)
+        seen = []
+        tracker.watch(seen.append)
+        r = Rectangle(1, 1)
+        tracker.mark_id(r)
+        tracker.mark(r)
+        self.assertEqual(0, len(tracker))
+        self.assertEqual([r], seen)
+
+
+class TestTrackChanges(unittest.TestCase):
+    """Unittests for testing the track_changes method."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tracker = TrackedRectangle.track_changes()
+        cls.square_tracker = TrackedSquare.track_changes()
+        cls.compact_tracker = TrackedCompact.track_changes()
+
+    def setUp(self):
+        self.r = TrackedRectangle(2, 3, 0, 0, 1)
+        self.s = TrackedSquare(2, 0, 0, 2)
+        self.c = TrackedCompact(2, 3, 0, 0, 3)
+        for tracker in (self.tracker, self.square_tracker,
+                        self.compact_tracker):
+            tracker.clear()
+
+    def test_same_tracker(self):
+        self.assertIs(self.tracker, TrackedRectangle.track_changes())
+
+    def test_untracked_by_default(self):
+        self.assertIsNone(Rectangle._tracker)
+        self.assertIsNone(Square._tracker)
+
+    def test_creation_marks(self):
+        r = TrackedRectangle(1, 1)
+        self.assertIn(r, self.tracker)
+
+    def test_setter_marks(self):
+        self.r.width = 5
+        self.assertEqual([self.r], self.tracker.changed())
+
+    def test_invalid_value_does_not_mark(self):
+        with self.assertRaises(ValueError):
+            self.r.x = -1
+        self.assertEqual(0, len(self.tracker))
+
+    def test_update_marks(self):
+        self.r.update(y=4)
+        self.assertIn(self.r, self.tracker)
+
+    def test_update_id_records_stale_id(self):
+        self.r.update(10)
+        self.assertIn(self.r, self.tracker)
+        self.assertEqual([1], self.tracker.stale_ids())
+
+    def test_set_fields_marks(self):
+        self.r.set_fields(width=4, height=4)
+        self.assertIn(self.r, self.tracker)
+
+    def test_bulk_update_marks(self):
+        other = TrackedRectangle(1, 1)
+        self.tracker.clear()
+        TrackedRectangle.bulk_update([self.r, other], x=3)
+        self.assertEqual(2, len(self.tracker))
+
+    def test_bulk_update_id_marks(self):
+        TrackedRectangle.bulk_update([self.r], id=None)
+        self.assertEqual([1], self.tracker.stale_ids())
+
+    def test_square_size_marks(self):
+        self.s.size = 7
+        self.s.update(x=1)
+        self.assertEqual([self.s], self.square_tracker.changed())
+        self.assertEqual(0, len(self.tracker))
+
+    def test_subclass_not_tracked(self):
+        class Child(TrackedRectangle):
+            pass
+        child = Child(1, 1)
+        child.width = 3
+        self.assertIsNone(Child._tracker)
+        self.assertNotIn(child, self.tracker)
+
+    def test_compact(self):
+        self.c.height = 9
+        self.assertEqual([self.c], self.compact_tracker.changed())
+
+    def test_values_still_validated(self):
+        with self.assertRaisesRegex(TypeError, "width must be an integer"):
+            self.r.width = "2"
+        with self.assertRaisesRegex(ValueError, "width must be > 0"):
+            self.s.size = 0
+
+
+class TestChangeTracker_checkpoint(unittest.TestCase):
+    """Unittests for testing saving changes to a Journal."""
+
+    def setUp(self):
+        self.tracker = TrackedRectangle.track_changes()
+        self.shapes = [TrackedRectangle(i + 1, 1, 0, 0, i) for i in range(5)]
+        TrackedRectangle.save_to_file(self.shapes)
+        self.tracker.clear()
+        self.journal = Journal(TrackedRectangle, compact_every=0)
+
+    def tearDown(self):
+        self.journal.close()
+        for ext in (".json", ".journal"):
+            try:
+                os.remove("TrackedRectangle" + ext)
+            except IOError:
+                pass
+
+    def journal_lines(self):
+        with open("TrackedRectangle.journal", "r") as f:
+            return f.read().splitlines()
+
+    def test_writes_only_changes(self):
+        self.shapes[3].update(width=9)
+        self.assertEqual(1, self.tracker.checkpoint(self.journal))
+        self.assertEqual(
+            ['{"put": {"id": 3, "width": 9, "height": 1, "x": 0, "y": 0}}'],
+            self.journal_lines())
+        self.assertEqual(0, len(self.tracker))
+
+    def test_nothing_changed(self):
+        self.assertEqual(0, self.tracker.checkpoint(self.journal))
+        self.assertEqual([], self.journal_lines())
+
+    def test_id_change(self):
+        self.shapes[0].update(20)
+        self.tracker.checkpoint(self.journal)
+        ids = sorted(r.id for r in self.journal.load())
+        self.assertEqual([1, 2, 3, 4, 20], ids)
+
+    def test_swapped_ids(self):
+        self.shapes[0].update(1)
+        self.shapes[1].update(0)
+        self.tracker.checkpoint(self.journal)
+        loaded = {r.id: r.width for r in self.journal.load()}
+        self.assertEqual({0: 2, 1: 1, 2: 3, 3: 4, 4: 5}, loaded)
+
+    def test_new_shape(self):
+        TrackedRectangle(7, 7, 0, 0, 99)
+        self.tracker.checkpoint(self.journal)
+        self.assertEqual(6, len(self.journal.load()))
+
+    def test_load_matches_shapes(self):
+        self.shapes[2].set_fields(x=4, y=5)
+        self.shapes[4].height = 8
+        self.tracker.checkpoint(self.journal)
+        self.assertEqual([str(r) for r in self.shapes],
+                         [str(r) for r in self.journal.load()])
+
+
+if __name__ == "__main__":
+    unittest.main()